@@ -111,7 +111,7 @@ def run_poc(
             write_log.append({"tau": round(clock.tau, 4), "strength": round(mem_strength, 6)})
 
         if (idx + 1) % sweep_every == 0:
-            decay.entropy_sweep(current_tau=clock.tau)
+            decay.entropy_sweep(current_tau=clock.tau, mode="count")
 
         packet = ChronometricVector(
             wall_clock_time=(idx + 1) * wall_delta,
@@ -135,9 +135,7 @@ def run_poc(
         packet["COMPUTE_ALLOWED"] = bool(compute_allowed)
         packets.append(packet)
 
-    alive, forgotten = decay.entropy_sweep(current_tau=clock.tau)
-    total_swept_survivors = len(alive)
-    total_swept_forgotten = len(forgotten)
+    total_swept_survivors, total_swept_forgotten = decay.entropy_sweep(current_tau=clock.tau, mode="count")
 
     if packets:
         tau_final = packets[-1]["TAU"]
@@ -94,7 +94,7 @@ def run_calibration(config_path: str = "tg.yaml"):
         wall_delta=config.policies.calibration_post_sweep_wall_delta,
         current_time=wall_time,
     )
-    survivors, pruned = decay.entropy_sweep(clock.tau)
+    survivor_count, pruned_count = decay.entropy_sweep(clock.tau, mode="count")
 
     summary = {
         "SALIENCE_MEAN": round(statistics.mean(psi_values), 4),
@@ -102,8 +102,8 @@ def run_calibration(config_path: str = "tg.yaml"):
         "CLOCK_RATE_MIN": round(min(clock_rates), 4),
         "CLOCK_RATE_MAX": round(max(clock_rates), 4),
         "MEMORY_COUNT": len(decay.vault),
-        "MEMORY_SURVIVORS": len(survivors),
-        "MEMORY_PRUNED": len(pruned),
+        "MEMORY_SURVIVORS": survivor_count,
+        "MEMORY_PRUNED": pruned_count,
         "TAU": round(clock.tau, 4),
     }
 
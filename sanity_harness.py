@@ -93,7 +93,7 @@ def run_harness(
         psi_values.append(sal.psi)
         clock_rates.append(dilation)
 
-    survivors, _ = decay.entropy_sweep(clock.tau)
+    survivor_count, _ = decay.entropy_sweep(clock.tau, mode="count")
     summary = {
         "psi_min": min(psi_values) if psi_values else 0.0,
         "psi_max": max(psi_values) if psi_values else 0.0,
@@ -103,7 +103,7 @@ def run_harness(
         "clock_rate_mean": sum(clock_rates) / len(clock_rates) if clock_rates else 0.0,
         "tau_final": clock.tau,
         "memories_written": float(memories_written),
-        "memories_alive_after_tau": float(len(survivors)),
+        "memories_alive_after_tau": float(survivor_count),
     }
     return summary, packets
 
@@ -1,12 +1,53 @@
-from .decay import DecayEngine, EntropicMemory, S_MAX, initial_strength_from_psi, should_encode
+from .columnar import ColumnarSnapshotReader, publish_columnar_snapshot
+from .content import ContentHandle, ContentPool
+from .decay import DecayEngine, EntropicMemory, S_MAX, decay_lambda_from_value, initial_strength_from_psi, should_encode
+from .index import SortedKeyIndex
+from .journal import MemoryJournal, journal_state_at
+from .minhash import LSHIndex, MinHasher
+from .refresh import RefreshScheduler
+from .serialization import memory_from_dict, memory_to_dict
+from .snapshots import SnapshotEntry, StoreSnapshot
+from .sketches import BloomFilter, CountMinSketch, content_fingerprint
 from .store import DecayMemoryStore, MemoryStore
+from .striped import StripedMemoryStore
+from .sweeper import BackgroundSweeper, SweepEvent
+from .tiered import ColdMemoryRef, TieredMemoryStore
+from .transfer import export_memories, iter_memories
+from .views import MemoryColumns, StoreView
 
 __all__ = [
     "DecayEngine",
     "EntropicMemory",
     "S_MAX",
     "initial_strength_from_psi",
+    "decay_lambda_from_value",
     "should_encode",
     "MemoryStore",
     "DecayMemoryStore",
+    "SortedKeyIndex",
+    "BackgroundSweeper",
+    "SweepEvent",
+    "TieredMemoryStore",
+    "ColdMemoryRef",
+    "StoreView",
+    "MemoryColumns",
+    "MinHasher",
+    "LSHIndex",
+    "BloomFilter",
+    "CountMinSketch",
+    "content_fingerprint",
+    "StripedMemoryStore",
+    "RefreshScheduler",
+    "ContentPool",
+    "ContentHandle",
+    "MemoryJournal",
+    "journal_state_at",
+    "memory_to_dict",
+    "memory_from_dict",
+    "export_memories",
+    "iter_memories",
+    "ColumnarSnapshotReader",
+    "publish_columnar_snapshot",
+    "StoreSnapshot",
+    "SnapshotEntry",
 ]
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from array import array
+import heapq
+import math
+import mmap
+import os
+from pathlib import Path
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from .views import MemoryColumns
+
+COLUMNAR_MAGIC = b"TGCOL\x01\x00\x00"
+# magic, byte order flag, record count, decay rate, prune threshold, published tau
+_HEADER = struct.Struct("<8sQQddd")
+_LITTLE_ENDIAN = 1 if sys.byteorder == "little" else 0
+_NAN = float("nan")
+
+
+def _optional(value: Optional[float]) -> float:
+    return _NAN if value is None else float(value)
+
+
+def publish_columnar_snapshot(
+    columns: MemoryColumns,
+    path: str | Path,
+    *,
+    decay_rate: Optional[float] = None,
+    prune_threshold: float = 0.0,
+    published_tau: Optional[float] = None,
+) -> Path:
+    """Atomically write ``columns`` as an immutable columnar snapshot file.
+
+    The file is written next to ``path`` and moved into place with
+    ``os.replace``, so readers never observe a partial snapshot and readers
+    of the previous file keep their mapping. Records without a per-record
+    rate in ``columns`` are published with ``decay_rate`` (no decay when
+    ``None``).
+    """
+    path = Path(path)
+    count = len(columns)
+    rates = columns.decay_lambda
+    if rates is None:
+        rates = array("d", [0.0 if decay_rate is None else decay_rate]) * count
+    by_accessed = array("Q", sorted(range(count), key=lambda row: (columns.last_accessed_tau[row], columns.ids[row])))
+    by_created = array("Q", sorted(range(count), key=lambda row: (columns.created_at_tau[row], columns.ids[row])))
+    encoded_ids = [record_id.encode("utf-8") for record_id in columns.ids]
+    id_offsets = array("Q", [0])
+    for encoded in encoded_ids:
+        id_offsets.append(id_offsets[-1] + len(encoded))
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(
+            _HEADER.pack(
+                COLUMNAR_MAGIC,
+                _LITTLE_ENDIAN,
+                count,
+                _optional(decay_rate),
+                float(prune_threshold),
+                _optional(published_tau),
+            )
+        )
+        for column in (columns.strength, columns.last_accessed_tau, columns.created_at_tau, rates):
+            handle.write(column.tobytes())
+        for column in (by_accessed, by_created, id_offsets):
+            handle.write(column.tobytes())
+        handle.write(b"".join(encoded_ids))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    return path
+
+
+class ColumnarSnapshotReader:
+    """Zero-copy reader over a file written by :func:`publish_columnar_snapshot`.
+
+    The file is memory-mapped read-only and each column is a ``memoryview``
+    into the mapping, so opening a snapshot is O(1) regardless of size and
+    any number of processes share the same pages. A reader keeps seeing the
+    snapshot it opened even after the writer publishes a newer one; check
+    :attr:`stale` and open a new reader to move forward.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._inode = os.fstat(handle.fileno()).st_ino
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byte_order, count, decay_rate, prune_threshold, published_tau = _HEADER.unpack_from(self._map, 0)
+        if magic != COLUMNAR_MAGIC:
+            self._map.close()
+            raise ValueError("not a columnar memory snapshot")
+        if byte_order != _LITTLE_ENDIAN:
+            self._map.close()
+            raise ValueError("columnar snapshot byte order does not match this platform")
+        self.decay_rate = None if math.isnan(decay_rate) else decay_rate
+        self.prune_threshold = prune_threshold
+        self.published_tau = None if math.isnan(published_tau) else published_tau
+        self._count = count
+
+        view = memoryview(self._map)
+        self._views: List[memoryview] = [view]
+        offset = _HEADER.size
+
+        def _column(fmt: str, length: int) -> memoryview:
+            nonlocal offset
+            column = view[offset : offset + 8 * length].cast(fmt)
+            self._views.append(column)
+            offset += 8 * length
+            return column
+
+        self.strength = _column("d", count)
+        self.last_accessed_tau = _column("d", count)
+        self.created_at_tau = _column("d", count)
+        self.decay_lambda = _column("d", count)
+        self._by_accessed = _column("Q", count)
+        self._by_created = _column("Q", count)
+        self._id_offsets = _column("Q", count + 1)
+        self._id_bytes = view[offset:]
+        self._views.append(self._id_bytes)
+        self._row_by_id: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "ColumnarSnapshotReader":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._map.close()
+
+    @property
+    def stale(self) -> bool:
+        """Whether a newer snapshot has been published at :attr:`path`."""
+        try:
+            return os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            return True
+
+    def id_at(self, row: int) -> str:
+        return bytes(self._id_bytes[self._id_offsets[row] : self._id_offsets[row + 1]]).decode("utf-8")
+
+    def _row(self, record_id: str) -> Optional[int]:
+        if self._row_by_id is None:
+            self._row_by_id = {self.id_at(row): row for row in range(self._count)}
+        return self._row_by_id.get(record_id)
+
+    def _strength_at_row(self, row: int, current_tau: float) -> float:
+        elapsed = current_tau - self.last_accessed_tau[row]
+        if elapsed < 0.0:
+            elapsed = 0.0
+        return max(0.0, self.strength[row] * math.exp(-self.decay_lambda[row] * elapsed))
+
+    def strength_of(self, record_id: str, current_tau: float) -> Optional[float]:
+        """Decayed strength of ``record_id`` at ``current_tau`` (``None`` if absent)."""
+        row = self._row(record_id)
+        return None if row is None else self._strength_at_row(row, current_tau)
+
+    def strengths(self, current_tau: float) -> array:
+        """Decayed strength of every record at ``current_tau``, in row order."""
+        return array("d", (self._strength_at_row(row, current_tau) for row in range(self._count)))
+
+    def top_k(self, k: int, current_tau: float) -> List[Tuple[str, float]]:
+        """The ``k`` strongest ``(id, strength)`` pairs at ``current_tau``."""
+        rows = heapq.nlargest(k, range(self._count), key=lambda row: self._strength_at_row(row, current_tau))
+        return [(self.id_at(row), self._strength_at_row(row, current_tau)) for row in rows]
+
+    def _between(self, order: memoryview, column: memoryview, lo: Optional[float], hi: Optional[float]) -> List[str]:
+        start = 0 if lo is None else self._bisect(order, column, lo, inclusive=False)
+        stop = self._count if hi is None else self._bisect(order, column, hi, inclusive=True)
+        return [self.id_at(order[position]) for position in range(start, stop)]
+
+    def _bisect(self, order: memoryview, column: memoryview, key: float, *, inclusive: bool) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = column[order[mid]]
+            if value < key or (inclusive and value == key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def accessed_between(self, lo: Optional[float] = None, hi: Optional[float] = None) -> List[str]:
+        """Ids with ``lo <= last_accessed_tau <= hi``, least recent first, in O(log n + k)."""
+        return self._between(self._by_accessed, self.last_accessed_tau, lo, hi)
+
+    def created_between(self, lo: Optional[float] = None, hi: Optional[float] = None) -> List[str]:
+        """Ids with ``lo <= created_at_tau <= hi``, oldest first, in O(log n + k)."""
+        return self._between(self._by_created, self.created_at_tau, lo, hi)
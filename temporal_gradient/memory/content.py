@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import mmap
+from pathlib import Path
+from typing import Dict, Literal, Optional, Union
+
+from .sketches import content_fingerprint
+
+Payload = Union[str, bytes]
+
+
+@dataclass(frozen=True)
+class ContentHandle:
+    """Small, content-addressed reference to a payload held by a :class:`ContentPool`."""
+
+    digest: bytes
+    length: int
+    kind: Literal["str", "bytes"]
+
+
+class ContentPool:
+    """Reference-counted, content-addressed payload interning.
+
+    Identical payloads share one stored copy and one :class:`ContentHandle`.
+    In the default mode payloads stay in RAM and duplicates resolve to the
+    same object. With ``path`` set, payloads are appended to a blob file and
+    read back through a read-only memory map, so only handles and offsets
+    live on the Python heap. The blob file is scratch space: it is truncated
+    when the pool opens and space from released payloads is not reclaimed
+    (see ``garbage_bytes``).
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = None if path is None else Path(path)
+        self.garbage_bytes = 0
+        self._refcounts: Dict[ContentHandle, int] = {}
+        self._payloads: Dict[ContentHandle, Payload] = {}
+        self._offsets: Dict[ContentHandle, int] = {}
+        self._blob = None
+        self._blob_size = 0
+        self._map: Optional[mmap.mmap] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._blob = self.path.open("w+b")
+
+    def __len__(self) -> int:
+        return len(self._refcounts)
+
+    def __contains__(self, handle: ContentHandle) -> bool:
+        return handle in self._refcounts
+
+    def __enter__(self) -> "ContentPool":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    @property
+    def payload_bytes(self) -> int:
+        """Encoded size of the distinct live payloads."""
+        return sum(handle.length for handle in self._refcounts)
+
+    def refcount(self, handle: ContentHandle) -> int:
+        return self._refcounts.get(handle, 0)
+
+    def intern(self, content: Payload) -> ContentHandle:
+        """Store ``content`` once and return its handle, adding one reference."""
+        if isinstance(content, str):
+            kind: Literal["str", "bytes"] = "str"
+            encoded = content.encode("utf-8")
+        elif isinstance(content, bytes):
+            kind = "bytes"
+            encoded = content
+        else:
+            raise ValueError("content must be str or bytes")
+        handle = ContentHandle(digest=content_fingerprint(encoded), length=len(encoded), kind=kind)
+        count = self._refcounts.get(handle, 0)
+        if count == 0:
+            if self.path is None:
+                self._payloads[handle] = content
+            else:
+                self._offsets[handle] = self._append(encoded)
+        self._refcounts[handle] = count + 1
+        return handle
+
+    def _require_open(self) -> None:
+        if self._blob is None:
+            raise ValueError("content pool is closed")
+
+    def _append(self, encoded: bytes) -> int:
+        self._require_open()
+        offset = self._blob_size
+        self._blob.seek(offset)
+        self._blob.write(encoded)
+        self._blob_size += len(encoded)
+        return offset
+
+    def _mapped(self, end: int) -> mmap.mmap:
+        self._require_open()
+        if self._map is None or len(self._map) < end:
+            self._blob.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._blob.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def resolve(self, handle: ContentHandle) -> Payload:
+        """Return the payload for a live ``handle``."""
+        if handle not in self._refcounts:
+            raise ValueError("content handle is not live in this pool")
+        if self.path is None:
+            return self._payloads[handle]
+        if handle.length == 0:
+            encoded = b""
+        else:
+            offset = self._offsets[handle]
+            encoded = self._mapped(offset + handle.length)[offset : offset + handle.length]
+        return encoded.decode("utf-8") if handle.kind == "str" else encoded
+
+    def release(self, handle: ContentHandle) -> bool:
+        """Drop one reference; return whether the payload itself was dropped."""
+        count = self._refcounts.get(handle)
+        if count is None:
+            raise ValueError("content handle is not live in this pool")
+        if count > 1:
+            self._refcounts[handle] = count - 1
+            return False
+        del self._refcounts[handle]
+        self._payloads.pop(handle, None)
+        if self._offsets.pop(handle, None) is not None:
+            self.garbage_bytes += handle.length
+        return True
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._blob is not None:
+            self._blob.close()
+            self._blob = None
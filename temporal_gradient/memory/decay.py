@@ -1,7 +1,21 @@
 import math
 import uuid
 
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    np = None
+
+from .columnar import publish_columnar_snapshot
+from .content import ContentPool
+from .journal import MemoryJournal
+from .minhash import LSHIndex, MinHasher, shingles
+from .refresh import RefreshScheduler
+from .sketches import BloomFilter, CountMinSketch, content_fingerprint
 from .store import DecayMemoryStore
+from .striped import StripedMemoryStore
+from .tiered import TieredMemoryStore
+from .transfer import export_memories, iter_memories
 
 S_MAX = 1.5
 
@@ -19,7 +33,59 @@ def initial_strength_from_psi(psi, S_max=1.2):
     return normalized * S_max
 
 
+def decay_lambda_from_value(value, base_lambda, max_slowdown=4.0):
+    """Per-memory decay rate: ``base_lambda`` at V=0, ``base_lambda / max_slowdown`` at V=1."""
+    if base_lambda <= 0.0:
+        raise ValueError("base_lambda must be > 0.0")
+    if max_slowdown < 1.0:
+        raise ValueError("max_slowdown must be >= 1.0")
+    return base_lambda / (1.0 + (max_slowdown - 1.0) * _clamp(value, 0.0, 1.0))
+
+
+def _is_array(value) -> bool:
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _half_power(exponent):
+    return 0.5 ** exponent
+
+
+if np is not None:
+    # Python's own ``math.exp`` and float ``**`` applied per element: NumPy's
+    # vectorized ``exp``/``power`` may differ from them in the last bit.
+    _exp_elements = np.frompyfunc(math.exp, 1, 1)
+    _half_power_elements = np.frompyfunc(_half_power, 1, 1)
+
+
+def _decay_strength_array(strength, elapsed_tau, half_life, decay_lambda):
+    # Same operations, in the same order, as the scalar path; the clamps use
+    # ``where`` so NaN and -0.0 are handled exactly like ``max(0.0, x)``.
+    strength = np.asarray(strength, dtype=np.float64)
+    elapsed_tau = np.asarray(elapsed_tau, dtype=np.float64)
+    elapsed_tau = np.where(elapsed_tau < 0.0, 0.0, elapsed_tau)
+
+    if decay_lambda is not None:
+        factor = _exp_elements(-decay_lambda * elapsed_tau)
+    elif half_life is not None:
+        factor = _half_power_elements(elapsed_tau / half_life)
+    else:
+        raise ValueError("either half_life or decay_lambda must be provided")
+    decayed_value = strength * np.asarray(factor, dtype=np.float64)
+    return np.where(decayed_value > 0.0, decayed_value, 0.0)
+
+
 def decay_strength(strength: float, elapsed_tau: float, half_life: float | None = None, decay_lambda: float | None = None) -> float:
+    """Decay ``strength`` over ``elapsed_tau`` (negative elapsed counts as zero).
+
+    ``strength`` and ``elapsed_tau`` may also be NumPy arrays, broadcast
+    against each other (e.g. strengths of shape ``(n, 1)`` against a τ grid
+    of shape ``(m,)``); the result is then a float64 array bit-identical to
+    calling the scalar path element by element. Only the arithmetic is
+    vectorized; the exponential still costs one Python call per element.
+    """
+    if _is_array(strength) or _is_array(elapsed_tau):
+        return _decay_strength_array(strength, elapsed_tau, half_life, decay_lambda)
+
     if elapsed_tau < 0.0:
         elapsed_tau = 0.0
 
@@ -33,15 +99,61 @@ def decay_strength(strength: float, elapsed_tau: float, half_life: float | None
 
 
 class EntropicMemory:
-    def __init__(self, content, initial_weight=1.0, tags=None, s_max: float = S_MAX):
+    def __init__(self, content, initial_weight=1.0, tags=None, s_max: float = S_MAX, decay_lambda: float | None = None):
         self.id = str(uuid.uuid4())[:8]
-        self.content = content
+        self._content = content
+        self._content_pool = None
+        self._content_handle = None
         self.tags = tags or []
         self.strength = initial_weight
         self.s_max = s_max
         self.created_at_tau = 0.0
         self.last_accessed_tau = 0.0
         self.access_count = 1
+        # Overrides the engine's global rate for this memory when set.
+        self.decay_lambda = decay_lambda
+
+    @property
+    def content(self):
+        if self._content_handle is not None:
+            return self._content_pool.resolve(self._content_handle)
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        self.detach_content()
+        self._content = value
+
+    @property
+    def content_handle(self):
+        """Handle into the :class:`ContentPool` holding the content, if interned."""
+        return self._content_handle
+
+    def intern_content(self, pool):
+        """Move the content into ``pool`` and keep only its handle."""
+        if self._content_handle is None:
+            self._content_handle = pool.intern(self._content)
+            self._content_pool = pool
+            self._content = None
+        return self._content_handle
+
+    def detach_content(self):
+        """Copy interned content back onto the memory and release its pool reference."""
+        if self._content_handle is None:
+            return
+        self._content = self._content_pool.resolve(self._content_handle)
+        self._content_pool.release(self._content_handle)
+        self._content_pool = None
+        self._content_handle = None
+
+    def release_content(self):
+        """Release the pool reference without reading the payload; content becomes ``None``."""
+        if self._content_handle is None:
+            return
+        self._content_pool.release(self._content_handle)
+        self._content_pool = None
+        self._content_handle = None
+        self._content = None
 
     def reconsolidate(self, current_tau, cooldown=0.0):
         elapsed = current_tau - self.last_accessed_tau
@@ -56,33 +168,324 @@ class EntropicMemory:
 
 
 class DecayEngine:
-    def __init__(self, half_life=50.0, prune_threshold=0.2, decay_lambda: float | None = None, s_max: float = S_MAX):
+    def __init__(
+        self,
+        half_life=50.0,
+        prune_threshold=0.2,
+        decay_lambda: float | None = None,
+        s_max: float = S_MAX,
+        capacity: int | None = None,
+        cold_tier_path=None,
+        hot_strength_band: float | None = None,
+        consolidation_threshold: float | None = None,
+        consolidation_permutations: int = 64,
+        consolidation_bands: int = 16,
+        content_sketch_capacity: int | None = None,
+        content_sketch_error_rate: float = 0.01,
+        content_sketch_epsilon: float = 0.001,
+        snapshot_shards: int | None = None,
+        lock_stripes: int | None = None,
+        refresh_lead_tau: float = 0.0,
+        intern_content: bool = False,
+        content_blob_path=None,
+        journal_path=None,
+        journal_snapshot_every: int = 1000,
+        journal_overwrite: bool = False,
+    ):
         self.half_life = half_life
         self.decay_lambda = decay_lambda
         self.prune_threshold = prune_threshold
         self.s_max = s_max
-        self.store = DecayMemoryStore(
-            calculate_strength=self.calculate_current_strength,
-            prune_threshold=prune_threshold,
-            s_max=s_max,
-        )
+        decay_rate = self.effective_decay_lambda
+        store_options = {
+            # A zero rate never decays, so there is no expiry order to index.
+            "decay_rate": decay_rate if decay_rate > 0.0 else None,
+            "capacity": capacity,
+            "snapshot_shards": snapshot_shards,
+        }
+        if cold_tier_path is not None:
+            if hot_strength_band is None:
+                raise ValueError("hot_strength_band is required when cold_tier_path is set")
+            if lock_stripes is not None:
+                raise ValueError("lock_stripes is not supported with cold_tier_path")
+            if intern_content or content_blob_path is not None:
+                raise ValueError("content interning is not supported with cold_tier_path")
+            self.store = TieredMemoryStore(
+                self.calculate_current_strength,
+                prune_threshold,
+                s_max,
+                cold_path=cold_tier_path,
+                hot_strength_band=hot_strength_band,
+                **store_options,
+            )
+        elif lock_stripes is not None:
+            # Only the store is synchronized; consolidation and content
+            # sketches are engine-level and still need external locking.
+            self.store = StripedMemoryStore(
+                self.calculate_current_strength,
+                prune_threshold,
+                s_max,
+                stripes=lock_stripes,
+                **store_options,
+            )
+        else:
+            self.store = DecayMemoryStore(
+                calculate_strength=self.calculate_current_strength,
+                prune_threshold=prune_threshold,
+                s_max=s_max,
+                **store_options,
+            )
+
+        # Pinned memories are reconsolidated just before they would expire.
+        self.refresh_scheduler = None
+        if self.store.decay_rate is not None:
+            self.refresh_scheduler = RefreshScheduler(self.store, lead_tau=refresh_lead_tau, touch=self.touch_memory)
+
+        # Opt-in near-duplicate consolidation: a MinHash/LSH index over memory
+        # content lets add_memory reconsolidate an existing memory instead of
+        # inserting a near-copy.
+        self.consolidation_threshold = consolidation_threshold
+        self.consolidated_count = 0
+        self._minhasher = None
+        self._content_index = None
+        if consolidation_threshold is not None:
+            if not 0.0 < consolidation_threshold <= 1.0:
+                raise ValueError("consolidation_threshold must be within (0.0, 1.0]")
+            self._minhasher = MinHasher(num_perm=consolidation_permutations)
+            self._content_index = LSHIndex(num_perm=consolidation_permutations, bands=consolidation_bands)
+            self.store.add_eviction_listener(self._drop_content_signature)
+            self.store.add_capacity_listener(self._drop_content_signature)
+
+        # Opt-in fixed-budget content sketches: Bloom filters answer "encoded
+        # before?" / "forgotten before?" and a count-min sketch counts how often
+        # the same content has been forgotten.
+        self.encoded_filter = None
+        self.forgotten_filter = None
+        self.forgotten_counts = None
+        if content_sketch_capacity is not None:
+            self.encoded_filter = BloomFilter(content_sketch_capacity, content_sketch_error_rate)
+            self.forgotten_filter = BloomFilter(content_sketch_capacity, content_sketch_error_rate)
+            self.forgotten_counts = CountMinSketch(epsilon=content_sketch_epsilon, delta=content_sketch_error_rate)
+            self.store.add_eviction_listener(self._record_forgotten_content)
+            self.store.add_capacity_listener(self._record_forgotten_content)
+
+        # Opt-in event log of adds, touches and prunes for time-travel queries.
+        self.journal = None
+        if journal_path is not None:
+            self.journal = MemoryJournal(
+                journal_path,
+                snapshot_every=journal_snapshot_every,
+                state=self._full_memories,
+                overwrite=journal_overwrite,
+            )
+            self.store.add_eviction_listener(self._journal_prune)
+            self.store.add_capacity_listener(self._journal_capacity_eviction)
+
+        # Opt-in content interning: identical payloads share one pooled copy,
+        # optionally in a memory-mapped blob file. Registered last so other
+        # listeners still read content before it is released.
+        self.content_pool = None
+        if intern_content or content_blob_path is not None:
+            self.content_pool = ContentPool(content_blob_path)
+            self._detach_forgotten = False
+            self.store.add_eviction_listener(self._release_content)
+            self.store.add_capacity_listener(self._release_content)
+
+    def _journal_prune(self, record, current_tau):
+        self.journal.record_prune(record, current_tau)
+
+    def _journal_capacity_eviction(self, record, current_tau):
+        self.journal.record_prune(record, current_tau, reason="capacity")
+
+    def _release_content(self, record, _current_tau):
+        # Only full-mode sweeps hand forgotten records back to the caller, so
+        # only they copy the payload out of the pool; everything else drops it.
+        if getattr(record, "content_handle", None) is None:
+            return
+        if self._detach_forgotten:
+            record.detach_content()
+        else:
+            record.release_content()
+
+    def _drop_content_signature(self, record, _current_tau):
+        self._content_index.remove(record.id)
+
+    def _record_forgotten_content(self, record, _current_tau):
+        # Cold-tier references carry the fingerprint taken at demotion.
+        fingerprint = getattr(record, "fingerprint", None)
+        if fingerprint is None:
+            content = getattr(record, "content", None)
+            if content is None:
+                return
+            fingerprint = content_fingerprint(content)
+        self.forgotten_filter.add(fingerprint)
+        self.forgotten_counts.add(fingerprint)
+
+    def _require_sketches(self):
+        if self.encoded_filter is None:
+            raise ValueError("content sketches require content_sketch_capacity")
+
+    def was_encoded(self, content):
+        """Whether ``content`` was probably encoded before (no false negatives)."""
+        self._require_sketches()
+        return content_fingerprint(content) in self.encoded_filter
+
+    def was_forgotten(self, content):
+        """Whether ``content`` was probably forgotten before (no false negatives)."""
+        self._require_sketches()
+        return content_fingerprint(content) in self.forgotten_filter
+
+    def forgotten_count(self, content):
+        """Approximate number of times ``content`` has been forgotten (never undercounts)."""
+        self._require_sketches()
+        return self.forgotten_counts.estimate(content_fingerprint(content))
+
+    @property
+    def effective_decay_lambda(self) -> float:
+        """Exponential rate λ implied by ``decay_lambda`` or ``half_life``."""
+        if self.decay_lambda is not None:
+            return self.decay_lambda
+        return math.log(2.0) / self.half_life
 
     @property
     def vault(self):
-        return list(self.store.records)
+        """Read-only store view; use ``list(engine.vault)`` for a copy."""
+        return self.store.records
+
+    def pin_snapshot(self):
+        """Immutable store snapshot for lock-free reads (requires ``snapshot_shards``)."""
+        return self.store.pin_snapshot()
 
     def add_memory(self, memory_obj, current_tau):
+        """Store ``memory_obj`` at ``current_tau`` and return the resident memory.
+
+        With consolidation enabled, a memory whose content is a near-duplicate
+        (estimated Jaccard >= ``consolidation_threshold``) of a live memory is
+        not inserted; the existing memory is reconsolidated and returned.
+        """
+        signature = None
+        if self._content_index is not None:
+            signature = self._minhasher.signature(shingles(memory_obj.content))
+            match = None if signature is None else self._content_index.query(signature, self.consolidation_threshold)
+            if match is not None:
+                existing_id, _similarity = match
+                self.touch_memory(existing_id, current_tau)
+                self.consolidated_count += 1
+                return self.get_memory(existing_id)
+
         memory_obj.created_at_tau = current_tau
         memory_obj.last_accessed_tau = current_tau
         if hasattr(memory_obj, "s_max"):
             memory_obj.s_max = self.s_max
         self.store.add(memory_obj)
+        if self.encoded_filter is not None:
+            self.encoded_filter.add(content_fingerprint(memory_obj.content))
+        if self.store.get(memory_obj.id) is memory_obj:
+            self._register_resident(memory_obj, current_tau, signature)
+        return memory_obj
+
+    def _register_resident(self, memory_obj, current_tau, signature=None):
+        """Attach a newly stored memory to the engine-level opt-in features."""
+        if self.content_pool is not None and hasattr(memory_obj, "intern_content"):
+            memory_obj.intern_content(self.content_pool)
+        if self.journal is not None:
+            self.journal.record_add(memory_obj, current_tau)
+        if signature is not None:
+            self._content_index.insert(memory_obj.id, signature)
+
+    def _full_memories(self):
+        """Yield every live memory with content, reading cold ones without promoting them."""
+        peek = getattr(self.store, "peek", self.store.get)
+        return (peek(memory_id) for memory_id in tuple(self.vault.ids))
+
+    def export_memories(self, target, *, format="jsonl", chunk_size=1024):
+        """Stream every live memory to ``target``; see :func:`export_memories`."""
+        return export_memories(self._full_memories(), target, format=format, chunk_size=chunk_size)
+
+    def publish_columnar_snapshot(self, path, current_tau=None):
+        """Publish the live memories as an mmap-able columnar snapshot at ``path``.
+
+        See :class:`ColumnarSnapshotReader` for the reader side.
+        """
+        return publish_columnar_snapshot(
+            self.vault.columns(),
+            path,
+            decay_rate=self.store.decay_rate,
+            prune_threshold=self.prune_threshold,
+            published_tau=current_tau,
+        )
+
+    def import_memories(self, source, current_tau):
+        """Bulk-load memories exported by :meth:`export_memories`; return the loaded memories.
+
+        Records keep their own strength and τ values and are streamed
+        straight into :meth:`DecayMemoryStore.bulk_load`, so the store
+        indexes are rebuilt once. ``current_tau`` is the τ journaled for the
+        import and for any capacity evictions it causes. Consolidation
+        indexes the imported content but does not merge imported
+        near-duplicates.
+        """
+        loaded = self.store.bulk_load(iter_memories(source), current_tau=current_tau)
+        for memory_obj in loaded:
+            if self.encoded_filter is not None:
+                self.encoded_filter.add(content_fingerprint(memory_obj.content))
+            if self.store.get(memory_obj.id) is not memory_obj:
+                continue
+            signature = None
+            if self._content_index is not None:
+                signature = self._minhasher.signature(shingles(memory_obj.content))
+            self._register_resident(memory_obj, current_tau, signature)
+        return loaded
 
     def get_memory(self, memory_id):
         return self.store.get(memory_id)
 
     def touch_memory(self, memory_id, current_tau, cooldown=0.0):
-        return self.store.touch(memory_id, current_tau, cooldown=cooldown)
+        updated_strength = self.store.touch(memory_id, current_tau, cooldown=cooldown)
+        if updated_strength is not None and self.journal is not None:
+            self.journal.record_touch(self.store.get(memory_id), current_tau)
+        return updated_strength
+
+    def state_at(self, tau):
+        """Memories held at ``tau``, rebuilt from the journal (requires ``journal_path``)."""
+        if self.journal is None:
+            raise ValueError("state_at requires journal_path")
+        return self.journal.state_at(tau)
+
+    def total_strength(self, current_tau):
+        """Aggregate decayed strength of all memories at ``current_tau`` in O(1)."""
+        return self.store.total_strength(current_tau)
+
+    def mean_strength(self, current_tau):
+        """Mean decayed strength of all memories at ``current_tau`` in O(1)."""
+        return self.store.mean_strength(current_tau)
+
+    def by_tag(self, tag, current_tau, min_strength=0.0):
+        """``(memory, strength)`` pairs tagged ``tag`` with strength >= ``min_strength``."""
+        return self.store.by_tag(tag, current_tau, min_strength)
+
+    def by_tags(self, tags, current_tau, min_strength=0.0, *, match="all"):
+        """``(memory, strength)`` pairs matching all (or any) of ``tags``."""
+        return self.store.by_tags(tags, current_tau, min_strength, match=match)
+
+    def memories_created_between(self, lo_tau=None, hi_tau=None):
+        """Memories created within ``[lo_tau, hi_tau]`` (``None`` is unbounded)."""
+        return self.store.created_between(lo_tau, hi_tau)
+
+    def memories_accessed_between(self, lo_tau=None, hi_tau=None):
+        """Memories last touched within ``[lo_tau, hi_tau]`` (``None`` is unbounded)."""
+        return self.store.accessed_between(lo_tau, hi_tau)
+
+    def forecast_survivors(self, future_tau, prune_threshold=None):
+        """Count memories still alive at ``future_tau`` without mutating the store.
+
+        ``prune_threshold`` answers the question for a hypothetical threshold.
+        """
+        return self.store.count_survivors_at(future_tau, prune_threshold=prune_threshold)
+
+    def threshold_for_count(self, max_records, current_tau):
+        """Smallest prune threshold keeping at most ``max_records`` at ``current_tau``."""
+        return self.store.threshold_for_count(max_records, current_tau)
 
     def calculate_current_strength(self, memory, current_tau):
         elapsed = current_tau - memory.last_accessed_tau
@@ -91,6 +494,9 @@ class DecayEngine:
 
         # Canonical first-order model from README: dS/dτ = -λS, so decay depends
         # on elapsed internal time τ only (not τ scaled by current strength).
+        decay_lambda = getattr(memory, "decay_lambda", None)
+        if decay_lambda is not None:
+            return decay_strength(memory.strength, elapsed, decay_lambda=decay_lambda)
         return decay_strength(
             memory.strength,
             elapsed,
@@ -98,6 +504,32 @@ class DecayEngine:
             decay_lambda=self.decay_lambda,
         )
 
-    def entropy_sweep(self, current_tau):
-        survivors, forgotten = self.store.sweep(current_tau)
-        return survivors, forgotten
+    def pin_memory(self, memory_id):
+        """Exempt ``memory_id`` from pruning by refreshing it before each expiry.
+
+        Returns the τ of its next scheduled refresh.
+        """
+        if self.refresh_scheduler is None:
+            raise ValueError("pinning requires a positive decay rate")
+        return self.refresh_scheduler.pin(memory_id)
+
+    def unpin_memory(self, memory_id):
+        return self.refresh_scheduler is not None and self.refresh_scheduler.unpin(memory_id)
+
+    def entropy_sweep(self, current_tau, *, mode="full"):
+        """Prune decayed memories; see :meth:`DecayMemoryStore.sweep` for ``mode``.
+
+        Pinned memories due for refresh are reconsolidated first. With content
+        interning, only ``"full"`` mode copies forgotten content back onto the
+        returned memories; other modes release it unread, leaving ``content``
+        as ``None``.
+        """
+        if self.refresh_scheduler is not None and len(self.refresh_scheduler):
+            self.refresh_scheduler.run_due(current_tau)
+        if self.content_pool is None:
+            return self.store.sweep(current_tau, mode=mode)
+        self._detach_forgotten = mode == "full"
+        try:
+            return self.store.sweep(current_tau, mode=mode)
+        finally:
+            self._detach_forgotten = False
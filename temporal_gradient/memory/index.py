@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import math
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+IndexEntry = Tuple[float, str]
+
+
+class _AfterAllIds:
+    """Probe component that sorts after every record id sharing the same key."""
+
+    def __lt__(self, other) -> bool:
+        return False
+
+    def __le__(self, other) -> bool:
+        return other is self
+
+    def __gt__(self, other) -> bool:
+        return other is not self
+
+    def __ge__(self, other) -> bool:
+        return True
+
+
+_AFTER_ALL_IDS = _AfterAllIds()
+
+
+class SortedKeyIndex:
+    """Sorted multiset of ``(key, record_id)`` entries.
+
+    Entries are kept in bounded sorted buckets, so inserts and removals only
+    shift one bucket, and a Fenwick tree over bucket sizes answers rank
+    queries. Lookups, inserts, removals and rank counts are O(log n) (plus a
+    bucket-local shift); range scans are O(log n + k).
+
+    Keys must be comparable floats (``±inf`` allowed, ``nan`` rejected). Ties
+    on ``key`` are ordered by ``record_id``.
+    """
+
+    _LOAD = 512
+
+    def __init__(self, entries: Iterable[IndexEntry] = ()) -> None:
+        self._buckets: List[List[IndexEntry]] = []
+        self._maxes: List[IndexEntry] = []
+        self._fenwick: List[int] = [0]
+        self._len = 0
+        self.rebuild(entries)
+
+    def rebuild(self, entries: Iterable[IndexEntry]) -> None:
+        """Replace the contents with ``entries`` in a single O(n log n) pass."""
+        ordered = sorted(entries)
+        for key, _record_id in ordered:
+            self._check_key(key)
+        self._buckets = [ordered[start : start + self._LOAD] for start in range(0, len(ordered), self._LOAD)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._len = len(ordered)
+        self._build_fenwick()
+
+    def clear(self) -> None:
+        self.rebuild(())
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        for bucket in self._buckets:
+            yield from bucket
+
+    @staticmethod
+    def _check_key(key: float) -> None:
+        if math.isnan(key):
+            raise ValueError("index keys must not be NaN")
+
+    def _build_fenwick(self) -> None:
+        size = len(self._buckets)
+        tree = [0] * (size + 1)
+        for position, bucket in enumerate(self._buckets, start=1):
+            tree[position] += len(bucket)
+            parent = position + (position & -position)
+            if parent <= size:
+                tree[parent] += tree[position]
+        self._fenwick = tree
+
+    def _fenwick_add(self, bucket_pos: int, delta: int) -> None:
+        position = bucket_pos + 1
+        size = len(self._buckets)
+        while position <= size:
+            self._fenwick[position] += delta
+            position += position & -position
+
+    def _count_before_bucket(self, bucket_pos: int) -> int:
+        total = 0
+        position = bucket_pos
+        while position > 0:
+            total += self._fenwick[position]
+            position -= position & -position
+        return total
+
+    def _locate_position(self, position: int) -> Tuple[int, int]:
+        """Map a global position to ``(bucket_pos, offset)`` by Fenwick descent."""
+        bucket_pos = 0
+        remaining = position
+        step = 1 << (len(self._buckets).bit_length())
+        while step:
+            probe = bucket_pos + step
+            if probe <= len(self._buckets) and self._fenwick[probe] <= remaining:
+                bucket_pos = probe
+                remaining -= self._fenwick[probe]
+            step >>= 1
+        return bucket_pos, remaining
+
+    def at(self, position: int) -> IndexEntry:
+        """Return the entry at ``position`` in key order (negative indexes allowed)."""
+        if position < 0:
+            position += self._len
+        if not 0 <= position < self._len:
+            raise IndexError("index position out of range")
+        bucket_pos, offset = self._locate_position(position)
+        return self._buckets[bucket_pos][offset]
+
+    def add(self, key: float, record_id: str) -> None:
+        self._check_key(key)
+        entry = (key, record_id)
+        if not self._buckets:
+            self._buckets.append([entry])
+            self._maxes.append(entry)
+            self._len = 1
+            self._build_fenwick()
+            return
+
+        bucket_pos = bisect_left(self._maxes, entry)
+        if bucket_pos == len(self._maxes):
+            bucket_pos -= 1
+            self._buckets[bucket_pos].append(entry)
+            self._maxes[bucket_pos] = entry
+        else:
+            insort(self._buckets[bucket_pos], entry)
+        self._len += 1
+
+        bucket = self._buckets[bucket_pos]
+        if len(bucket) > 2 * self._LOAD:
+            upper = bucket[self._LOAD :]
+            del bucket[self._LOAD :]
+            self._maxes[bucket_pos] = bucket[-1]
+            self._buckets.insert(bucket_pos + 1, upper)
+            self._maxes.insert(bucket_pos + 1, upper[-1])
+            self._build_fenwick()
+        else:
+            self._fenwick_add(bucket_pos, 1)
+
+    def discard(self, key: float, record_id: str) -> bool:
+        """Remove one ``(key, record_id)`` entry; return whether it was present."""
+        entry = (key, record_id)
+        bucket_pos = bisect_left(self._maxes, entry)
+        if bucket_pos == len(self._maxes):
+            return False
+        bucket = self._buckets[bucket_pos]
+        offset = bisect_left(bucket, entry)
+        if offset == len(bucket) or bucket[offset] != entry:
+            return False
+
+        del bucket[offset]
+        self._len -= 1
+        if bucket:
+            self._maxes[bucket_pos] = bucket[-1]
+            self._fenwick_add(bucket_pos, -1)
+        else:
+            del self._buckets[bucket_pos]
+            del self._maxes[bucket_pos]
+            self._build_fenwick()
+        return True
+
+    def first(self) -> Optional[IndexEntry]:
+        """Return the smallest entry, or ``None`` when empty."""
+        if not self._buckets:
+            return None
+        return self._buckets[0][0]
+
+    def last(self) -> Optional[IndexEntry]:
+        """Return the largest entry, or ``None`` when empty."""
+        if not self._buckets:
+            return None
+        return self._maxes[-1]
+
+    def _rank(self, probe) -> int:
+        bucket_pos = bisect_left(self._maxes, probe)
+        if bucket_pos == len(self._maxes):
+            return self._len
+        return self._count_before_bucket(bucket_pos) + bisect_left(self._buckets[bucket_pos], probe)
+
+    def count_below(self, key: float, *, inclusive: bool = False) -> int:
+        """Count entries with key ``< key`` (``<= key`` when ``inclusive``)."""
+        probe = (key, _AFTER_ALL_IDS) if inclusive else (key,)
+        return self._rank(probe)
+
+    def count_above(self, key: float, *, inclusive: bool = False) -> int:
+        """Count entries with key ``> key`` (``>= key`` when ``inclusive``)."""
+        return self._len - self.count_below(key, inclusive=not inclusive)
+
+    def irange(
+        self,
+        lo: Optional[float] = None,
+        hi: Optional[float] = None,
+        *,
+        inclusive: Tuple[bool, bool] = (True, True),
+    ) -> Iterator[IndexEntry]:
+        """Yield entries with ``lo <= key <= hi`` in key order.
+
+        ``None`` leaves a side unbounded; ``inclusive`` controls each bound.
+        """
+        if lo is None:
+            bucket_pos, offset = 0, 0
+        else:
+            start = (lo,) if inclusive[0] else (lo, _AFTER_ALL_IDS)
+            bucket_pos = bisect_left(self._maxes, start)
+            if bucket_pos == len(self._maxes):
+                return
+            offset = bisect_left(self._buckets[bucket_pos], start)
+
+        stop = None
+        if hi is not None:
+            stop = (hi, _AFTER_ALL_IDS) if inclusive[1] else (hi,)
+
+        while bucket_pos < len(self._buckets):
+            bucket = self._buckets[bucket_pos]
+            for entry in bucket[offset:]:
+                if stop is not None and not entry < stop:
+                    return
+                yield entry
+            bucket_pos += 1
+            offset = 0
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .serialization import memory_from_dict, memory_to_dict
+
+EVENTS_FILE = "events.jsonl"
+SNAPSHOT_INDEX_FILE = "snapshots.jsonl"
+
+
+def _dumps(payload) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+class MemoryJournal:
+    """Append-only event log of memory adds, touches and prunes.
+
+    Events are appended as JSON lines to ``events.jsonl`` under ``directory``.
+    After every ``snapshot_every`` events, the records returned by ``state``
+    are written to a snapshot file and indexed in ``snapshots.jsonl``
+    together with the log offset they correspond to. :meth:`state_at` loads
+    the nearest snapshot at or before τ and replays at most
+    ``snapshot_every`` events, so smaller spacing bounds query latency at the
+    cost of more snapshot files.
+
+    Events must be logged in non-decreasing τ. An existing journal in
+    ``directory`` is continued: new events are appended after it and must not
+    go back before its last τ. With a ``state`` provider, the first new event
+    is preceded by ``"restart"`` prunes, at its τ, of every id the journal
+    still held that ``state`` does not, so queries after a restart never see
+    memories the restarted store dropped, whatever the snapshot spacing.
+    ``overwrite=True`` discards the existing journal instead.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        snapshot_every: int = 1000,
+        state: Optional[Callable[[], Iterable[object]]] = None,
+        overwrite: bool = False,
+    ) -> None:
+        if isinstance(snapshot_every, bool) or not isinstance(snapshot_every, int) or snapshot_every <= 0:
+            raise ValueError("snapshot_every must be a positive integer")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_every = snapshot_every
+        self.state = state
+        self.event_count = 0
+        self.snapshot_count = 0
+        self._last_tau = -math.inf
+        self._restarted = False
+        if overwrite:
+            for stale in self.directory.glob("snapshot-*.jsonl"):
+                stale.unlink()
+            (self.directory / SNAPSHOT_INDEX_FILE).write_text("", encoding="utf-8")
+            self._events = (self.directory / EVENTS_FILE).open("wb")
+        else:
+            self._resume()
+            self._events = (self.directory / EVENTS_FILE).open("ab")
+
+    def _resume(self) -> None:
+        """Pick up event and snapshot counters and the last τ of an existing journal."""
+        self.snapshot_count = len(_load_snapshot_index(self.directory))
+        path = self.directory / EVENTS_FILE
+        if not path.exists():
+            return
+        last_line = None
+        with path.open("rb") as handle:
+            for line in handle:
+                if line.strip():
+                    self.event_count += 1
+                    last_line = line
+        if last_line is not None:
+            self._last_tau = float(json.loads(last_line)["tau"])
+            self._restarted = True
+
+    def __enter__(self) -> "MemoryJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._events.closed:
+            self._events.close()
+
+    def _append(self, event: Dict[str, object]) -> None:
+        tau = float(event["tau"])
+        if tau < self._last_tau:
+            raise ValueError("journal events must not go back in tau")
+        if self._restarted:
+            self._restarted = False
+            if self.state is not None:
+                self._prune_dropped_on_restart(tau)
+        self._write(event)
+
+    def _prune_dropped_on_restart(self, tau: float) -> None:
+        held = {memory.id for memory in self.state()}
+        self._events.flush()
+        for record_id in journal_state_at(self.directory, self._last_tau):
+            if record_id not in held:
+                self._write({"op": "prune", "tau": tau, "id": record_id, "reason": "restart"})
+
+    def _write(self, event: Dict[str, object]) -> None:
+        tau = float(event["tau"])
+        self._last_tau = tau
+        self._events.write((_dumps(event) + "\n").encode("utf-8"))
+        self._events.flush()
+        self.event_count += 1
+        if self.state is not None and self.event_count % self.snapshot_every == 0:
+            self.snapshot(tau)
+
+    def record_add(self, memory, current_tau: float) -> None:
+        self._append({"op": "add", "tau": current_tau, "record": memory_to_dict(memory)})
+
+    def record_touch(self, memory, current_tau: float) -> None:
+        self._append(
+            {
+                "op": "touch",
+                "tau": current_tau,
+                "id": memory.id,
+                "strength": memory.strength,
+                "last_accessed_tau": memory.last_accessed_tau,
+                "access_count": getattr(memory, "access_count", 1),
+            }
+        )
+
+    def record_prune(self, memory, current_tau: float, *, reason: str = "threshold") -> None:
+        self._append({"op": "prune", "tau": current_tau, "id": memory.id, "reason": reason})
+
+    def snapshot(self, tau: float) -> Path:
+        """Write the current ``state`` as a snapshot at ``tau`` and index it."""
+        if self.state is None:
+            raise ValueError("snapshot requires a state provider")
+        self.snapshot_count += 1
+        path = self.directory / f"snapshot-{self.snapshot_count:08d}.jsonl"
+        with path.open("w", encoding="utf-8") as handle:
+            for memory in self.state():
+                handle.write(_dumps(memory_to_dict(memory)) + "\n")
+        entry = {"tau": tau, "events": self.event_count, "offset": self._events.tell(), "file": path.name}
+        with (self.directory / SNAPSHOT_INDEX_FILE).open("a", encoding="utf-8") as handle:
+            handle.write(_dumps(entry) + "\n")
+        return path
+
+    def state_at(self, tau: float) -> Dict[str, object]:
+        self._events.flush()
+        return journal_state_at(self.directory, tau)
+
+
+def _load_snapshot_index(directory: Path) -> List[Dict[str, object]]:
+    path = directory / SNAPSHOT_INDEX_FILE
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def journal_state_at(directory: str | Path, tau: float) -> Dict[str, object]:
+    """Rebuild the memories a journaled store held at ``tau``, keyed by id in insertion order.
+
+    Loads the last snapshot taken at or before ``tau`` and replays the
+    logged events up to and including ``tau``.
+    """
+    directory = Path(directory)
+    snapshot = None
+    for entry in _load_snapshot_index(directory):
+        if entry["tau"] > tau:
+            break
+        snapshot = entry
+
+    state: Dict[str, object] = {}
+    offset = 0
+    if snapshot is not None:
+        offset = snapshot["offset"]
+        with (directory / snapshot["file"]).open(encoding="utf-8") as handle:
+            for line in handle:
+                memory = memory_from_dict(json.loads(line))
+                state[memory.id] = memory
+
+    with (directory / EVENTS_FILE).open("rb") as handle:
+        handle.seek(offset)
+        for line in handle:
+            event = json.loads(line)
+            if event["tau"] > tau:
+                break
+            _apply_event(state, event)
+    return state
+
+
+def _apply_event(state: Dict[str, object], event: Dict[str, object]) -> None:
+    op = event["op"]
+    if op == "add":
+        memory = memory_from_dict(event["record"])
+        state[memory.id] = memory
+    elif op == "touch":
+        memory = state.get(event["id"])
+        if memory is not None:
+            memory.strength = event["strength"]
+            memory.last_accessed_tau = event["last_accessed_tau"]
+            memory.access_count = event["access_count"]
+    elif op == "prune":
+        state.pop(event["id"], None)
+    else:
+        raise ValueError(f"unknown journal event op: {op!r}")
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+import random
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+Signature = Tuple[int, ...]
+
+
+def shingles(text: str, size: int = 1) -> Set[str]:
+    """Return lowercase word ``size``-grams of ``text`` as the MinHash feature set."""
+    if size <= 0:
+        raise ValueError("size must be > 0")
+    tokens = _TOKEN_PATTERN.findall(str(text).lower())
+    if size == 1:
+        return set(tokens)
+    if len(tokens) < size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[start : start + size]) for start in range(len(tokens) - size + 1)}
+
+
+def _feature_hash(feature: str) -> int:
+    # Process-stable, unlike built-in hash(), so signatures replay identically.
+    return int.from_bytes(blake2b(feature.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    """Deterministic MinHash signatures over string feature sets.
+
+    Uses ``num_perm`` universal hash functions ``(a*x + b) mod p`` seeded from
+    ``seed``; equal configurations produce identical signatures across runs.
+    The fraction of equal positions in two signatures estimates the Jaccard
+    similarity of their feature sets with standard error ~``1/sqrt(num_perm)``.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1) -> None:
+        if num_perm <= 0:
+            raise ValueError("num_perm must be > 0")
+        self.num_perm = num_perm
+        self.seed = seed
+        rng = random.Random(seed)
+        self._coefficients: List[Tuple[int, int]] = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, features: Iterable[str]) -> Optional[Signature]:
+        """Return the MinHash signature of ``features`` (``None`` when empty)."""
+        hashes = {_feature_hash(feature) for feature in features}
+        if not hashes:
+            return None
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes) for a, b in self._coefficients
+        )
+
+    @staticmethod
+    def similarity(left: Signature, right: Signature) -> float:
+        if len(left) != len(right):
+            raise ValueError("signature length mismatch")
+        return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+class LSHIndex:
+    """Banded locality-sensitive hash index over MinHash signatures.
+
+    Signatures are split into ``bands`` bands of ``num_perm // bands`` rows;
+    keys sharing any identical band are candidates, so lookups only compare
+    against colliding keys instead of the whole index. Keys with identical
+    signatures share one bucket entry with a count, so repetitive streams
+    cost one comparison per distinct signature rather than per key.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16) -> None:
+        if bands <= 0 or num_perm % bands:
+            raise ValueError("bands must be a positive divisor of num_perm")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[Signature, Dict[Signature, int]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[str, Signature] = {}
+        self._keys_by_signature: Dict[Signature, Dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: Signature):
+        if len(signature) != self.num_perm:
+            raise ValueError("signature length must equal num_perm")
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start : start + self.rows]
+
+    def insert(self, key: str, signature: Signature) -> None:
+        self.remove(key)
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].setdefault(band_key, {})
+            bucket[signature] = bucket.get(signature, 0) + 1
+        self._signatures[key] = signature
+        self._keys_by_signature.setdefault(signature, {})[key] = None
+
+    def remove(self, key: str) -> bool:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return False
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band][band_key]
+            if bucket[signature] > 1:
+                bucket[signature] -= 1
+            else:
+                del bucket[signature]
+                if not bucket:
+                    del self._buckets[band][band_key]
+        keys = self._keys_by_signature[signature]
+        del keys[key]
+        if not keys:
+            del self._keys_by_signature[signature]
+        return True
+
+    def clear(self) -> None:
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures.clear()
+        self._keys_by_signature.clear()
+
+    def _candidate_signatures(self, signature: Signature) -> Dict[Signature, None]:
+        found: Dict[Signature, None] = {}
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                found.update(dict.fromkeys(bucket))
+        return found
+
+    def candidates(self, signature: Signature) -> Dict[str, None]:
+        """Keys that share at least one band with ``signature``, grouped by signature."""
+        found: Dict[str, None] = {}
+        for candidate in self._candidate_signatures(signature):
+            found.update(self._keys_by_signature[candidate])
+        return found
+
+    def query(self, signature: Signature, threshold: float) -> Optional[Tuple[str, float]]:
+        """Return the most similar ``(key, similarity)`` at or above ``threshold``.
+
+        Each distinct candidate signature is compared once, and the scan stops
+        at the first exact match. Ties go to the oldest key.
+        """
+        best: Optional[Tuple[Signature, float]] = None
+        for candidate in self._candidate_signatures(signature):
+            similarity = MinHasher.similarity(signature, candidate)
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (candidate, similarity)
+                if similarity == 1.0:
+                    break
+        if best is None:
+            return None
+        return next(iter(self._keys_by_signature[best[0]])), best[1]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class RefreshScheduler:
+    """Keep pinned records alive by reconsolidating them just before they expire.
+
+    Each pinned id is queued at its refresh deadline: the τ at which the
+    decay model says it reaches the store's ``prune_threshold`` (see
+    :meth:`DecayMemoryStore.expiry_tau`), minus ``lead_tau``. :meth:`run_due`
+    touches only the records whose deadline has passed and requeues them, so
+    each refresh costs O(log n) in the number of pinned records.
+
+    Heap entries are invalidated lazily: a record touched elsewhere is
+    requeued at its later deadline instead of being refreshed, and records
+    that were unpinned or left the store are dropped when popped. ``touch``
+    replaces ``store.touch`` for refreshes, e.g. to route them through an
+    engine.
+    """
+
+    def __init__(self, store, *, lead_tau: float = 0.0, touch: Optional[Callable[..., object]] = None) -> None:
+        if store.decay_rate is None:
+            raise ValueError("RefreshScheduler requires a store with decay_rate")
+        if lead_tau < 0.0:
+            raise ValueError("lead_tau must be >= 0.0")
+        self.store = store
+        self.lead_tau = float(lead_tau)
+        self._touch = store.touch if touch is None else touch
+        self.refresh_count = 0
+        self._deadlines: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._deadlines
+
+    @property
+    def pinned_ids(self) -> Tuple[str, ...]:
+        return tuple(self._deadlines)
+
+    def _deadline(self, record) -> float:
+        return self.store.expiry_tau(record) - self.lead_tau
+
+    def _schedule(self, record_id: str, deadline: float) -> None:
+        self._deadlines[record_id] = deadline
+        heapq.heappush(self._heap, (deadline, record_id))
+
+    def pin(self, record_id: str) -> float:
+        """Pin a stored record and return its refresh deadline."""
+        record = self.store.get(record_id)
+        if record is None:
+            raise ValueError(f"record with id {record_id!r} does not exist")
+        deadline = self._deadline(record)
+        if self._deadlines.get(record_id) != deadline:
+            self._schedule(record_id, deadline)
+        return deadline
+
+    def unpin(self, record_id: str) -> bool:
+        return self._deadlines.pop(record_id, None) is not None
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest pending refresh deadline, or ``None`` when nothing is pinned."""
+        while self._heap:
+            deadline, record_id = self._heap[0]
+            if self._deadlines.get(record_id) == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def run_due(self, current_tau: float, cooldown: float = 0.0) -> List[str]:
+        """Reconsolidate every pinned record due at ``current_tau``; return their ids."""
+        refreshed: List[str] = []
+        # Requeue after the loop so a record whose boost cannot outrun the
+        # lead time is refreshed at most once per call.
+        requeue: List[Tuple[str, float]] = []
+        while self._heap and self._heap[0][0] <= current_tau:
+            deadline, record_id = heapq.heappop(self._heap)
+            if self._deadlines.get(record_id) != deadline:
+                continue
+            record = self.store.get(record_id)
+            if record is None:
+                del self._deadlines[record_id]
+                continue
+            actual = self._deadline(record)
+            if actual > current_tau:
+                self._schedule(record_id, actual)
+                continue
+            self._touch(record_id, current_tau, cooldown=cooldown)
+            self.refresh_count += 1
+            refreshed.append(record_id)
+            del self._deadlines[record_id]
+            requeue.append((record_id, self._deadline(self.store.get(record_id))))
+        for record_id, deadline in requeue:
+            self._schedule(record_id, deadline)
+        return refreshed
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import base64
+from typing import Any, Dict
+
+
+def memory_to_dict(memory) -> Dict[str, Any]:
+    """JSON-ready dict of a memory's content and decay state.
+
+    ``bytes`` content is stored base64-encoded under ``content_bytes``.
+    """
+    content = getattr(memory, "content", None)
+    data: Dict[str, Any] = {
+        "id": memory.id,
+        "tags": list(getattr(memory, "tags", None) or ()),
+        "strength": memory.strength,
+        "s_max": getattr(memory, "s_max", None),
+        "created_at_tau": getattr(memory, "created_at_tau", 0.0),
+        "last_accessed_tau": memory.last_accessed_tau,
+        "access_count": getattr(memory, "access_count", 1),
+        "decay_lambda": getattr(memory, "decay_lambda", None),
+    }
+    if isinstance(content, bytes):
+        data["content_bytes"] = base64.b64encode(content).decode("ascii")
+    else:
+        data["content"] = content
+    return data
+
+
+def memory_from_dict(data: Dict[str, Any]):
+    """Rebuild an :class:`EntropicMemory` written by :func:`memory_to_dict`."""
+    # Imported here because decay.py imports the journal, which imports this module.
+    from .decay import EntropicMemory
+
+    if "content_bytes" in data:
+        content = base64.b64decode(data["content_bytes"])
+    else:
+        content = data.get("content")
+    memory = EntropicMemory(content, initial_weight=data["strength"], tags=list(data.get("tags") or ()))
+    memory.id = data["id"]
+    if data.get("s_max") is not None:
+        memory.s_max = data["s_max"]
+    memory.created_at_tau = data.get("created_at_tau", 0.0)
+    memory.last_accessed_tau = data["last_accessed_tau"]
+    memory.access_count = data.get("access_count", 1)
+    memory.decay_lambda = data.get("decay_lambda")
+    return memory
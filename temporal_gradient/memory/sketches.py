@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from array import array
+from hashlib import sha256
+import math
+from typing import Iterator, Union
+
+Hashable = Union[str, bytes]
+
+
+def content_fingerprint(content) -> bytes:
+    """Stable 32-byte SHA-256 fingerprint of memory content."""
+    if isinstance(content, bytes):
+        return sha256(content).digest()
+    return sha256(str(content).encode("utf-8")).digest()
+
+
+def _fingerprint(item: Hashable) -> bytes:
+    # 32-byte values are treated as precomputed fingerprints.
+    if isinstance(item, bytes) and len(item) == 32:
+        return item
+    return content_fingerprint(item)
+
+
+def _hash_pair(item: Hashable) -> tuple[int, int]:
+    digest = _fingerprint(item)
+    first = int.from_bytes(digest[:8], "little")
+    second = int.from_bytes(digest[8:16], "little") | 1
+    return first, second
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter for "probably seen" membership checks.
+
+    Sized for ``capacity`` items at ``false_positive_rate``: uses
+    ``m = -n·ln(p) / ln(2)^2`` bits and ``k = (m/n)·ln(2)`` probes derived by
+    double hashing a SHA-256 fingerprint. Never reports false negatives.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be within (0.0, 1.0)")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.bit_count = max(8, math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2.0) ** 2)))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2.0)))
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: Hashable) -> Iterator[int]:
+        first, second = _hash_pair(item)
+        for probe in range(self.hash_count):
+            yield (first + probe * second) % self.bit_count
+
+    def add(self, item: Hashable) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: Hashable) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        """False-positive rate implied by the number of items added so far."""
+        return (1.0 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+
+
+class CountMinSketch:
+    """Count-min sketch for approximate per-item frequencies in fixed memory.
+
+    With ``width = ceil(e/epsilon)`` and ``depth = ceil(ln(1/delta))``,
+    estimates never undercount and overcount by at most ``epsilon·total``
+    with probability ``1 - delta``.
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01) -> None:
+        if not 0.0 < epsilon < 1.0:
+            raise ValueError("epsilon must be within (0.0, 1.0)")
+        if not 0.0 < delta < 1.0:
+            raise ValueError("delta must be within (0.0, 1.0)")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1.0 / delta))
+        self._rows = [array("Q", bytes(8 * self.width)) for _ in range(self.depth)]
+        self.total = 0
+
+    def _cells(self, item: Hashable) -> Iterator[tuple[array, int]]:
+        first, second = _hash_pair(item)
+        for row_index, row in enumerate(self._rows):
+            yield row, (first + row_index * second) % self.width
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        for row, column in self._cells(item):
+            row[column] += count
+        self.total += count
+
+    def estimate(self, item: Hashable) -> int:
+        return min(row[column] for row, column in self._cells(item))
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(row.itemsize * len(row) for row in self._rows)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class SnapshotEntry(NamedTuple):
+    """Decay metadata of one record, frozen when the entry was written.
+
+    ``record`` is the live object and may since have been touched; read
+    ``strength`` and ``last_accessed_tau`` from the entry, not the record.
+    """
+
+    id: str
+    strength: float
+    last_accessed_tau: float
+    created_at_tau: float
+    record: object
+    decay_lambda: Optional[float] = None
+
+
+Shard = Dict[str, SnapshotEntry]
+
+
+class StoreSnapshot:
+    """Immutable, versioned view of a store at the moment it was pinned.
+
+    Snapshots share unchanged shards with earlier and later snapshots; a
+    shard is never mutated once a snapshot references it. Reads need no
+    lock and are unaffected by concurrent adds, touches or sweeps. Iteration
+    order is by shard, not by insertion.
+    """
+
+    __slots__ = ("version", "_shards", "_calculate_strength", "_len")
+
+    def __init__(
+        self,
+        version: int,
+        shards: Tuple[Shard, ...],
+        calculate_strength: Callable[[object, float], float],
+    ) -> None:
+        self.version = version
+        self._shards = shards
+        self._calculate_strength = calculate_strength
+        self._len = sum(len(shard) for shard in shards)
+
+    def _shard(self, record_id: str) -> Shard:
+        return self._shards[hash(record_id) % len(self._shards)]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[SnapshotEntry]:
+        for shard in self._shards:
+            yield from shard.values()
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._shard(record_id)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(version={self.version}, len={self._len})"
+
+    def get(self, record_id: str) -> Optional[SnapshotEntry]:
+        return self._shard(record_id).get(record_id)
+
+    def strength_at(self, record_id: str, current_tau: float) -> Optional[float]:
+        """Decayed strength of ``record_id`` at ``current_tau`` as of this snapshot."""
+        entry = self.get(record_id)
+        if entry is None:
+            return None
+        return self._calculate_strength(entry, current_tau)
+
+    def ranked(self, current_tau: float, limit: Optional[int] = None) -> List[Tuple[SnapshotEntry, float]]:
+        """``(entry, strength)`` pairs at ``current_tau``, strongest first."""
+        scored = [(entry, self._calculate_strength(entry, current_tau)) for entry in self]
+        scored.sort(key=lambda item: (-item[1], item[0].id))
+        return scored if limit is None else scored[:limit]
+
+
+class SnapshotPublisher:
+    """Copy-on-write shard set behind :meth:`DecayMemoryStore.pin_snapshot`.
+
+    Entries are spread over ``shards`` dicts by id hash. Pinning freezes the
+    current shard dicts into a :class:`StoreSnapshot` in O(shards); the next
+    write to a frozen shard copies that shard first, so a write costs at most
+    one O(n/shards) copy per pin and unchanged shards stay shared. The lock
+    only covers a single entry write or a pin, never a whole sweep.
+    """
+
+    def __init__(self, calculate_strength: Callable[[object, float], float], shards: int = 64) -> None:
+        if isinstance(shards, bool) or not isinstance(shards, int) or shards <= 0:
+            raise ValueError("snapshot shards must be a positive integer")
+        self._calculate_strength = calculate_strength
+        self._shards: List[Shard] = [{} for _ in range(shards)]
+        self._frozen = [False] * shards
+        self._lock = threading.Lock()
+        self._latest: Optional[StoreSnapshot] = None
+        self._version = 0
+
+    def _writable_shard(self, record_id: str) -> Shard:
+        position = hash(record_id) % len(self._shards)
+        if self._frozen[position]:
+            self._shards[position] = dict(self._shards[position])
+            self._frozen[position] = False
+        self._latest = None
+        return self._shards[position]
+
+    def write(self, record) -> None:
+        entry = SnapshotEntry(
+            id=record.id,
+            strength=record.strength,
+            last_accessed_tau=record.last_accessed_tau,
+            created_at_tau=getattr(record, "created_at_tau", 0.0),
+            record=record,
+            decay_lambda=getattr(record, "decay_lambda", None),
+        )
+        with self._lock:
+            self._writable_shard(record.id)[record.id] = entry
+
+    def remove(self, record_id: str) -> None:
+        with self._lock:
+            self._writable_shard(record_id).pop(record_id, None)
+
+    def pin(self) -> StoreSnapshot:
+        """Return the current snapshot, publishing a new version if anything changed."""
+        with self._lock:
+            if self._latest is None:
+                self._version += 1
+                self._latest = StoreSnapshot(self._version, tuple(self._shards), self._calculate_strength)
+                self._frozen = [True] * len(self._shards)
+            return self._latest
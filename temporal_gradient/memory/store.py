@@ -1,7 +1,35 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, List, Literal, Sequence, Tuple
+import math
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple
+
+from .index import SortedKeyIndex
+from .snapshots import SnapshotPublisher, StoreSnapshot
+from .views import StoreView
+
+# Rebase the running strength sum once any anchored exponent λ(τ_i - τ_ref)
+# exceeds this, well before exp() overflows.
+_REBASE_EXPONENT = 50.0
+# Relative slack on the sweep's expiry cutoff: log-based expiry keys can sit a
+# few ulps past the first τ at which calculate_strength reaches the threshold.
+_EXPIRY_SLACK = 1e-9
+
+
+class _AnchorGroup:
+    """Running ``Σ S_i·exp(λ(τ_i - anchor_tau))`` for records sharing one rate λ."""
+
+    __slots__ = ("anchor_tau", "total", "count")
+
+    def __init__(self, anchor_tau: float) -> None:
+        self.anchor_tau = anchor_tau
+        self.total = 0.0
+        self.count = 0
+
+
+SweepMode = Literal["full", "count", "ids", "stream"]
+SWEEP_MODES = ("full", "count", "ids", "stream")
+EvictionListener = Callable[[object, float], None]
 
 
 class MemoryStore(ABC):
@@ -25,7 +53,7 @@ class MemoryStore(ABC):
         pass
 
     @abstractmethod
-    def sweep(self, current_tau: float):
+    def sweep(self, current_tau: float, *, mode: SweepMode = "full"):
         pass
 
     @abstractmethod
@@ -34,23 +62,110 @@ class MemoryStore(ABC):
 
 
 class DecayMemoryStore(MemoryStore):
-    def __init__(self, calculate_strength: Callable[[object, float], float], prune_threshold: float, s_max: float = 1.5):
+    """Decay-aware memory store with explicit collision and pruning rules.
+
+    When ``decay_rate`` (the exponential rate λ) is provided, the store keeps
+    an ordered expiry index: each record is keyed by the τ at which its
+    strength reaches ``prune_threshold``. Under a shared λ this order equals
+    the order of current decayed strength at every τ, so the weakest record is
+    always the first index entry. The index is maintained through ``add``,
+    ``upsert``, ``touch`` and ``sweep``; records mutated directly bypass it.
+
+    ``capacity`` bounds the number of records (requires ``decay_rate``).
+    Inserting a new id into a full store evicts whichever record, including
+    the incoming one, has the lowest decayed strength. Capacity evictions are
+    reported to capacity listeners and counted in ``capacity_evictions``,
+    separately from threshold pruning.
+
+    With ``decay_rate`` the store also keeps the running sum
+    ``Σ S_i·exp(λ(τ_i - τ_ref))`` so :meth:`total_strength` is O(1):
+    total(τ) = exp(-λ(τ - τ_ref))·sum. The sum is recomputed exactly whenever
+    the reference τ is rebased.
+
+    A record may carry its own ``decay_lambda``, overriding ``decay_rate``.
+    Its expiry key then uses its own rate, and the running sum keeps one
+    group per distinct rate, so :meth:`total_strength` is O(distinct rates).
+    Sweeps of an indexed store take expired ids straight from the expiry
+    index instead of calling ``calculate_strength`` per record, so mixed-rate
+    stores sweep in O(log n + k). With mixed rates, index order is expiry
+    order rather than strength order, and capacity eviction drops the record
+    that would expire first.
+
+    ``snapshot_shards`` enables :meth:`pin_snapshot`: the store mirrors every
+    write into copy-on-write shards so readers can pin immutable versions
+    while ingestion and sweeps keep running.
+    """
+
+    def __init__(
+        self,
+        calculate_strength: Callable[[object, float], float],
+        prune_threshold: float,
+        s_max: float = 1.5,
+        *,
+        decay_rate: Optional[float] = None,
+        capacity: Optional[int] = None,
+        snapshot_shards: Optional[int] = None,
+    ):
+        if decay_rate is not None and decay_rate <= 0.0:
+            raise ValueError("decay_rate must be > 0.0")
+        if capacity is not None:
+            if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity <= 0:
+                raise ValueError("capacity must be a positive integer")
+            if decay_rate is None:
+                raise ValueError("capacity requires decay_rate for strength-ordered eviction")
         self._calculate_strength = calculate_strength
         self.prune_threshold = prune_threshold
         self.s_max = s_max
+        self.decay_rate = decay_rate
+        self.capacity = capacity
+        self.capacity_evictions = 0
         self._records_by_id: Dict[str, object] = {}
         self._last_tau_by_id: Dict[str, float] = {}
-        self._active_order: List[str] = []
+        self._active_order: Dict[str, None] = {}
+        self._eviction_listeners: List[EvictionListener] = []
+        self._capacity_listeners: List[EvictionListener] = []
+        self._expiry_by_id: Dict[str, float] = {}
+        self._expiry_index = SortedKeyIndex()
+        self._anchor_by_id: Dict[str, Tuple[float, float, float]] = {}
+        self._anchor_groups: Dict[float, _AnchorGroup] = {}
+        self._tau_keys_by_id: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        self._created_index = SortedKeyIndex()
+        self._accessed_index = SortedKeyIndex()
+        self._ids_by_tag: Dict[str, Dict[str, None]] = {}
+        self._tags_by_id: Dict[str, Tuple[str, ...]] = {}
+        self._version = 0
+        self._view = StoreView(self)
+        self._snapshots: Optional[SnapshotPublisher] = None
+        if snapshot_shards is not None:
+            self._snapshots = SnapshotPublisher(calculate_strength, snapshot_shards)
 
     @property
-    def records(self) -> Sequence[object]:
-        return [self._records_by_id[record_id] for record_id in self._active_order]
+    def records(self) -> StoreView:
+        """Read-only view of live records in insertion order (no copy)."""
+        return self._view
+
+    def view(self) -> StoreView:
+        return self._view
+
+    def pin_snapshot(self) -> StoreSnapshot:
+        """Pin an immutable snapshot of the store (requires ``snapshot_shards``).
+
+        Safe to call from reader threads while another thread writes. Returns
+        the same snapshot object until the store changes.
+        """
+        if self._snapshots is None:
+            raise ValueError("pin_snapshot requires snapshot_shards")
+        return self._snapshots.pin()
 
     @property
     def active_ids(self) -> Tuple[str, ...]:
         return tuple(self._active_order)
 
     def _validate_record(self, record, *, allow_tau_regression: bool = False) -> None:
+        decay_lambda = getattr(record, "decay_lambda", None)
+        if decay_lambda is not None and not decay_lambda > 0.0:
+            raise ValueError("record decay_lambda must be > 0.0")
+
         strength = getattr(record, "strength", None)
         if strength is not None and not (0.0 <= strength <= self.s_max):
             raise ValueError(f"strength must be within [0.0, {self.s_max}]")
@@ -63,6 +178,362 @@ class DecayMemoryStore(MemoryStore):
     def _should_prune(self, current_strength: float) -> bool:
         return current_strength <= self.prune_threshold
 
+    def add_eviction_listener(self, listener: EvictionListener) -> None:
+        """Register ``listener(record, current_tau)`` to run for every swept record."""
+        self._eviction_listeners.append(listener)
+
+    def remove_eviction_listener(self, listener: EvictionListener) -> None:
+        self._eviction_listeners.remove(listener)
+
+    def add_capacity_listener(self, listener: EvictionListener) -> None:
+        """Register ``listener(record, current_tau)`` for capacity evictions."""
+        self._capacity_listeners.append(listener)
+
+    def remove_capacity_listener(self, listener: EvictionListener) -> None:
+        self._capacity_listeners.remove(listener)
+
+    def expiry_tau(self, record) -> float:
+        """Return the τ at which ``record`` decays to ``prune_threshold``.
+
+        Requires ``decay_rate``. Zero-strength records expire at ``-inf``; a
+        non-positive ``prune_threshold`` never expires positive strengths.
+        """
+        if self.decay_rate is None:
+            raise ValueError("expiry_tau requires decay_rate")
+        strength = record.strength
+        if strength <= 0.0:
+            return -math.inf
+        if self.prune_threshold <= 0.0:
+            return math.inf
+        return record.last_accessed_tau + math.log(strength / self.prune_threshold) / self._rate(record)
+
+    def _rate(self, record) -> float:
+        decay_lambda = getattr(record, "decay_lambda", None)
+        return self.decay_rate if decay_lambda is None else decay_lambda
+
+    @property
+    def has_mixed_rates(self) -> bool:
+        """Whether any indexed record decays at a rate other than ``decay_rate``."""
+        return any(rate != self.decay_rate for rate in self._anchor_groups)
+
+    def _index_record(self, record) -> None:
+        self._index_taus(record)
+        if self.decay_rate is None:
+            return
+        previous = self._expiry_by_id.pop(record.id, None)
+        if previous is not None:
+            self._expiry_index.discard(previous, record.id)
+        expiry = self.expiry_tau(record)
+        self._expiry_by_id[record.id] = expiry
+        self._expiry_index.add(expiry, record.id)
+        self._unanchor(record.id)
+        self._anchor(record.id, record.strength, record.last_accessed_tau, self._rate(record))
+
+    def _index_taus(self, record) -> None:
+        self._unindex_taus(record.id)
+        created = getattr(record, "created_at_tau", None)
+        accessed = getattr(record, "last_accessed_tau", None)
+        if created is not None:
+            self._created_index.add(created, record.id)
+        if accessed is not None:
+            self._accessed_index.add(accessed, record.id)
+        self._tau_keys_by_id[record.id] = (created, accessed)
+
+    def _unindex_taus(self, record_id: str) -> None:
+        keys = self._tau_keys_by_id.pop(record_id, None)
+        if keys is None:
+            return
+        created, accessed = keys
+        if created is not None:
+            self._created_index.discard(created, record_id)
+        if accessed is not None:
+            self._accessed_index.discard(accessed, record_id)
+
+    def _index_tags(self, record) -> None:
+        self._unindex_tags(record.id)
+        tags = tuple(dict.fromkeys(getattr(record, "tags", None) or ()))
+        if not tags:
+            return
+        for tag in tags:
+            self._ids_by_tag.setdefault(tag, {})[record.id] = None
+        self._tags_by_id[record.id] = tags
+
+    def _unindex_tags(self, record_id: str) -> None:
+        for tag in self._tags_by_id.pop(record_id, ()):
+            postings = self._ids_by_tag[tag]
+            postings.pop(record_id, None)
+            if not postings:
+                del self._ids_by_tag[tag]
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Number of live records per tag."""
+        return {tag: len(postings) for tag, postings in self._ids_by_tag.items()}
+
+    def by_tags(
+        self,
+        tags: Iterable[str],
+        current_tau: float,
+        min_strength: float = 0.0,
+        *,
+        match: Literal["all", "any"] = "all",
+    ) -> List[Tuple[object, float]]:
+        """Return ``(record, strength)`` for records carrying ``tags``.
+
+        ``match="all"`` intersects the tag postings set-at-a-time starting
+        from the smallest; ``match="any"`` unions them. Only matching records
+        are evaluated, and those with decayed strength below ``min_strength``
+        at ``current_tau`` are dropped. Results follow tag-posting order.
+        """
+        if match not in ("all", "any"):
+            raise ValueError("match must be one of: 'all', 'any'")
+        postings = [self._ids_by_tag.get(tag, {}) for tag in dict.fromkeys(tags)]
+        if not postings:
+            return []
+
+        if match == "all":
+            postings.sort(key=len)
+            common = postings[0].keys()
+            for other in postings[1:]:
+                if not common:
+                    break
+                common = common & other.keys()
+            candidates: Iterable[str] = [record_id for record_id in postings[0] if record_id in common]
+        else:
+            candidates = dict.fromkeys(record_id for item in postings for record_id in item)
+
+        matches: List[Tuple[object, float]] = []
+        for record_id in candidates:
+            record = self._records_by_id[record_id]
+            strength = self._calculate_strength(record, current_tau)
+            if strength >= min_strength:
+                matches.append((record, strength))
+        return matches
+
+    def by_tag(self, tag: str, current_tau: float, min_strength: float = 0.0) -> List[Tuple[object, float]]:
+        """Return ``(record, strength)`` for records tagged ``tag``; see :meth:`by_tags`."""
+        return self.by_tags((tag,), current_tau, min_strength)
+
+    def _records_in_range(self, index: SortedKeyIndex, lo, hi) -> List[object]:
+        return [self._records_by_id[record_id] for _tau, record_id in index.irange(lo, hi)]
+
+    def created_between(self, lo: Optional[float] = None, hi: Optional[float] = None) -> List[object]:
+        """Records with ``lo <= created_at_tau <= hi``, oldest first, in O(log n + k)."""
+        return self._records_in_range(self._created_index, lo, hi)
+
+    def accessed_between(self, lo: Optional[float] = None, hi: Optional[float] = None) -> List[object]:
+        """Records with ``lo <= last_accessed_tau <= hi``, least recent first, in O(log n + k)."""
+        return self._records_in_range(self._accessed_index, lo, hi)
+
+    def _anchor(self, record_id: str, strength: float, tau: float, rate: float) -> None:
+        group = self._anchor_groups.get(rate)
+        if group is None:
+            group = self._anchor_groups[rate] = _AnchorGroup(tau)
+        elif rate * (tau - group.anchor_tau) > _REBASE_EXPONENT:
+            self._rebase(rate, tau)
+        self._anchor_by_id[record_id] = (strength, tau, rate)
+        group.total += strength * math.exp(rate * (tau - group.anchor_tau))
+        group.count += 1
+
+    def _unanchor(self, record_id: str) -> None:
+        anchor = self._anchor_by_id.pop(record_id, None)
+        if anchor is None:
+            return
+        strength, tau, rate = anchor
+        group = self._anchor_groups[rate]
+        group.count -= 1
+        if group.count:
+            group.total = max(0.0, group.total - strength * math.exp(rate * (tau - group.anchor_tau)))
+        else:
+            del self._anchor_groups[rate]
+
+    def _rebase(self, rate: float, anchor_tau: float) -> None:
+        """Move one rate group's reference τ and recompute its sum exactly."""
+        group = self._anchor_groups[rate]
+        group.anchor_tau = anchor_tau
+        group.total = math.fsum(
+            strength * math.exp(rate * (tau - anchor_tau))
+            for strength, tau, anchor_rate in self._anchor_by_id.values()
+            if anchor_rate == rate
+        )
+
+    def total_strength(self, current_tau: float) -> float:
+        """Sum of decayed strengths at ``current_tau``.
+
+        O(distinct rates) with ``decay_rate``; assumes ``current_tau`` is not
+        earlier than any record's ``last_accessed_tau``. Without
+        ``decay_rate`` this falls back to evaluating every record.
+        """
+        if self.decay_rate is None:
+            return math.fsum(
+                self._calculate_strength(self._records_by_id[record_id], current_tau)
+                for record_id in self._active_order
+            )
+        return math.fsum(
+            group.total * math.exp(-rate * (current_tau - group.anchor_tau))
+            for rate, group in self._anchor_groups.items()
+        )
+
+    def mean_strength(self, current_tau: float) -> float:
+        """Mean decayed strength at ``current_tau`` (``0.0`` for an empty store)."""
+        if not self._active_order:
+            return 0.0
+        return self.total_strength(current_tau) / len(self._active_order)
+
+    def _forget(self, record_id: str) -> None:
+        """Drop ``record_id`` from every structure the store maintains."""
+        self._version += 1
+        self._records_by_id.pop(record_id, None)
+        self._last_tau_by_id.pop(record_id, None)
+        self._active_order.pop(record_id, None)
+        expiry = self._expiry_by_id.pop(record_id, None)
+        if expiry is not None:
+            self._expiry_index.discard(expiry, record_id)
+        self._unanchor(record_id)
+        self._unindex_taus(record_id)
+        self._unindex_tags(record_id)
+        if self._snapshots is not None:
+            self._snapshots.remove(record_id)
+
+    def _require_expiry_index(self, operation: str) -> None:
+        if self.decay_rate is None:
+            raise ValueError(f"{operation} requires decay_rate")
+
+    def _require_uniform_rate(self, operation: str) -> None:
+        if self.has_mixed_rates:
+            raise ValueError(f"{operation} requires a uniform decay rate")
+
+    def _expiry_cutoff(self, tau: float, prune_threshold: float) -> float:
+        """Translate "strength <= prune_threshold at tau" into an expiry-key bound."""
+        if prune_threshold == self.prune_threshold:
+            return tau
+        self._require_uniform_rate("a hypothetical prune_threshold")
+        if self.prune_threshold <= 0.0:
+            raise ValueError("hypothetical thresholds require a positive store prune_threshold")
+        if prune_threshold <= 0.0:
+            return -math.inf
+        return tau + math.log(prune_threshold / self.prune_threshold) / self.decay_rate
+
+    def count_survivors_at(self, future_tau: float, *, prune_threshold: Optional[float] = None) -> int:
+        """Forecast how many records a sweep at ``future_tau`` would keep.
+
+        Assumes no further adds or touches. ``prune_threshold`` evaluates a
+        hypothetical threshold instead of the configured one. O(log n) and
+        read-only.
+        """
+        self._require_expiry_index("count_survivors_at")
+        threshold = self.prune_threshold if prune_threshold is None else prune_threshold
+        return self._expiry_index.count_above(self._expiry_cutoff(future_tau, threshold))
+
+    def threshold_for_count(self, max_records: int, current_tau: float) -> float:
+        """Smallest prune threshold that leaves at most ``max_records`` at ``current_tau``.
+
+        Returns ``0.0`` when the store already fits. The threshold is the
+        boundary record's own ``calculate_strength``, nudged up by ulps until
+        :meth:`count_survivors_at` agrees, so ``strength <= threshold`` prunes
+        it despite rounding in the expiry keys. O(log n) and read-only.
+        """
+        self._require_expiry_index("threshold_for_count")
+        self._require_uniform_rate("threshold_for_count")
+        if max_records < 0:
+            raise ValueError("max_records must be >= 0")
+        if self.prune_threshold <= 0.0:
+            raise ValueError("threshold_for_count requires a positive store prune_threshold")
+        total = len(self._expiry_index)
+        if total <= max_records:
+            return 0.0
+        _expiry, record_id = self._expiry_index.at(total - max_records - 1)
+        threshold = self._calculate_strength(self._records_by_id[record_id], current_tau)
+        while self.count_survivors_at(current_tau, prune_threshold=threshold) > max_records:
+            threshold = math.nextafter(threshold, math.inf)
+        return threshold
+
+    def weakest(self) -> Optional[str]:
+        """Return the id with the lowest decayed strength in O(1), if indexed."""
+        entry = self._expiry_index.first()
+        return None if entry is None else entry[1]
+
+    def bulk_load(self, records: Iterable[object], *, current_tau: Optional[float] = None) -> List[object]:
+        """Insert many new records, rebuilding the shared indexes once at the end.
+
+        Each record is validated in O(1); the expiry, tau and running-sum
+        structures are then rebuilt in one O(n log n) pass instead of one
+        indexed insert per record. Ids must be new to the store and unique
+        within ``records``; on a collision nothing is loaded. If the load
+        exceeds ``capacity``, the weakest records are evicted afterwards and
+        reported to capacity listeners with ``current_tau`` (each victim's own
+        ``last_accessed_tau`` when it is ``None``). Returns the loaded records.
+        """
+        loaded: List[object] = []
+        try:
+            for record in records:
+                if record.id in self._records_by_id:
+                    raise ValueError(f"record with id {record.id!r} already exists")
+                self._validate_record(record)
+                self._records_by_id[record.id] = record
+                if getattr(record, "last_accessed_tau", None) is not None:
+                    self._last_tau_by_id[record.id] = record.last_accessed_tau
+                self._active_order[record.id] = None
+                loaded.append(record)
+        except Exception:
+            for record in loaded:
+                self._records_by_id.pop(record.id, None)
+                self._last_tau_by_id.pop(record.id, None)
+                self._active_order.pop(record.id, None)
+            raise
+        if not loaded:
+            return loaded
+
+        self._version += 1
+        self._rebuild_indexes(loaded)
+        for record in loaded:
+            self._index_tags(record)
+            if self._snapshots is not None:
+                self._snapshots.write(record)
+
+        if self.capacity is not None:
+            while len(self._active_order) > self.capacity:
+                victim = self._records_by_id[self._expiry_index.first()[1]]
+                self._forget(victim.id)
+                self.capacity_evictions += 1
+                eviction_tau = getattr(victim, "last_accessed_tau", None) if current_tau is None else current_tau
+                for listener in self._capacity_listeners:
+                    listener(victim, eviction_tau)
+        return loaded
+
+    def _rebuild_indexes(self, loaded: List[object]) -> None:
+        created_entries = list(self._created_index)
+        accessed_entries = list(self._accessed_index)
+        for record in loaded:
+            created = getattr(record, "created_at_tau", None)
+            accessed = getattr(record, "last_accessed_tau", None)
+            if created is not None:
+                created_entries.append((created, record.id))
+            if accessed is not None:
+                accessed_entries.append((accessed, record.id))
+            self._tau_keys_by_id[record.id] = (created, accessed)
+        self._created_index.rebuild(created_entries)
+        self._accessed_index.rebuild(accessed_entries)
+        if self.decay_rate is None:
+            return
+
+        latest_tau_by_rate: Dict[float, float] = {}
+        count_by_rate: Dict[float, int] = {}
+        for record in loaded:
+            expiry = self.expiry_tau(record)
+            self._expiry_by_id[record.id] = expiry
+            rate = self._rate(record)
+            tau = record.last_accessed_tau
+            self._anchor_by_id[record.id] = (record.strength, tau, rate)
+            latest_tau_by_rate[rate] = max(tau, latest_tau_by_rate.get(rate, tau))
+            count_by_rate[rate] = count_by_rate.get(rate, 0) + 1
+        self._expiry_index.rebuild(list(self._expiry_index) + [(self._expiry_by_id[record.id], record.id) for record in loaded])
+        for rate, latest_tau in latest_tau_by_rate.items():
+            group = self._anchor_groups.get(rate)
+            if group is None:
+                group = self._anchor_groups[rate] = _AnchorGroup(latest_tau)
+            group.count += count_by_rate[rate]
+            self._rebase(rate, max(group.anchor_tau, latest_tau))
+
     def upsert(self, record, *, allow_tau_regression: bool = False):
         """Insert or replace a record while enforcing store invariants.
 
@@ -73,11 +544,15 @@ class DecayMemoryStore(MemoryStore):
                 ID with a smaller ``last_accessed_tau`` raises ``ValueError``.
         """
         self._validate_record(record, allow_tau_regression=allow_tau_regression)
+        self._version += 1
         self._records_by_id[record.id] = record
         if getattr(record, "last_accessed_tau", None) is not None:
             self._last_tau_by_id[record.id] = record.last_accessed_tau
-        if record.id not in self._active_order:
-            self._active_order.append(record.id)
+        self._active_order.setdefault(record.id, None)
+        self._index_record(record)
+        self._index_tags(record)
+        if self._snapshots is not None:
+            self._snapshots.write(record)
 
     def add(self, record, *, on_collision: Literal["reject", "merge"] = "reject", force: bool = False):
         """Insert a record with explicit collision policy.
@@ -91,6 +566,10 @@ class DecayMemoryStore(MemoryStore):
                 ``on_collision="merge"``. When ``True``, tau regression is
                 allowed for the colliding record.
 
+        When the store is at ``capacity``, inserting a new id first evicts the
+        record with the lowest decayed strength. If that is ``record`` itself,
+        it is reported as a capacity eviction and never inserted.
+
         Raises:
             ValueError: If ``on_collision`` is invalid, a collision is rejected,
                 or merge attempts tau regression without ``force=True``.
@@ -104,36 +583,136 @@ class DecayMemoryStore(MemoryStore):
             self.upsert(record, allow_tau_regression=force)
             return
 
+        if self.capacity is not None and len(self._active_order) >= self.capacity:
+            self._validate_record(record)
+            if not self._evict_for_capacity(record):
+                return
+
         self.upsert(record)
 
+    def _evict_for_capacity(self, record) -> bool:
+        """Make room for ``record``; return ``False`` if ``record`` itself is evicted."""
+        current_tau = getattr(record, "last_accessed_tau", None)
+        incoming_expiry = self.expiry_tau(record)
+        weakest_expiry, weakest_id = self._expiry_index.first()
+        if (incoming_expiry, record.id) <= (weakest_expiry, weakest_id):
+            victim = record
+        else:
+            victim = self._records_by_id[weakest_id]
+            self._forget(weakest_id)
+
+        self.capacity_evictions += 1
+        for listener in self._capacity_listeners:
+            listener(victim, current_tau)
+        return victim is not record
+
     def get(self, record_id: str):
         return self._records_by_id.get(record_id)
 
-    def sweep(self, current_tau: float) -> Tuple[List[Tuple[object, float]], List[object]]:
+    def sweep(self, current_tau: float, *, mode: SweepMode = "full"):
+        """Prune records whose decayed strength is at or below ``prune_threshold``.
+
+        Every forgotten record is passed to the registered eviction listeners
+        after it has been removed from the store, whatever the ``mode``.
+
+        Args:
+            current_tau: Internal time used to evaluate decayed strength.
+            mode: Shape of the return value. ``"full"`` returns
+                ``(survivors, forgotten)`` where survivors are
+                ``(record, strength)`` tuples. ``"count"`` returns
+                ``(survivor_count, forgotten_count)``. ``"ids"`` returns the
+                list of forgotten ids. ``"stream"`` returns only the forgotten
+                count, leaving eviction delivery to the listeners. Only
+                ``"full"`` materializes the survivor list.
+
+        Raises:
+            ValueError: If ``mode`` is not one of :data:`SWEEP_MODES`.
+        """
+        self._check_sweep_mode(mode)
+        survivors, forgotten = self._prune(current_tau, keep_survivors=mode == "full")
+        self._notify_evictions(forgotten, current_tau)
+        return self._sweep_result(mode, survivors, forgotten)
+
+    @staticmethod
+    def _check_sweep_mode(mode: str) -> None:
+        if mode not in SWEEP_MODES:
+            raise ValueError(f"mode must be one of: {', '.join(repr(item) for item in SWEEP_MODES)}")
+
+    def _prune(self, current_tau: float, *, keep_survivors: bool) -> Tuple[List[Tuple[object, float]], List[object]]:
+        """Remove every record at or below the threshold; return ``(survivors, forgotten)``.
+
+        Indexed stores first evaluate the ids the expiry index reports as
+        expired at ``current_tau`` (widened by a small relative slack), in
+        expiry order; ``calculate_strength`` makes the final decision. A
+        candidate it still keeps is re-indexed instead of pruned. ``"full"``
+        mode then evaluates every remaining record anyway, so it also prunes
+        records whose strength or τ was mutated directly; the other modes
+        only see such records once they are re-indexed.
+        """
         survivors: List[Tuple[object, float]] = []
         forgotten: List[object] = []
-        retained_ids: List[str] = []
+
+        if self.decay_rate is not None:
+            cutoff = current_tau + _EXPIRY_SLACK * max(1.0, abs(current_tau))
+            candidates = [record_id for _expiry, record_id in self._expiry_index.irange(None, cutoff)]
+            for record_id in candidates:
+                record = self._records_by_id[record_id]
+                if self._should_prune(self._calculate_strength(record, current_tau)):
+                    forgotten.append(record)
+                    self._forget(record_id)
+                else:
+                    self._last_tau_by_id[record_id] = record.last_accessed_tau
+                    self._index_record(record)
+            if keep_survivors:
+                stale: List[object] = []
+                for record_id in self._active_order:
+                    record = self._records_by_id[record_id]
+                    current_val = self._calculate_strength(record, current_tau)
+                    if self._should_prune(current_val):
+                        stale.append(record)
+                    else:
+                        survivors.append((record, current_val))
+                for record in stale:
+                    self._forget(record.id)
+                forgotten.extend(stale)
+            return survivors, forgotten
 
         for record_id in self._active_order:
             record = self._records_by_id[record_id]
             current_val = self._calculate_strength(record, current_tau)
             if self._should_prune(current_val):
                 forgotten.append(record)
-            else:
+            elif keep_survivors:
                 survivors.append((record, current_val))
-                retained_ids.append(record_id)
 
         for record in forgotten:
-            self._records_by_id.pop(record.id, None)
-            self._last_tau_by_id.pop(record.id, None)
-
-        self._active_order = retained_ids
+            self._forget(record.id)
         return survivors, forgotten
 
+    def _notify_evictions(self, forgotten: List[object], current_tau: float) -> None:
+        for record in forgotten:
+            for listener in self._eviction_listeners:
+                listener(record, current_tau)
+
+    def _sweep_result(self, mode: str, survivors: List[Tuple[object, float]], forgotten: List[object]):
+        if mode == "full":
+            return survivors, forgotten
+        if mode == "count":
+            return len(self.records), len(forgotten)
+        if mode == "ids":
+            return [record.id for record in forgotten]
+        return len(forgotten)
+
     def touch(self, record_id: str, current_tau: float, cooldown: float = 0.0):
         record = self.get(record_id)
         if record is None:
             return None
         updated_strength = record.reconsolidate(current_tau=current_tau, cooldown=cooldown)
-        self._last_tau_by_id[record_id] = record.last_accessed_tau
+        self._reindex_touched(record)
         return updated_strength
+
+    def _reindex_touched(self, record) -> None:
+        self._last_tau_by_id[record.id] = record.last_accessed_tau
+        self._index_record(record)
+        if self._snapshots is not None:
+            self._snapshots.write(record)
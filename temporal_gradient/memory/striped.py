@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from array import array
+from contextlib import ExitStack
+import heapq
+from itertools import chain, islice
+import math
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
+
+from .index import SortedKeyIndex
+from .store import DecayMemoryStore, SweepMode
+from .views import MemoryColumns, StoreView
+
+
+class _StripedStoreView(StoreView):
+    """:class:`StoreView` over every partition of a :class:`StripedMemoryStore`.
+
+    Iteration and ``ids`` walk partition by partition, each in insertion
+    order; ``ids`` is a tuple copied at access time.
+    """
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return sum(len(partition.records) for partition in self._store._partitions)
+
+    def __iter__(self) -> Iterator[object]:
+        for partition in self._store._partitions:
+            yield from partition.records
+
+    def __contains__(self, item) -> bool:
+        record_id = item if isinstance(item, str) else getattr(item, "id", None)
+        if record_id is None:
+            return False
+        return item in self._store._partition(record_id).records
+
+    @property
+    def ids(self) -> Tuple[str, ...]:
+        return tuple(chain.from_iterable(partition.records.ids for partition in self._store._partitions))
+
+    def columns(self, current_tau: Optional[float] = None) -> MemoryColumns:
+        parts = [partition.records.columns(current_tau) for partition in self._store._partitions]
+
+        def _concat(name: str) -> Optional[array]:
+            columns = [getattr(part, name) for part in parts]
+            if columns[0] is None:
+                return None
+            merged = array("d")
+            for column in columns:
+                merged.extend(column)
+            return merged
+
+        return MemoryColumns(
+            ids=tuple(chain.from_iterable(part.ids for part in parts)),
+            strength=_concat("strength"),
+            created_at_tau=_concat("created_at_tau"),
+            last_accessed_tau=_concat("last_accessed_tau"),
+            current_strength=_concat("current_strength"),
+            decay_lambda=_concat("decay_lambda"),
+        )
+
+
+class StripedMemoryStore(DecayMemoryStore):
+    """Thread-safe :class:`DecayMemoryStore` partitioned by record id.
+
+    Records are spread over ``stripes`` independent partitions by id hash.
+    Each partition is a plain :class:`DecayMemoryStore` with its own records,
+    expiry, tau and tag indexes and running sum, guarded by its own
+    re-entrant lock. ``add``, ``upsert``, ``get`` and ``touch`` only lock the
+    partition owning the id, so inserts and touches of ids in different
+    partitions run concurrently.
+
+    ``sweep`` visits the partitions one at a time, pruning each under its own
+    lock, and calls eviction listeners after every lock is released.
+    Aggregates (``total_strength``, forecasts, ``weakest``, range and tag
+    queries) merge per-partition results; ``threshold_for_count`` and
+    ``bulk_load`` hold every partition lock, always acquired in ascending
+    order. Iteration and forgotten records are ordered by partition, not by
+    insertion or expiry.
+
+    With ``capacity``, inserts that overflow the store evict the globally
+    weakest record under a separate capacity lock, which is only taken once
+    the store is full. The incoming record may be the one evicted.
+    """
+
+    def __init__(
+        self,
+        calculate_strength: Callable[[object, float], float],
+        prune_threshold: float,
+        s_max: float = 1.5,
+        *,
+        stripes: int = 16,
+        decay_rate: Optional[float] = None,
+        capacity: Optional[int] = None,
+        snapshot_shards: Optional[int] = None,
+    ):
+        if isinstance(stripes, bool) or not isinstance(stripes, int) or stripes <= 0:
+            raise ValueError("stripes must be a positive integer")
+        super().__init__(
+            calculate_strength,
+            prune_threshold,
+            s_max,
+            decay_rate=decay_rate,
+            capacity=capacity,
+            snapshot_shards=snapshot_shards,
+        )
+        self._partitions: List[DecayMemoryStore] = []
+        for _ in range(stripes):
+            partition = DecayMemoryStore(calculate_strength, prune_threshold, s_max, decay_rate=decay_rate)
+            # All partitions mirror into one publisher so pins see the whole store.
+            partition._snapshots = self._snapshots
+            self._partitions.append(partition)
+        self._stripes: List[threading.RLock] = [threading.RLock() for _ in range(stripes)]
+        self._capacity_lock = threading.Lock()
+        self._view = _StripedStoreView(self)
+
+    def _position(self, record_id: str) -> int:
+        return hash(record_id) % len(self._partitions)
+
+    def _partition(self, record_id: str) -> DecayMemoryStore:
+        return self._partitions[self._position(record_id)]
+
+    def _stripe(self, record_id: str) -> threading.RLock:
+        return self._stripes[self._position(record_id)]
+
+    def _each_partition(self) -> Iterator[DecayMemoryStore]:
+        """Yield partitions in order, each while holding only its own lock."""
+        for partition, stripe in zip(self._partitions, self._stripes):
+            with stripe:
+                yield partition
+
+    def _all_locks(self) -> ExitStack:
+        locks = ExitStack()
+        for stripe in self._stripes:
+            locks.enter_context(stripe)
+        return locks
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @property
+    def active_ids(self) -> Tuple[str, ...]:
+        return self._view.ids
+
+    @property
+    def has_mixed_rates(self) -> bool:
+        return any(partition.has_mixed_rates for partition in self._partitions)
+
+    def upsert(self, record, *, allow_tau_regression: bool = False):
+        with self._stripe(record.id):
+            self._partition(record.id).upsert(record, allow_tau_regression=allow_tau_regression)
+
+    def add(self, record, *, on_collision: Literal["reject", "merge"] = "reject", force: bool = False):
+        """Insert ``record`` into its partition; see :meth:`DecayMemoryStore.add`."""
+        if on_collision not in ("reject", "merge"):
+            raise ValueError("on_collision must be one of: 'reject', 'merge'")
+        partition = self._partition(record.id)
+        with self._stripe(record.id):
+            is_new = partition.get(record.id) is None
+            partition.add(record, on_collision=on_collision, force=force)
+        if is_new and self.capacity is not None and len(self._view) > self.capacity:
+            self._enforce_capacity(getattr(record, "last_accessed_tau", None))
+
+    def _enforce_capacity(self, current_tau: Optional[float]) -> None:
+        with self._capacity_lock:
+            while len(self._view) > self.capacity:
+                victim = self._evict_weakest()
+                if victim is None:
+                    return
+                self.capacity_evictions += 1
+                eviction_tau = getattr(victim, "last_accessed_tau", None) if current_tau is None else current_tau
+                for listener in self._capacity_listeners:
+                    listener(victim, eviction_tau)
+
+    def _evict_weakest(self):
+        while True:
+            weakest = None
+            for position, partition in enumerate(self._each_partition()):
+                entry = partition._expiry_index.first()
+                if entry is not None and (weakest is None or entry < weakest[0]):
+                    weakest = (entry, position)
+            if weakest is None:
+                return None
+            entry, position = weakest
+            partition = self._partitions[position]
+            with self._stripes[position]:
+                # Retry if a concurrent touch or sweep moved the entry.
+                if partition._expiry_index.first() == entry:
+                    victim = partition.get(entry[1])
+                    partition._forget(entry[1])
+                    return victim
+
+    def bulk_load(self, records: Iterable[object], *, current_tau: Optional[float] = None):
+        """Bulk insert under every partition lock; nothing is loaded on a collision.
+
+        Capacity evictions are reported as in :meth:`DecayMemoryStore.bulk_load`.
+        """
+        records = list(records)
+        with self._all_locks():
+            seen: Dict[str, None] = {}
+            for record in records:
+                if record.id in seen or self._partition(record.id).get(record.id) is not None:
+                    raise ValueError(f"record with id {record.id!r} already exists")
+                seen[record.id] = None
+                self._validate_record(record)
+            groups: List[List[object]] = [[] for _ in self._partitions]
+            for record in records:
+                groups[self._position(record.id)].append(record)
+            for partition, group in zip(self._partitions, groups):
+                if group:
+                    partition.bulk_load(group)
+        if self.capacity is not None and len(self._view) > self.capacity:
+            self._enforce_capacity(current_tau)
+        return records
+
+    def get(self, record_id: str):
+        with self._stripe(record_id):
+            return self._partition(record_id).get(record_id)
+
+    def touch(self, record_id: str, current_tau: float, cooldown: float = 0.0):
+        with self._stripe(record_id):
+            return self._partition(record_id).touch(record_id, current_tau, cooldown=cooldown)
+
+    def sweep(self, current_tau: float, *, mode: SweepMode = "full"):
+        """Prune each partition under its own lock; notify after release."""
+        self._check_sweep_mode(mode)
+        survivors: List[Tuple[object, float]] = []
+        forgotten: List[object] = []
+        for partition in self._each_partition():
+            kept, dropped = partition._prune(current_tau, keep_survivors=mode == "full")
+            survivors.extend(kept)
+            forgotten.extend(dropped)
+        self._notify_evictions(forgotten, current_tau)
+        return self._sweep_result(mode, survivors, forgotten)
+
+    def total_strength(self, current_tau: float) -> float:
+        return math.fsum(partition.total_strength(current_tau) for partition in self._each_partition())
+
+    def mean_strength(self, current_tau: float) -> float:
+        count = len(self._view)
+        return 0.0 if not count else self.total_strength(current_tau) / count
+
+    def count_survivors_at(self, future_tau: float, *, prune_threshold: Optional[float] = None) -> int:
+        self._require_expiry_index("count_survivors_at")
+        return sum(
+            partition.count_survivors_at(future_tau, prune_threshold=prune_threshold)
+            for partition in self._each_partition()
+        )
+
+    def threshold_for_count(self, max_records: int, current_tau: float) -> float:
+        """See :meth:`DecayMemoryStore.threshold_for_count`; O(n) merge across partitions."""
+        self._require_expiry_index("threshold_for_count")
+        self._require_uniform_rate("threshold_for_count")
+        if max_records < 0:
+            raise ValueError("max_records must be >= 0")
+        if self.prune_threshold <= 0.0:
+            raise ValueError("threshold_for_count requires a positive store prune_threshold")
+        with self._all_locks():
+            total = len(self._view)
+            if total <= max_records:
+                return 0.0
+            merged = heapq.merge(*(partition._expiry_index for partition in self._partitions))
+            _expiry, record_id = next(islice(merged, total - max_records - 1, None))
+            threshold = self._calculate_strength(self._partition(record_id).get(record_id), current_tau)
+            while self.count_survivors_at(current_tau, prune_threshold=threshold) > max_records:
+                threshold = math.nextafter(threshold, math.inf)
+            return threshold
+
+    def weakest(self) -> Optional[str]:
+        entries = [partition._expiry_index.first() for partition in self._each_partition()]
+        entries = [entry for entry in entries if entry is not None]
+        return min(entries)[1] if entries else None
+
+    def tag_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for partition in self._each_partition():
+            for tag, count in partition.tag_counts().items():
+                counts[tag] = counts.get(tag, 0) + count
+        return counts
+
+    def by_tags(self, tags, current_tau: float, min_strength: float = 0.0, *, match: Literal["all", "any"] = "all"):
+        tags = tuple(tags)
+        return [
+            item
+            for partition in self._each_partition()
+            for item in partition.by_tags(tags, current_tau, min_strength, match=match)
+        ]
+
+    def _merged_range(self, index_name: str, lo: Optional[float], hi: Optional[float]) -> List[object]:
+        runs = []
+        for partition in self._each_partition():
+            index: SortedKeyIndex = getattr(partition, index_name)
+            runs.append([(tau, record_id, partition.get(record_id)) for tau, record_id in index.irange(lo, hi)])
+        return [record for _tau, _record_id, record in heapq.merge(*runs, key=lambda item: item[:2])]
+
+    def created_between(self, lo: Optional[float] = None, hi: Optional[float] = None):
+        return self._merged_range("_created_index", lo, hi)
+
+    def accessed_between(self, lo: Optional[float] = None, hi: Optional[float] = None):
+        return self._merged_range("_accessed_index", lo, hi)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import queue
+import threading
+from typing import Callable, Optional, Tuple, Union
+
+from .columnar import publish_columnar_snapshot
+
+
+@dataclass(frozen=True)
+class SweepEvent:
+    """Result of one background sweep, published to callbacks and queues."""
+
+    tau: float
+    forgotten: Tuple[object, ...]
+    survivor_count: int
+
+
+class BackgroundSweeper:
+    """Prune a :class:`DecayEngine` off the ingestion path as τ advances.
+
+    The sweeper polls ``clock.tau`` and runs ``engine.entropy_sweep`` once τ
+    has advanced by at least ``sweep_interval_tau`` since the previous sweep.
+    Evictions are published as :class:`SweepEvent` values through
+    ``on_evict`` and/or ``eviction_queue`` after the store lock is released,
+    so slow consumers never hold up ingestion.
+
+    With ``snapshot_path`` set, every sweep also publishes a columnar
+    snapshot of the surviving memories for :class:`ColumnarSnapshotReader`
+    readers; the columns are copied under the lock and written after it is
+    released.
+
+    Exceptions raised by ``on_evict`` do not stop sweeping: they are counted
+    in ``consumer_errors``, kept in ``last_consumer_error`` and passed to
+    ``on_error``. An exception from the sweep itself stops the polling
+    thread; it is kept in ``last_error`` (``failed`` turns true), passed to
+    ``on_error`` as soon as it happens, and re-raised by :meth:`stop`.
+
+    The store itself is not synchronized. Ingestion threads must mutate the
+    engine inside ``with sweeper.lock:``; the lock is only held for the store
+    mutation of a sweep, never while publishing.
+    """
+
+    def __init__(
+        self,
+        engine,
+        clock,
+        *,
+        sweep_interval_tau: float,
+        on_evict: Optional[Callable[[SweepEvent], None]] = None,
+        eviction_queue: Optional["queue.Queue[SweepEvent]"] = None,
+        poll_interval: float = 0.05,
+        lock=None,
+        snapshot_path: Optional[Union[str, Path]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> None:
+        if sweep_interval_tau <= 0.0:
+            raise ValueError("sweep_interval_tau must be > 0.0")
+        if poll_interval <= 0.0:
+            raise ValueError("poll_interval must be > 0.0")
+
+        self.engine = engine
+        self.clock = clock
+        self.sweep_interval_tau = float(sweep_interval_tau)
+        self.on_evict = on_evict
+        self.eviction_queue = eviction_queue
+        self.on_error = on_error
+        self.poll_interval = float(poll_interval)
+        self.lock = lock if lock is not None else threading.RLock()
+        self.snapshot_path = None if snapshot_path is None else Path(snapshot_path)
+        self.last_sweep_tau = float(clock.tau)
+        self.sweep_count = 0
+        self.last_error: Optional[BaseException] = None
+        self.consumer_errors = 0
+        self.last_consumer_error: Optional[BaseException] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def failed(self) -> bool:
+        """True once a background sweep raised; cleared by :meth:`stop` and :meth:`start`."""
+        return self.last_error is not None
+
+    def maybe_sweep(self) -> Optional[SweepEvent]:
+        """Sweep if τ advanced by ``sweep_interval_tau``; otherwise return ``None``."""
+        current_tau = float(self.clock.tau)
+        if current_tau - self.last_sweep_tau < self.sweep_interval_tau:
+            return None
+        return self.sweep_now(current_tau)
+
+    def sweep_now(self, current_tau: Optional[float] = None) -> SweepEvent:
+        """Sweep immediately at ``current_tau`` (defaults to ``clock.tau``) and publish."""
+        if current_tau is None:
+            current_tau = float(self.clock.tau)
+        forgotten = []
+
+        def _collect(record, _tau):
+            forgotten.append(record)
+
+        with self.lock:
+            self.engine.store.add_eviction_listener(_collect)
+            try:
+                survivor_count, _ = self.engine.entropy_sweep(current_tau, mode="count")
+            finally:
+                self.engine.store.remove_eviction_listener(_collect)
+            self.last_sweep_tau = current_tau
+            self.sweep_count += 1
+            columns = self.engine.vault.columns() if self.snapshot_path is not None else None
+        if columns is not None:
+            publish_columnar_snapshot(
+                columns,
+                self.snapshot_path,
+                decay_rate=self.engine.store.decay_rate,
+                prune_threshold=self.engine.prune_threshold,
+                published_tau=current_tau,
+            )
+        event = SweepEvent(tau=current_tau, forgotten=tuple(forgotten), survivor_count=survivor_count)
+        self._publish(event)
+        return event
+
+    def _publish(self, event: SweepEvent) -> None:
+        if self.on_evict is not None:
+            try:
+                self.on_evict(event)
+            except Exception as exc:
+                self.consumer_errors += 1
+                self.last_consumer_error = exc
+                self._report(exc)
+        if self.eviction_queue is not None:
+            self.eviction_queue.put(event)
+
+    def _report(self, error: BaseException) -> None:
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(error)
+        except Exception:
+            pass  # a failing error handler must not take the sweeper down with it
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.maybe_sweep()
+            except Exception as exc:  # also re-raised by stop()
+                self.last_error = exc
+                self._report(exc)
+                return
+
+    def start(self) -> "BackgroundSweeper":
+        if self.running:
+            raise RuntimeError("sweeper is already running")
+        self._stop_event.clear()
+        self.last_error = None
+        self._thread = threading.Thread(target=self._run, name="tg-background-sweeper", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the polling thread and re-raise any error it hit while sweeping."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self.last_error is not None:
+            error, self.last_error = self.last_error, None
+            raise RuntimeError("background sweep failed") from error
+
+    def __enter__(self) -> "BackgroundSweeper":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from pathlib import Path
+import pickle
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .index import SortedKeyIndex
+from .sketches import content_fingerprint
+from .store import _EXPIRY_SLACK, DecayMemoryStore, SweepMode
+
+
+@dataclass(frozen=True)
+class ColdMemoryRef:
+    """Decay metadata kept in RAM for a record whose payload lives on disk.
+
+    Carries exactly the fields decay, pruning and indexing read, so sweeps can
+    evaluate and prune cold records without loading their payloads.
+    ``fingerprint`` is the :func:`content_fingerprint` of the content taken
+    at demotion, for consumers that track forgotten content.
+    """
+
+    id: str
+    strength: float
+    last_accessed_tau: float
+    created_at_tau: float = 0.0
+    tags: Tuple[str, ...] = field(default_factory=tuple)
+    decay_lambda: Optional[float] = None
+    fingerprint: Optional[bytes] = None
+
+
+class TieredMemoryStore(DecayMemoryStore):
+    """:class:`DecayMemoryStore` with a hot in-memory tier and a cold on-disk tier.
+
+    After each sweep, surviving records whose decayed strength is below
+    ``hot_strength_band`` are demoted: the full record is pickled to one file
+    per id under ``cold_path`` and replaced in memory by a
+    :class:`ColdMemoryRef`. ``get`` and ``touch`` promote cold records back to
+    the hot tier. Cold records are pruned from their metadata alone and their
+    payload files are deleted without being read.
+
+    With ``decay_rate``, hot records are also indexed by the τ at which they
+    decay to ``hot_strength_band``, so non-full sweeps only evaluate the
+    prefix of that index up to the sweep τ. Full sweeps demote from the
+    survivor strengths they already computed; without ``decay_rate`` every
+    hot record is re-evaluated after the sweep.
+
+    ``records`` and full-mode sweep results contain :class:`ColdMemoryRef`
+    entries for records that are currently cold.
+    """
+
+    def __init__(
+        self,
+        calculate_strength: Callable[[object, float], float],
+        prune_threshold: float,
+        s_max: float = 1.5,
+        *,
+        cold_path: str | Path,
+        hot_strength_band: float,
+        decay_rate: Optional[float] = None,
+        capacity: Optional[int] = None,
+        snapshot_shards: Optional[int] = None,
+    ):
+        if hot_strength_band <= prune_threshold:
+            raise ValueError("hot_strength_band must be > prune_threshold")
+        super().__init__(
+            calculate_strength,
+            prune_threshold,
+            s_max,
+            decay_rate=decay_rate,
+            capacity=capacity,
+            snapshot_shards=snapshot_shards,
+        )
+        self.hot_strength_band = hot_strength_band
+        self.cold_path = Path(cold_path)
+        self.cold_path.mkdir(parents=True, exist_ok=True)
+        self._cold_ids: Set[str] = set()
+        self._demotion_index = SortedKeyIndex()
+        self._demotion_by_id: Dict[str, float] = {}
+
+    def _payload_path(self, record_id: str) -> Path:
+        return self.cold_path / f"{record_id}.pkl"
+
+    @property
+    def cold_ids(self) -> Tuple[str, ...]:
+        return tuple(record_id for record_id in self._active_order if record_id in self._cold_ids)
+
+    def is_cold(self, record_id: str) -> bool:
+        return record_id in self._cold_ids
+
+    def demotion_tau(self, record) -> float:
+        """Return the τ at which ``record`` decays to ``hot_strength_band``; requires ``decay_rate``."""
+        if self.decay_rate is None:
+            raise ValueError("demotion_tau requires decay_rate")
+        strength = record.strength
+        if strength <= 0.0:
+            return -math.inf
+        if self.hot_strength_band <= 0.0:
+            return math.inf
+        return record.last_accessed_tau + math.log(strength / self.hot_strength_band) / self._rate(record)
+
+    def _index_demotion(self, record) -> None:
+        self._unindex_demotion(record.id)
+        demotion = self.demotion_tau(record)
+        self._demotion_by_id[record.id] = demotion
+        self._demotion_index.add(demotion, record.id)
+
+    def _unindex_demotion(self, record_id: str) -> None:
+        demotion = self._demotion_by_id.pop(record_id, None)
+        if demotion is not None:
+            self._demotion_index.discard(demotion, record_id)
+
+    def _index_record(self, record) -> None:
+        super()._index_record(record)
+        if self.decay_rate is not None and record.id not in self._cold_ids:
+            self._index_demotion(record)
+
+    def _rebuild_indexes(self, loaded: List[object]) -> None:
+        super()._rebuild_indexes(loaded)
+        if self.decay_rate is None:
+            return
+        for record in loaded:
+            self._demotion_by_id[record.id] = self.demotion_tau(record)
+        self._demotion_index.rebuild(
+            list(self._demotion_index) + [(self._demotion_by_id[record.id], record.id) for record in loaded]
+        )
+
+    def demote(self, record_id: str) -> bool:
+        """Move a hot record's payload to disk; return whether it was demoted."""
+        record = self._records_by_id.get(record_id)
+        if record is None or record_id in self._cold_ids:
+            return False
+        with self._payload_path(record_id).open("wb") as handle:
+            pickle.dump(record, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        content = getattr(record, "content", None)
+        self._records_by_id[record_id] = ColdMemoryRef(
+            id=record_id,
+            strength=record.strength,
+            last_accessed_tau=record.last_accessed_tau,
+            created_at_tau=getattr(record, "created_at_tau", 0.0),
+            tags=tuple(getattr(record, "tags", ()) or ()),
+            decay_lambda=getattr(record, "decay_lambda", None),
+            fingerprint=None if content is None else content_fingerprint(content),
+        )
+        self._cold_ids.add(record_id)
+        self._unindex_demotion(record_id)
+        if self._snapshots is not None:
+            self._snapshots.write(self._records_by_id[record_id])
+        return True
+
+    def promote(self, record_id: str):
+        """Load a cold record back into RAM and return it (no-op for hot records)."""
+        if record_id not in self._cold_ids:
+            return self._records_by_id.get(record_id)
+        path = self._payload_path(record_id)
+        with path.open("rb") as handle:
+            record = pickle.load(handle)
+        path.unlink()
+        self._cold_ids.discard(record_id)
+        self._records_by_id[record_id] = record
+        if self.decay_rate is not None:
+            self._index_demotion(record)
+        if self._snapshots is not None:
+            self._snapshots.write(record)
+        return record
+
+    def peek(self, record_id: str):
+        """Return the full record without promoting it (reads cold payloads from disk)."""
+        if record_id not in self._cold_ids:
+            return self._records_by_id.get(record_id)
+        with self._payload_path(record_id).open("rb") as handle:
+            return pickle.load(handle)
+
+    def _drop_payload(self, record_id: str) -> None:
+        if record_id in self._cold_ids:
+            self._cold_ids.discard(record_id)
+            self._payload_path(record_id).unlink(missing_ok=True)
+
+    def _forget(self, record_id: str) -> None:
+        self._drop_payload(record_id)
+        self._unindex_demotion(record_id)
+        super()._forget(record_id)
+
+    def upsert(self, record, *, allow_tau_regression: bool = False):
+        self._validate_record(record, allow_tau_regression=allow_tau_regression)
+        self._drop_payload(record.id)
+        super().upsert(record, allow_tau_regression=allow_tau_regression)
+
+    def get(self, record_id: str):
+        return self.promote(record_id)
+
+    def sweep(self, current_tau: float, *, mode: SweepMode = "full"):
+        """Prune both tiers, then demote hot survivors below ``hot_strength_band``."""
+        result = super().sweep(current_tau, mode=mode)
+        if mode == "full":
+            survivors, _forgotten = result
+            candidates = [record.id for record, strength in survivors if strength < self.hot_strength_band]
+        elif self.decay_rate is not None:
+            cutoff = current_tau + _EXPIRY_SLACK * max(1.0, abs(current_tau))
+            candidates = [
+                record_id
+                for _demotion, record_id in self._demotion_index.irange(None, cutoff)
+                if self._calculate_strength(self._records_by_id[record_id], current_tau) < self.hot_strength_band
+            ]
+        else:
+            candidates = [
+                record_id
+                for record_id in self._active_order
+                if record_id not in self._cold_ids
+                and self._calculate_strength(self._records_by_id[record_id], current_tau) < self.hot_strength_band
+            ]
+        for record_id in candidates:
+            self.demote(record_id)
+        return result
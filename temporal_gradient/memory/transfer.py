@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from itertools import chain
+import json
+import math
+from pathlib import Path
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, Literal, Optional, Union
+
+from .serialization import memory_from_dict, memory_to_dict
+
+TransferFormat = Literal["jsonl", "binary"]
+TRANSFER_FORMATS = ("jsonl", "binary")
+BINARY_MAGIC = b"TGMEM\x01"
+
+Source = Union[str, Path, BinaryIO]
+
+# strength, s_max, created_at_tau, last_accessed_tau, decay_lambda, access_count,
+# content kind, then the lengths of id, content and the tag count.
+_FIXED = struct.Struct("<dddddIBHIH")
+_LENGTH = struct.Struct("<H")
+_CONTENT_KINDS = {"str": 0, "bytes": 1, None: 2}
+_NAN = float("nan")
+
+
+@contextmanager
+def _open(target: Source, mode: str):
+    if isinstance(target, (str, Path)):
+        with Path(target).open(mode) as handle:
+            yield handle
+    else:
+        yield target
+
+
+def _optional(value: Optional[float]) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _encode_binary(memory) -> bytes:
+    data = memory_to_dict(memory)
+    record_id = data["id"].encode("utf-8")
+    if "content_bytes" in data:
+        kind, content = "bytes", memory.content
+    elif data["content"] is None:
+        kind, content = None, b""
+    else:
+        kind, content = "str", str(data["content"]).encode("utf-8")
+    tags = [str(tag).encode("utf-8") for tag in data["tags"]]
+    parts = [
+        _FIXED.pack(
+            float(data["strength"]),
+            _optional(data["s_max"]),
+            float(data["created_at_tau"]),
+            float(data["last_accessed_tau"]),
+            _optional(data["decay_lambda"]),
+            int(data["access_count"]),
+            _CONTENT_KINDS[kind],
+            len(record_id),
+            len(content),
+            len(tags),
+        ),
+        record_id,
+        content,
+    ]
+    for tag in tags:
+        parts.append(_LENGTH.pack(len(tag)))
+        parts.append(tag)
+    return b"".join(parts)
+
+
+def _read_exact(handle: BinaryIO, size: int) -> bytes:
+    data = handle.read(size)
+    if len(data) != size:
+        raise ValueError("truncated binary memory export")
+    return data
+
+
+def _decode_binary(handle: BinaryIO, fixed: bytes):
+    strength, s_max, created, accessed, decay_lambda, access_count, kind, id_len, content_len, tag_count = _FIXED.unpack(
+        fixed
+    )
+    record_id = _read_exact(handle, id_len).decode("utf-8")
+    raw_content = _read_exact(handle, content_len)
+    tags = [_read_exact(handle, _LENGTH.unpack(_read_exact(handle, _LENGTH.size))[0]).decode("utf-8") for _ in range(tag_count)]
+    data = {
+        "id": record_id,
+        "tags": tags,
+        "strength": strength,
+        "s_max": None if math.isnan(s_max) else s_max,
+        "created_at_tau": created,
+        "last_accessed_tau": accessed,
+        "access_count": access_count,
+        "decay_lambda": None if math.isnan(decay_lambda) else decay_lambda,
+    }
+    if kind == _CONTENT_KINDS["bytes"]:
+        memory = memory_from_dict({**data, "content": None})
+        memory.content = raw_content
+        return memory
+    data["content"] = raw_content.decode("utf-8") if kind == _CONTENT_KINDS["str"] else None
+    return memory_from_dict(data)
+
+
+def export_memories(
+    memories: Iterable[object],
+    target: Source,
+    *,
+    format: TransferFormat = "jsonl",
+    chunk_size: int = 1024,
+) -> int:
+    """Stream ``memories`` to ``target`` and return how many were written.
+
+    Records are encoded and written ``chunk_size`` at a time, so memory use
+    does not grow with the number of records. ``"jsonl"`` writes one
+    :func:`memory_to_dict` object per line; ``"binary"`` writes a
+    length-prefixed little-endian encoding after a ``BINARY_MAGIC`` header.
+    """
+    if format not in TRANSFER_FORMATS:
+        raise ValueError("format must be one of: 'jsonl', 'binary'")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+    count = 0
+    with _open(target, "wb") as handle:
+        if format == "binary":
+            handle.write(BINARY_MAGIC)
+        chunk: List[bytes] = []
+        for memory in memories:
+            if format == "binary":
+                chunk.append(_encode_binary(memory))
+            else:
+                chunk.append(json.dumps(memory_to_dict(memory), sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\n")
+            count += 1
+            if len(chunk) >= chunk_size:
+                handle.write(b"".join(chunk))
+                chunk.clear()
+        handle.write(b"".join(chunk))
+    return count
+
+
+def iter_memories(source: Source) -> Iterator[object]:
+    """Yield memories from an :func:`export_memories` file, detecting its format.
+
+    Caller-owned streams are read in place and left open.
+    """
+    with _open(source, "rb") as handle:
+        head = handle.read(len(BINARY_MAGIC))
+        if head == BINARY_MAGIC:
+            while True:
+                fixed = handle.read(_FIXED.size)
+                if not fixed:
+                    return
+                if len(fixed) != _FIXED.size:
+                    raise ValueError("truncated binary memory export")
+                yield _decode_binary(handle, fixed)
+        else:
+            # The format probe consumed the start of the first line.
+            for line in chain((head + handle.readline()).splitlines(keepends=True), handle):
+                if line.strip():
+                    yield memory_from_dict(json.loads(line))
+
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, KeysView, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .store import DecayMemoryStore
+
+
+@dataclass(frozen=True)
+class MemoryColumns:
+    """Columnar copy of store metadata, one entry per record in store order.
+
+    ``current_strength`` is only populated when the snapshot was taken with a
+    ``current_tau``; ``decay_lambda`` holds each record's effective rate and
+    is only populated for stores with a ``decay_rate``.
+    """
+
+    ids: Tuple[str, ...]
+    strength: array
+    created_at_tau: array
+    last_accessed_tau: array
+    current_strength: Optional[array] = None
+    decay_lambda: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class StoreView(Collection):
+    """Read-only, zero-copy view over a :class:`DecayMemoryStore`.
+
+    Creating a view is O(1) and nothing is copied on access: ``len`` and id
+    membership are O(1), iteration walks the store in place. Like ``dict``
+    iteration, iterating a view raises ``RuntimeError`` as soon as the store
+    is structurally mutated (insert, replace or removal) mid-iteration.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: "DecayMemoryStore") -> None:
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store._active_order)
+
+    def __iter__(self) -> Iterator[object]:
+        store = self._store
+        version = store._version
+        records_by_id = store._records_by_id
+        for record_id in store._active_order:
+            if store._version != version:
+                raise RuntimeError("memory store mutated during iteration")
+            yield records_by_id[record_id]
+        if store._version != version:
+            raise RuntimeError("memory store mutated during iteration")
+
+    def __contains__(self, item) -> bool:
+        """Membership by id string, or by record identity for record objects."""
+        if isinstance(item, str):
+            return item in self._store._records_by_id
+        record_id = getattr(item, "id", None)
+        return record_id is not None and self._store._records_by_id.get(record_id) is item
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={len(self)})"
+
+    @property
+    def ids(self) -> KeysView[str]:
+        """Live, read-only view of record ids in store order."""
+        return self._store._active_order.keys()
+
+    def columns(self, current_tau: Optional[float] = None) -> MemoryColumns:
+        """Copy decay metadata into compact ``array('d')`` columns in one pass."""
+        store = self._store
+        ids = tuple(store._active_order)
+        records = [store._records_by_id[record_id] for record_id in ids]
+        current_strength = None
+        decay_lambda = None
+        if store.decay_rate is not None:
+            decay_lambda = array("d", (store._rate(record) for record in records))
+        if current_tau is not None:
+            current_strength = array("d", (store._calculate_strength(record, current_tau) for record in records))
+        return MemoryColumns(
+            ids=ids,
+            strength=array("d", (record.strength for record in records)),
+            created_at_tau=array("d", (getattr(record, "created_at_tau", 0.0) for record in records)),
+            last_accessed_tau=array("d", (record.last_accessed_tau for record in records)),
+            current_strength=current_strength,
+            decay_lambda=decay_lambda,
+        )
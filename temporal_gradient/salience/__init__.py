@@ -1,8 +1,11 @@
 from .embedding_novelty import DictEmbeddingCache, JsonDirectoryEmbeddingCache, NoveltyScorer
+from .keywords import KeywordMatcher
+from .minhash_novelty import MinHashNovelty
 from .pipeline import (
     CodexNoveltyAdapter,
     CodexValueAdapter,
     KeywordImperativeValue,
+    PreparedText,
     RollingJaccardNovelty,
     ResettableScorer,
     SalienceComponents,
@@ -17,7 +20,10 @@ __all__ = [
     "DictEmbeddingCache",
     "JsonDirectoryEmbeddingCache",
     "KeywordImperativeValue",
+    "KeywordMatcher",
+    "MinHashNovelty",
     "NoveltyScorer",
+    "PreparedText",
     "RollingJaccardNovelty",
     "ResettableScorer",
     "SalienceComponents",
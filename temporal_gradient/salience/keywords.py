@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+def _is_word(char: str) -> bool:
+    # Same test as ``\w`` in a ``str`` regex.
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Single-pass Aho-Corasick matcher with regex ``\\b`` semantics.
+
+    ``count(text)`` equals the number of keywords ``k`` for which
+    ``re.search(rf"\\b{re.escape(k)}\\b", text)`` succeeds, duplicates
+    included, but scans ``text`` once regardless of how many keywords there
+    are. Keywords are matched as given; callers lowercase both sides.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._weights: List[int] = []
+        self._lengths: List[int] = []
+        self._empty_weight = 0
+        pattern_ids: Dict[str, int] = {}
+        goto: List[Dict[str, int]] = [{}]
+        terminal: List[List[int]] = [[]]
+        for keyword in keywords:
+            if not keyword:
+                self._empty_weight += 1
+                continue
+            pattern = pattern_ids.get(keyword)
+            if pattern is not None:
+                self._weights[pattern] += 1
+                continue
+            pattern = pattern_ids[keyword] = len(self._weights)
+            self._weights.append(1)
+            self._lengths.append(len(keyword))
+            node = 0
+            for char in keyword:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto.append({})
+                    terminal.append([])
+                    goto[node][char] = child
+                node = child
+            terminal[node].append(pattern)
+
+        fail = [0] * len(goto)
+        outputs: List[Tuple[int, ...]] = [()] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            outputs[node] = tuple(terminal[node]) + outputs[fail[node]]
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                queue.append(child)
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def __len__(self) -> int:
+        return sum(self._weights) + self._empty_weight
+
+    def count(self, text: str) -> int:
+        """Number of keywords occurring in ``text`` between word boundaries."""
+        length = len(text)
+
+        def boundary(position: int) -> bool:
+            before = position > 0 and _is_word(text[position - 1])
+            after = position < length and _is_word(text[position])
+            return before != after
+
+        hits = self._empty_weight if self._empty_weight and any(_is_word(char) for char in text) else 0
+        remaining = len(self._weights)
+        found = [False] * remaining
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern in outputs[node]:
+                if found[pattern] or not boundary(end) or not boundary(end - lengths[pattern]):
+                    continue
+                found[pattern] = True
+                hits += self._weights[pattern]
+                remaining -= 1
+            if not remaining:
+                break
+        return hits
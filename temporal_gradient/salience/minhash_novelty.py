@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+from temporal_gradient.memory.minhash import LSHIndex, MinHasher, shingles
+
+from .pipeline import PreparedText
+
+
+class MinHashNovelty:
+    """Approximate rolling-window Jaccard novelty for very large windows.
+
+    Each event keeps only its MinHash signature (``num_perm`` integers), so
+    history memory is fixed per event regardless of its token count. An LSH
+    index with ``bands`` bands restricts comparisons to events sharing a band;
+    the maximum estimated similarity among those candidates stands in for
+    :class:`RollingJaccardNovelty`'s exact ``H_jaccard_max``. More
+    permutations lower the estimate's error (~``1/sqrt(num_perm)``); fewer
+    rows per band catch less similar pairs at the cost of more candidates.
+
+    Signatures are seeded from ``seed`` and events are keyed by their
+    position in the run, so replays after :meth:`reset` score identically.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 10_000,
+        *,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 1,
+        seed: int = 1,
+    ) -> None:
+        if window_size <= 0:
+            raise ValueError("window_size must be > 0")
+        if shingle_size <= 0:
+            raise ValueError("shingle_size must be > 0")
+        self.window_size = window_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self._hasher = MinHasher(num_perm=num_perm, seed=seed)
+        self._index = LSHIndex(num_perm=num_perm, bands=bands)
+        self._window: Deque[str] = deque()
+        self._sequence = 0
+
+    def reset(self) -> None:
+        """Clear signature history, preserving hashing and window configuration."""
+        self._index.clear()
+        self._window.clear()
+        self._sequence = 0
+
+    def _remember(self, signature) -> None:
+        key = str(self._sequence)
+        self._sequence += 1
+        self._window.append(key)
+        if signature is not None:
+            self._index.insert(key, signature)
+        while len(self._window) > self.window_size:
+            self._index.remove(self._window.popleft())
+
+    def score(self, text: str) -> Tuple[float, Dict[str, float], Dict[str, str]]:
+        return self.score_prepared(PreparedText.from_text(text))
+
+    def score_prepared(self, prepared: PreparedText) -> Tuple[float, Dict[str, float], Dict[str, str]]:
+        if self.shingle_size == 1:
+            tokens = prepared.token_set
+        else:
+            tokens = shingles(prepared.text, self.shingle_size)
+        signature = self._hasher.signature(tokens)
+        max_similarity = 0.0
+        if signature is not None:
+            best = self._index.query(signature, 0.0)
+            if best is not None:
+                max_similarity = best[1]
+        novelty = max(0.0, min(1.0, 1.0 - max_similarity)) if tokens else 0.0
+        self._remember(signature)
+
+        diagnostics = {
+            "H_jaccard_max": max_similarity,
+            "H_tokens": float(len(tokens)),
+            "H_history": float(len(self._window)),
+        }
+        return novelty, diagnostics, {
+            "method": "minhash_lsh_jaccard_window",
+            "window_size": str(self.window_size),
+            "token_count": str(len(tokens)),
+            "num_perm": str(self.num_perm),
+            "bands": str(self.bands),
+            "seed": str(self.seed),
+        }
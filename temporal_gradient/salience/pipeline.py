@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Protocol, Tuple, TYPE_CHECKING, runtime_checkable
+from typing import (
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TYPE_CHECKING,
+    runtime_checkable,
+)
 import re
 
+from .keywords import KeywordMatcher
+
 if TYPE_CHECKING:
     from codex_valuation import CodexValuator
 
@@ -13,7 +28,9 @@ class NoveltyScorer(Protocol):
 
     Implementations may be stateless or history-aware. If mutable runtime
     history is used, implement :class:`ResettableScorer` as well so callers can
-    clear run-local state before deterministic replay.
+    clear run-local state before deterministic replay. Implementations may
+    also provide ``score_prepared(prepared)`` taking a :class:`PreparedText`,
+    which the pipeline calls instead of ``score`` to share preprocessing.
     """
 
     def score(self, text: str) -> Tuple[float, Dict[str, float], Dict[str, str]]:
@@ -68,58 +85,232 @@ class SalienceComponents:
         return dict(self.provenance)
 
 
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+@dataclass(frozen=True)
+class PreparedText:
+    """Per-event text preprocessing shared by the scorers of one evaluation.
+
+    :meth:`SaliencePipeline.evaluate` builds one instance per event and hands
+    it to every scorer that implements ``score_prepared(prepared)``; other
+    scorers are called with ``score(text)``.
+    """
+
+    text: str
+    lowered: str
+    tokens: Tuple[str, ...]
+    token_set: FrozenSet[str]
+
+    @classmethod
+    def from_text(cls, text: str) -> "PreparedText":
+        lowered = text.lower()
+        tokens = tuple(_TOKEN_PATTERN.findall(lowered))
+        return cls(text=text, lowered=lowered, tokens=tokens, token_set=frozenset(tokens))
+
+
+_SEQUENCE_MASK = 0xFFFFFFFF
+
+
+class _IntQueue:
+    """FIFO of ints packed in an ``array``, indexed from its oldest item.
+
+    ``popleft`` advances a head offset; the consumed prefix is deleted once
+    it makes up half the array, so appends and pops are amortized O(1).
+    """
+
+    __slots__ = ("items", "head")
+
+    def __init__(self, typecode: str) -> None:
+        self.items = array(typecode)
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.items) - self.head
+
+    def __getitem__(self, offset: int) -> int:
+        return self.items[self.head + offset]
+
+    def __setitem__(self, offset: int, value: int) -> None:
+        self.items[self.head + offset] = value
+
+    def append(self, value: int) -> None:
+        self.items.append(value)
+
+    def popleft(self, count: int = 1) -> None:
+        self.head += count
+        if self.head * 2 >= len(self.items):
+            del self.items[: self.head]
+            self.head = 0
+
+
 class RollingJaccardNovelty:
-    def __init__(self, window_size: int = 5) -> None:
-        self.window_size = window_size
-        self._history: List[set[str]] = []
-        self._token_pattern = re.compile(r"[a-z0-9']+")
+    """Novelty as one minus the maximum Jaccard similarity to recent events.
+
+    The window is a deque of ``(sequence, tokens)`` entries with a
+    token -> postings index over it, maintained as entries enter and leave.
+    Scoring counts shared tokens per window entry from the postings of the
+    new event's tokens, so cost follows token overlap rather than
+    ``window_size``; similarities are exactly ``|A & B| / |A | B|``.
+
+    With ``compact_history=True`` the window holds no per-entry or per-token
+    Python containers. Tokens are interned into an int vocabulary, and every
+    token occurrence in the window is a slot in three parallel ``array('I')``
+    columns: its token id, its entry's sequence (mod 2**32), and the distance
+    to the next occurrence of the same token. Each token id keeps the slots
+    of its oldest and newest occurrence, so its postings are a chain through
+    the slot arrays, at 12 bytes per token occurrence. Entries
+    leave oldest first, so an expiring slot is always the head of its
+    token's chain. Ids are recycled once no window entry uses them, so the
+    vocabulary is bounded by the window's distinct tokens. Scores are
+    identical in both modes.
+    """
 
-    def _tokenize(self, text: str) -> set[str]:
-        return set(self._token_pattern.findall(text.lower()))
+    def __init__(self, window_size: int = 5, *, compact_history: bool = False) -> None:
+        self.window_size = window_size
+        self.compact_history = compact_history
+        self._history: Deque[Tuple[int, FrozenSet[str]]] = deque()
+        self._postings: Dict[str, Dict[int, None]] = {}
+        self._sizes: Dict[int, int] = {}
+        self._sequence = 0
+        self._init_compact()
+
+    def _init_compact(self) -> None:
+        self._vocabulary: Dict[str, int] = {}
+        self._token_by_id: List[Optional[str]] = []
+        self._free_ids: List[int] = []
+        # Per token id: absolute slot of its oldest and newest occurrence.
+        self._first_slot = array("q")
+        self._last_slot = array("q")
+        # Per slot: token id, entry sequence mod 2**32, distance to the next occurrence (0 for none).
+        self._slot_ids = _IntQueue("I")
+        self._slot_sequences = _IntQueue("I")
+        self._slot_next = _IntQueue("I")
+        self._slots_expired = 0
+        self._entry_sizes = _IntQueue("I")
 
     def reset(self) -> None:
         """Clear only rolling token history, preserving configured window size."""
         self._history.clear()
-
-    def score(self, text: str) -> Tuple[float, Dict[str, float], Dict[str, str]]:
-        tokens = self._tokenize(text)
-        if not tokens:
-            self._history.append(tokens)
-            if len(self._history) > self.window_size:
-                self._history = self._history[-self.window_size :]
-            return (
-                0.0,
-                {
-                    "H_jaccard_max": 0.0,
-                    "H_tokens": 0.0,
-                    "H_history": float(len(self._history)),
-                },
-                {
-                    "window_size": str(self.window_size),
-                    "token_count": str(len(tokens)),
-                },
+        self._postings.clear()
+        self._sizes.clear()
+        self._sequence = 0
+        self._init_compact()
+
+    def _history_length(self) -> int:
+        return len(self._entry_sizes) if self.compact_history else len(self._history)
+
+    def _intern(self, token: str) -> int:
+        token_id = self._vocabulary.get(token)
+        if token_id is None:
+            if self._free_ids:
+                token_id = self._free_ids.pop()
+                self._token_by_id[token_id] = token
+                self._first_slot[token_id] = self._last_slot[token_id] = -1
+            else:
+                token_id = len(self._token_by_id)
+                self._token_by_id.append(token)
+                self._first_slot.append(-1)
+                self._last_slot.append(-1)
+            self._vocabulary[token] = token_id
+        return token_id
+
+    def _release(self, token_id: int) -> None:
+        del self._vocabulary[self._token_by_id[token_id]]
+        self._token_by_id[token_id] = None
+        self._free_ids.append(token_id)
+
+    def _max_similarity(self, tokens: FrozenSet[str]) -> float:
+        shared: Dict[int, int] = {}
+        if self.compact_history:
+            expired = self._slots_expired
+            sequences, following = self._slot_sequences, self._slot_next
+            for token in tokens:
+                token_id = self._vocabulary.get(token)
+                slot = -1 if token_id is None else self._first_slot[token_id]
+                while slot >= 0:
+                    sequence = sequences[slot - expired]
+                    shared[sequence] = shared.get(sequence, 0) + 1
+                    step = following[slot - expired]
+                    slot = slot + step if step else -1
+            if not shared:
+                return 0.0
+            sizes, oldest = self._entry_sizes, self._sequence - len(self._entry_sizes)
+            return max(
+                count / (len(tokens) + sizes[(sequence - oldest) & _SEQUENCE_MASK] - count)
+                for sequence, count in shared.items()
             )
-        max_similarity = 0.0
-
-        if tokens and self._history:
-            for past_tokens in self._history:
-                union = tokens | past_tokens
-                if not union:
-                    similarity = 0.0
+        for token in tokens:
+            for sequence in self._postings.get(token, ()):
+                shared[sequence] = shared.get(sequence, 0) + 1
+        if not shared:
+            return 0.0
+        return max(count / (len(tokens) + self._sizes[sequence] - count) for sequence, count in shared.items())
+
+    def _remember(self, tokens: FrozenSet[str]) -> None:
+        if self.compact_history:
+            self._remember_compact(tokens)
+            return
+        sequence = self._sequence
+        self._sequence += 1
+        self._history.append((sequence, tokens))
+        self._sizes[sequence] = len(tokens)
+        for token in tokens:
+            self._postings.setdefault(token, {})[sequence] = None
+        while self.window_size > 0 and len(self._history) > self.window_size:
+            expired, expired_tokens = self._history.popleft()
+            del self._sizes[expired]
+            for token in expired_tokens:
+                postings = self._postings[token]
+                del postings[expired]
+                if not postings:
+                    del self._postings[token]
+
+    def _remember_compact(self, tokens: FrozenSet[str]) -> None:
+        sequence = self._sequence
+        self._sequence += 1
+        expired = self._slots_expired
+        for token in tokens:
+            token_id = self._intern(token)
+            slot = expired + len(self._slot_ids)
+            self._slot_ids.append(token_id)
+            self._slot_sequences.append(sequence & _SEQUENCE_MASK)
+            self._slot_next.append(0)
+            previous = self._last_slot[token_id]
+            if previous < 0:
+                self._first_slot[token_id] = slot
+            else:
+                self._slot_next[previous - expired] = slot - previous
+            self._last_slot[token_id] = slot
+        self._entry_sizes.append(len(tokens))
+        while self.window_size > 0 and len(self._entry_sizes) > self.window_size:
+            count = self._entry_sizes[0]
+            self._entry_sizes.popleft()
+            for offset in range(count):
+                token_id = self._slot_ids[offset]
+                step = self._slot_next[offset]
+                if step:
+                    self._first_slot[token_id] += step
                 else:
-                    similarity = len(tokens & past_tokens) / len(union)
-                max_similarity = max(max_similarity, similarity)
+                    self._release(token_id)
+            self._slot_ids.popleft(count)
+            self._slot_sequences.popleft(count)
+            self._slot_next.popleft(count)
+            self._slots_expired += count
 
-        novelty = max(0.0, min(1.0, 1.0 - max_similarity))
+    def score(self, text: str) -> Tuple[float, Dict[str, float], Dict[str, str]]:
+        return self.score_prepared(PreparedText.from_text(text))
 
-        self._history.append(tokens)
-        if len(self._history) > self.window_size:
-            self._history = self._history[-self.window_size :]
+    def score_prepared(self, prepared: PreparedText) -> Tuple[float, Dict[str, float], Dict[str, str]]:
+        tokens = prepared.token_set
+        max_similarity = self._max_similarity(tokens) if tokens else 0.0
+        novelty = max(0.0, min(1.0, 1.0 - max_similarity)) if tokens else 0.0
+        self._remember(tokens)
 
         diagnostics = {
             "H_jaccard_max": max_similarity,
             "H_tokens": float(len(tokens)),
-            "H_history": float(len(self._history)),
+            "H_history": float(self._history_length()),
         }
         return novelty, diagnostics, {
             "window_size": str(self.window_size),
@@ -141,14 +332,13 @@ class KeywordImperativeValue:
         self.base_value = base_value
         self.hit_value = hit_value
         self.max_value = max_value
-        self._patterns = [re.compile(rf"\b{re.escape(keyword.lower())}\b") for keyword in self.keywords]
+        self._matcher = KeywordMatcher(keyword.lower() for keyword in self.keywords)
 
     def score(self, text: str) -> Tuple[float, Dict[str, float], Dict[str, str]]:
-        lowered = text.lower()
-        hits = 0
-        for pattern in self._patterns:
-            if pattern.search(lowered):
-                hits += 1
+        return self.score_prepared(PreparedText.from_text(text))
+
+    def score_prepared(self, prepared: PreparedText) -> Tuple[float, Dict[str, float], Dict[str, str]]:
+        hits = self._matcher.count(prepared.lowered)
         value = min(self.max_value, self.base_value + (self.hit_value * hits))
         value = max(0.0, min(1.0, value))
         diagnostics = {
@@ -168,8 +358,9 @@ class SaliencePipeline:
         self.value_scorer = value_scorer
 
     def evaluate(self, text: str) -> SalienceComponents:
-        novelty, novelty_diag, novelty_provenance = self.novelty_scorer.score(text)
-        value, value_diag, value_provenance = self.value_scorer.score(text)
+        prepared = PreparedText.from_text(text)
+        novelty, novelty_diag, novelty_provenance = self._score(self.novelty_scorer, prepared)
+        value, value_diag, value_provenance = self._score(self.value_scorer, prepared)
         novelty = max(0.0, min(1.0, novelty))
         value = max(0.0, min(1.0, value))
         psi = max(0.0, min(1.0, novelty * value))
@@ -187,6 +378,13 @@ class SaliencePipeline:
             provenance=provenance,
         )
 
+    @staticmethod
+    def _score(scorer, prepared: PreparedText) -> Tuple[float, Dict[str, float], Dict[str, str]]:
+        score_prepared = getattr(scorer, "score_prepared", None)
+        if score_prepared is not None:
+            return score_prepared(prepared)
+        return scorer.score(prepared.text)
+
     def reset(self) -> None:
         """Reset runtime scorer state while preserving configured components.
 
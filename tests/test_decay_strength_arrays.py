@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+from temporal_gradient.memory.decay import decay_strength
+
+np = pytest.importorskip("numpy")
+
+STRENGTHS = [0.0, 0.2, 0.5, 1.0, 1.2, 1.5]
+ELAPSED = [-3.0, 0.0, 0.5, 1.0, 7.25, 50.0, 400.0]
+
+
+def _scalar_grid(**kwargs):
+    return [[decay_strength(strength, elapsed, **kwargs) for elapsed in ELAPSED] for strength in STRENGTHS]
+
+
+@pytest.mark.parametrize("kwargs", [{"half_life": 10.0}, {"decay_lambda": 0.07}, {"half_life": 3.0, "decay_lambda": 0.5}])
+def test_array_path_matches_scalar_path_elementwise(kwargs):
+    grid = decay_strength(np.array(STRENGTHS)[:, None], np.array(ELAPSED), **kwargs)
+
+    assert grid.shape == (len(STRENGTHS), len(ELAPSED))
+    assert grid.dtype == np.float64
+    np.testing.assert_array_equal(grid, np.array(_scalar_grid(**kwargs)))
+
+
+@pytest.mark.parametrize("kwargs", [{"half_life": 7.3}, {"decay_lambda": 0.093}])
+def test_array_path_is_bit_identical_on_a_dense_grid(kwargs):
+    strengths = [0.37, 1.0, 1.4999]
+    elapsed = [idx * 0.173 for idx in range(-10, 991)]
+    grid = decay_strength(np.array(strengths)[:, None], np.array(elapsed), **kwargs)
+
+    expected = [[decay_strength(strength, tau, **kwargs) for tau in elapsed] for strength in strengths]
+    assert grid.tolist() == expected
+
+
+def test_array_path_broadcasts_scalar_operands():
+    by_elapsed = decay_strength(1.0, np.array(ELAPSED), decay_lambda=0.1)
+    by_strength = decay_strength(np.array(STRENGTHS), 5.0, half_life=10.0)
+
+    assert [float(value) for value in by_elapsed] == pytest.approx([math.exp(-0.1 * max(0.0, tau)) for tau in ELAPSED])
+    assert [float(value) for value in by_strength] == pytest.approx([strength * 0.5**0.5 for strength in STRENGTHS])
+
+
+def test_array_path_clamps_and_validates():
+    assert float(decay_strength(np.array([-1.0]), np.array([0.0]), decay_lambda=0.1)[0]) == 0.0
+    with pytest.raises(ValueError):
+        decay_strength(np.array([1.0]), np.array([1.0]))
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 import pytest
 
 from temporal_gradient.salience.embedding_novelty import DictEmbeddingCache, NoveltyScorer
@@ -173,3 +176,19 @@ def test_operational_provenance_validation_fails_for_wrong_reason() -> None:
 
     with pytest.raises(ValueError, match=r"\[reason\]"):
         scorer.score(text)
+
+
+def test_cache_key_is_the_digest_of_the_json_payload() -> None:
+    scorer = _make_scorer(cache_backend=DictEmbeddingCache(), deterministic_mode=True)
+    texts = ["alpha", 'quote " and \\ backslash', "naïve ☃ \n tab\t"]
+    for text in texts:
+        payload = {
+            "text": text,
+            "model_id": scorer.model_id,
+            "model_hash": scorer.model_hash,
+            "novelty_method": scorer.novelty_method,
+            "window_size": scorer.window_size,
+            "quantization": scorer.quantization,
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        assert scorer._cache_key(text) == hashlib.sha256(encoded).hexdigest()
@@ -118,3 +118,29 @@ def test_entropy_sweep_pruning_uses_canonical_exponential_decay():
 
     assert survivor.id in survivor_ids
     assert forgotten.id in forgotten_ids
+
+
+def test_total_and_mean_strength_track_add_touch_and_prune():
+    engine = DecayEngine(decay_lambda=0.1, prune_threshold=0.2)
+    memories = [EntropicMemory(f"m{idx}", initial_weight=weight) for idx, weight in enumerate((1.2, 0.9, 0.25))]
+    for offset, memory in enumerate(memories):
+        engine.add_memory(memory, current_tau=float(offset))
+    engine.touch_memory(memories[1].id, current_tau=4.0)
+    engine.entropy_sweep(current_tau=6.0)
+
+    expected = [engine.calculate_current_strength(memory, 7.0) for memory in engine.vault]
+    assert len(expected) == 2
+    assert math.isclose(engine.total_strength(7.0), sum(expected), rel_tol=1e-12)
+    assert math.isclose(engine.mean_strength(7.0), sum(expected) / 2, rel_tol=1e-12)
+
+
+def test_total_strength_rebases_over_long_tau_spans():
+    engine = DecayEngine(decay_lambda=0.5, prune_threshold=0.0)
+    for step in range(400):
+        engine.add_memory(EntropicMemory(f"m{step}", initial_weight=1.0), current_tau=float(step * 10))
+
+    current_tau = 3990.0
+    expected = sum(engine.calculate_current_strength(memory, current_tau) for memory in engine.vault)
+    assert math.isfinite(engine.total_strength(current_tau))
+    assert math.isclose(engine.total_strength(current_tau), expected, rel_tol=1e-12)
+    assert DecayEngine().mean_strength(0.0) == 0.0
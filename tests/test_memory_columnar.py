@@ -0,0 +1,93 @@
+import math
+import subprocess
+import sys
+
+import pytest
+
+from temporal_gradient.memory.columnar import ColumnarSnapshotReader
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.sweeper import BackgroundSweeper
+
+
+class _Clock:
+    def __init__(self, tau=0.0):
+        self.tau = tau
+
+
+def _engine():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2)
+    for idx in range(25):
+        memory = EntropicMemory(f"m{idx}", initial_weight=0.3 + 0.04 * idx, decay_lambda=0.02 if idx % 4 == 0 else None)
+        engine.add_memory(memory, current_tau=float(idx % 7))
+    return engine
+
+
+def test_reader_answers_strength_top_k_and_tau_range_queries(tmp_path):
+    engine = _engine()
+    path = engine.publish_columnar_snapshot(tmp_path / "memories.col", current_tau=7.0)
+
+    with ColumnarSnapshotReader(path) as reader:
+        assert len(reader) == 25
+        assert reader.published_tau == 7.0
+        assert reader.prune_threshold == 0.2
+        for memory in engine.vault:
+            assert math.isclose(reader.strength_of(memory.id, 12.0), engine.calculate_current_strength(memory, 12.0), rel_tol=1e-12)
+        assert reader.strength_of("missing", 12.0) is None
+
+        ranked = sorted(engine.vault, key=lambda memory: engine.calculate_current_strength(memory, 12.0), reverse=True)
+        assert [record_id for record_id, _ in reader.top_k(5, 12.0)] == [memory.id for memory in ranked[:5]]
+        assert reader.accessed_between(2.0, 3.0) == [memory.id for memory in engine.memories_accessed_between(2.0, 3.0)]
+        assert reader.created_between(hi=1.0) == [memory.id for memory in engine.memories_created_between(None, 1.0)]
+        assert list(reader.strengths(12.0)) == pytest.approx([engine.calculate_current_strength(m, 12.0) for m in engine.vault])
+
+
+def test_readers_keep_their_snapshot_while_the_writer_republishes(tmp_path):
+    engine = _engine()
+    path = tmp_path / "memories.col"
+    engine.publish_columnar_snapshot(path)
+    reader = ColumnarSnapshotReader(path)
+
+    engine.entropy_sweep(current_tau=20.0)
+    engine.publish_columnar_snapshot(path)
+
+    assert reader.stale
+    assert len(reader) == 25
+    with ColumnarSnapshotReader(path) as fresh:
+        assert len(fresh) == len(engine.vault) < 25
+        assert not fresh.stale
+    reader.close()
+
+
+def test_snapshot_is_readable_from_another_process(tmp_path):
+    engine = _engine()
+    path = engine.publish_columnar_snapshot(tmp_path / "memories.col")
+    script = (
+        "import sys\n"
+        "from temporal_gradient.memory.columnar import ColumnarSnapshotReader\n"
+        "with ColumnarSnapshotReader(sys.argv[1]) as reader:\n"
+        "    print(reader.top_k(1, 7.0)[0][0])\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script, str(path)], capture_output=True, text=True, check=True)
+
+    with ColumnarSnapshotReader(path) as reader:
+        assert output.stdout.strip() == reader.top_k(1, 7.0)[0][0]
+
+
+def test_background_sweeper_publishes_after_each_sweep(tmp_path):
+    engine = _engine()
+    clock = _Clock(0.0)
+    path = tmp_path / "live.col"
+    sweeper = BackgroundSweeper(engine, clock, sweep_interval_tau=5.0, snapshot_path=path)
+
+    sweeper.sweep_now(30.0)
+
+    with ColumnarSnapshotReader(path) as reader:
+        assert reader.published_tau == 30.0
+        assert len(reader) == len(engine.vault)
+
+
+def test_reader_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bogus.col"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        ColumnarSnapshotReader(path)
@@ -0,0 +1,62 @@
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.minhash import LSHIndex, MinHasher, shingles
+
+
+def test_minhash_signatures_are_deterministic_and_estimate_jaccard():
+    left = shingles("scan ok item A123 qty 1 station 7 lane 3 zone north")
+    right = shingles("scan ok item A123 qty 2 station 7 lane 3 zone north")
+    exact = len(left & right) / len(left | right)
+
+    hasher = MinHasher(num_perm=256)
+    estimate = MinHasher.similarity(hasher.signature(left), hasher.signature(right))
+
+    assert MinHasher(num_perm=256).signature(left) == hasher.signature(left)
+    assert estimate == pytest.approx(exact, abs=0.15)
+    assert hasher.signature(set()) is None
+
+
+def test_lsh_index_query_and_remove():
+    hasher = MinHasher(num_perm=64)
+    index = LSHIndex(num_perm=64, bands=16)
+    index.insert("a", hasher.signature(shingles("freezer temp out of range")))
+    index.insert("b", hasher.signature(shingles("badge unknown door receiving")))
+
+    match = index.query(hasher.signature(shingles("freezer temp out of range")), 0.9)
+    assert match == ("a", 1.0)
+
+    assert index.remove("a")
+    assert index.query(hasher.signature(shingles("freezer temp out of range")), 0.9) is None
+    with pytest.raises(ValueError):
+        LSHIndex(num_perm=64, bands=10)
+
+
+def test_add_memory_reconsolidates_near_duplicates():
+    engine = DecayEngine(half_life=20.0, consolidation_threshold=0.8)
+    first = EntropicMemory("scan ok item=A123 qty=1", initial_weight=0.8)
+    resident = engine.add_memory(first, current_tau=0.0)
+
+    duplicate = EntropicMemory("scan ok item=A123 qty=1", initial_weight=0.8)
+    again = engine.add_memory(duplicate, current_tau=5.0)
+    distinct = engine.add_memory(EntropicMemory("CRITICAL: freezer_03 out of range"), current_tau=6.0)
+
+    assert resident is first
+    assert again is first
+    assert first.access_count == 2
+    assert first.last_accessed_tau == 5.0
+    assert engine.get_memory(duplicate.id) is None
+    assert distinct.id in engine.vault
+    assert len(engine.vault) == 2
+    assert engine.consolidated_count == 1
+
+
+def test_consolidation_index_shrinks_on_prune():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, consolidation_threshold=0.8)
+    faint = EntropicMemory("scan ok item=B552 qty=2", initial_weight=0.25)
+    engine.add_memory(faint, current_tau=0.0)
+    engine.entropy_sweep(current_tau=10.0)
+
+    fresh = EntropicMemory("scan ok item=B552 qty=2", initial_weight=0.9)
+    assert engine.add_memory(fresh, current_tau=11.0) is fresh
+    assert len(engine._content_index) == 1
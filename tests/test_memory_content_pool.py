@@ -0,0 +1,89 @@
+import pytest
+
+from temporal_gradient.memory.content import ContentPool
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+
+
+def test_pool_interns_duplicates_and_refcounts():
+    pool = ContentPool()
+    first = pool.intern("door badge unknown")
+    second = pool.intern("door " + "badge unknown")
+
+    assert first == second
+    assert pool.refcount(first) == 2
+    assert len(pool) == 1
+    assert pool.resolve(first) == "door badge unknown"
+    assert pool.intern(b"door badge unknown") != first
+    assert not pool.release(first)
+    assert pool.release(first)
+    assert first not in pool
+    with pytest.raises(ValueError):
+        pool.resolve(first)
+    with pytest.raises(ValueError):
+        pool.intern(42)
+
+
+def test_blob_pool_reads_payloads_through_mmap(tmp_path):
+    with ContentPool(tmp_path / "payloads.bin") as pool:
+        handles = [pool.intern(f"payload {idx} é") for idx in range(50)]
+        binary = pool.intern(b"\x00\x01raw")
+        empty = pool.intern("")
+
+        assert [pool.resolve(handle) for handle in handles] == [f"payload {idx} é" for idx in range(50)]
+        assert pool.resolve(binary) == b"\x00\x01raw"
+        assert pool.resolve(empty) == ""
+        late = pool.intern("appended after mapping")
+        assert pool.resolve(late) == "appended after mapping"
+
+        pool.release(handles[0])
+        assert pool.garbage_bytes == handles[0].length
+    with pytest.raises(ValueError):
+        pool.resolve(handles[1])
+
+
+def test_engine_interns_content_and_detaches_forgotten_memories(tmp_path):
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, content_blob_path=tmp_path / "blob.bin")
+    weak = engine.add_memory(EntropicMemory("shared text", initial_weight=0.25), current_tau=0.0)
+    strong = engine.add_memory(EntropicMemory("shared text", initial_weight=1.0), current_tau=0.0)
+
+    assert weak.content_handle == strong.content_handle
+    assert engine.content_pool.refcount(strong.content_handle) == 2
+    assert strong.content == "shared text"
+
+    _survivors, forgotten = engine.entropy_sweep(current_tau=10.0)
+
+    assert forgotten == [weak]
+    assert weak.content_handle is None
+    assert weak.content == "shared text"
+    assert engine.content_pool.refcount(strong.content_handle) == 1
+    engine.content_pool.close()
+
+
+def test_content_assignment_releases_the_pooled_copy():
+    pool = ContentPool()
+    memory = EntropicMemory("old")
+    handle = memory.intern_content(pool)
+
+    memory.content = "new"
+
+    assert memory.content == "new"
+    assert memory.content_handle is None
+    assert handle not in pool
+
+
+@pytest.mark.parametrize("mode", ["count", "ids", "stream"])
+def test_non_full_sweeps_release_content_without_reading_it(tmp_path, mode, monkeypatch):
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, content_blob_path=tmp_path / "blob.bin")
+    weak = engine.add_memory(EntropicMemory("forgotten text", initial_weight=0.25), current_tau=0.0)
+    handle = weak.content_handle
+
+    def fail_resolve(_handle):
+        raise AssertionError("sweep read a pooled payload")
+
+    monkeypatch.setattr(engine.content_pool, "resolve", fail_resolve)
+    engine.entropy_sweep(current_tau=10.0, mode=mode)
+
+    assert weak.content_handle is None
+    assert weak.content is None
+    assert handle not in engine.content_pool
+    engine.content_pool.close()
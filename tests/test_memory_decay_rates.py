@@ -0,0 +1,111 @@
+import math
+import random
+
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory, decay_lambda_from_value
+
+
+def _mixed_engine(**kwargs):
+    engine = DecayEngine(decay_lambda=0.2, prune_threshold=0.2, **kwargs)
+    memories = []
+    for idx in range(30):
+        rate = None if idx % 3 == 0 else (0.05 if idx % 3 == 1 else 0.4)
+        memory = EntropicMemory(f"m{idx}", initial_weight=0.3 + 0.03 * idx, decay_lambda=rate)
+        memories.append(engine.add_memory(memory, current_tau=float(idx % 5)))
+    return engine, memories
+
+
+def test_per_record_rates_drive_strength_expiry_and_total():
+    engine, memories = _mixed_engine()
+    slow = memories[1]
+
+    assert engine.calculate_current_strength(slow, 10.0) == pytest.approx(slow.strength * math.exp(-0.05 * 9.0))
+    assert engine.store.expiry_tau(slow) == pytest.approx(1.0 + math.log(slow.strength / 0.2) / 0.05)
+    assert engine.store.has_mixed_rates
+    expected = math.fsum(engine.calculate_current_strength(memory, 8.0) for memory in engine.vault)
+    assert math.isclose(engine.total_strength(8.0), expected, rel_tol=1e-12)
+
+    columns = engine.vault.columns()
+    assert sorted(set(columns.decay_lambda)) == [0.05, 0.2, 0.4]
+
+
+def test_mixed_rate_sweep_matches_a_full_scan_without_per_record_callbacks():
+    engine, _memories = _mixed_engine()
+    calls = []
+    calculate = engine.store._calculate_strength
+
+    def counting(record, tau):
+        calls.append(record.id)
+        return calculate(record, tau)
+
+    engine.store._calculate_strength = counting
+    for tau in (3.0, 6.0, 12.0):
+        expected = {memory.id for memory in engine.vault if calculate(memory, tau) <= 0.2}
+        calls.clear()
+        forgotten = engine.entropy_sweep(current_tau=tau, mode="ids")
+
+        assert set(forgotten) == expected
+        assert set(calls) == expected
+        assert all(calculate(memory, tau) > 0.2 for memory in engine.vault)
+        assert engine.store.count_survivors_at(tau) == len(engine.vault)
+
+
+def test_touch_reindexes_with_the_record_rate():
+    engine, memories = _mixed_engine()
+    fast = memories[2]
+    engine.touch_memory(fast.id, current_tau=5.0)
+
+    assert engine.store.expiry_tau(fast) == pytest.approx(5.0 + math.log(fast.strength / 0.2) / 0.4)
+    assert engine.entropy_sweep(current_tau=5.0 + math.log(fast.strength / 0.2) / 0.4 - 1e-6, mode="ids").count(fast.id) == 0
+
+
+def test_uniform_rate_queries_reject_mixed_stores_and_invalid_rates():
+    engine, _memories = _mixed_engine()
+    with pytest.raises(ValueError):
+        engine.threshold_for_count(3, current_tau=1.0)
+    with pytest.raises(ValueError):
+        engine.forecast_survivors(5.0, prune_threshold=0.1)
+    with pytest.raises(ValueError):
+        engine.add_memory(EntropicMemory("bad", decay_lambda=0.0), current_tau=9.0)
+
+
+def test_decay_lambda_from_value_slows_high_value_memories():
+    assert decay_lambda_from_value(0.0, 0.2) == pytest.approx(0.2)
+    assert decay_lambda_from_value(1.0, 0.2, max_slowdown=4.0) == pytest.approx(0.05)
+    assert decay_lambda_from_value(0.5, 0.2, max_slowdown=3.0) == pytest.approx(0.1)
+    with pytest.raises(ValueError):
+        decay_lambda_from_value(0.5, 0.2, max_slowdown=0.5)
+
+
+
+def test_indexed_sweep_matches_a_full_scan_at_the_prune_boundary():
+    def fresh(half_life, strength, tau):
+        engine = DecayEngine(half_life=half_life, prune_threshold=0.2)
+        return engine, engine.add_memory(EntropicMemory("m", initial_weight=strength), current_tau=tau)
+
+    engine, _memory = fresh(7.0, 0.5, 0.0)
+    assert engine.entropy_sweep(current_tau=9.253496664211536, mode="count") == (0, 1)
+
+    rng = random.Random(42)
+    for _ in range(200):
+        params = (rng.uniform(1.0, 20.0), rng.uniform(0.21, 1.4), rng.uniform(0.0, 5.0))
+        engine, memory = fresh(*params)
+        tau = engine.store.expiry_tau(memory)
+        for _step in range(3):
+            tau = math.nextafter(tau, -math.inf)
+        for _step in range(6):
+            engine, memory = fresh(*params)
+            expected = 0 if engine.calculate_current_strength(memory, tau) <= 0.2 else 1
+            assert engine.entropy_sweep(current_tau=tau, mode="count")[0] == expected
+            tau = math.nextafter(tau, math.inf)
+
+
+def test_full_sweeps_prune_directly_mutated_records():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2)
+    memory = engine.add_memory(EntropicMemory("m", initial_weight=1.0), current_tau=0.0)
+    memory.strength = 0.1
+
+    assert engine.entropy_sweep(current_tau=1.0, mode="count") == (1, 0)
+    survivors, forgotten = engine.entropy_sweep(current_tau=1.0)
+    assert (survivors, forgotten) == ([], [memory])
@@ -0,0 +1,58 @@
+import copy
+import random
+
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+
+
+def _engine():
+    engine = DecayEngine(decay_lambda=0.05, prune_threshold=0.2)
+    for idx in range(40):
+        memory = EntropicMemory(f"m{idx}", initial_weight=0.3 + (idx % 10) * 0.1)
+        engine.add_memory(memory, current_tau=float(idx))
+    return engine
+
+
+@pytest.mark.parametrize("future_tau", [40.0, 55.0, 80.0, 120.0])
+def test_forecast_matches_sweep_on_a_clone(future_tau):
+    engine = _engine()
+    clone = copy.deepcopy(engine)
+    survivor_count, _ = clone.entropy_sweep(future_tau, mode="count")
+
+    assert engine.forecast_survivors(future_tau) == survivor_count
+    assert len(engine.vault) == 40
+
+
+def test_forecast_under_hypothetical_threshold():
+    engine = _engine()
+    current_tau = 60.0
+    expected = sum(1 for memory in engine.vault if engine.calculate_current_strength(memory, current_tau) > 0.35)
+
+    assert engine.forecast_survivors(current_tau, prune_threshold=0.35) == expected
+
+
+def test_threshold_for_count_bounds_the_store():
+    engine = _engine()
+    threshold = engine.threshold_for_count(10, current_tau=45.0)
+
+    strengths = sorted(engine.calculate_current_strength(memory, 45.0) for memory in engine.vault)
+    assert sum(1 for value in strengths if value > threshold * (1 + 1e-9)) <= 10
+    assert sum(1 for value in strengths if value >= threshold * (1 - 1e-9)) >= 11
+    assert engine.threshold_for_count(100, current_tau=45.0) == 0.0
+
+
+def test_threshold_for_count_is_exact_at_the_boundary():
+    rng = random.Random(31)
+    for _ in range(300):
+        engine = DecayEngine(half_life=rng.uniform(1.0, 20.0), prune_threshold=0.1)
+        for idx in range(30):
+            engine.add_memory(EntropicMemory(f"m{idx}", initial_weight=rng.uniform(0.2, 1.4)), current_tau=rng.uniform(0.0, 10.0))
+        current_tau = rng.uniform(10.0, 15.0)
+        max_records = rng.randrange(len(engine.vault))
+
+        threshold = engine.threshold_for_count(max_records, current_tau=current_tau)
+
+        assert engine.store.count_survivors_at(current_tau, prune_threshold=threshold) <= max_records
+        survivors = sum(1 for memory in engine.vault if engine.calculate_current_strength(memory, current_tau) > threshold)
+        assert survivors <= max_records
@@ -0,0 +1,51 @@
+import math
+import random
+
+from temporal_gradient.memory.index import SortedKeyIndex
+
+
+def test_sorted_key_index_matches_sorted_reference_under_churn():
+    rng = random.Random(7)
+    index = SortedKeyIndex()
+    reference = []
+    for step in range(5000):
+        if reference and rng.random() < 0.4:
+            entry = reference.pop(rng.randrange(len(reference)))
+            assert index.discard(*entry)
+        else:
+            entry = (rng.uniform(-100.0, 100.0), f"id{step}")
+            reference.append(entry)
+            index.add(*entry)
+
+    reference.sort()
+    assert list(index) == reference
+    assert len(index) == len(reference)
+    assert index.first() == reference[0]
+    assert index.last() == reference[-1]
+
+    for probe in (-50.0, 0.0, 12.5, 99.0):
+        assert index.count_below(probe) == sum(1 for key, _ in reference if key < probe)
+        assert index.count_above(probe) == sum(1 for key, _ in reference if key > probe)
+        window = [entry for entry in reference if probe - 10.0 <= entry[0] <= probe]
+        assert list(index.irange(probe - 10.0, probe)) == window
+
+
+def test_sorted_key_index_bounds_and_ties():
+    index = SortedKeyIndex([(1.0, "b"), (1.0, "a"), (2.0, "c"), (-math.inf, "z")])
+
+    assert index.first() == (-math.inf, "z")
+    assert index.count_below(1.0) == 1
+    assert index.count_below(1.0, inclusive=True) == 3
+    assert list(index.irange(1.0, 1.0)) == [(1.0, "a"), (1.0, "b")]
+    assert list(index.irange(1.0, 2.0, inclusive=(False, True))) == [(2.0, "c")]
+    assert not index.discard(1.0, "missing")
+
+
+def test_sorted_key_index_positional_access():
+    index = SortedKeyIndex()
+    for value in range(3000):
+        index.add(float(value), f"id{value}")
+
+    assert index.at(0) == (0.0, "id0")
+    assert index.at(1500) == (1500.0, "id1500")
+    assert index.at(-1) == (2999.0, "id2999")
@@ -0,0 +1,133 @@
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.journal import MemoryJournal, journal_state_at
+from temporal_gradient.memory.serialization import memory_from_dict, memory_to_dict
+
+
+def _run(engine):
+    ids = []
+    for idx in range(12):
+        memory = engine.add_memory(EntropicMemory(f"event {idx}", initial_weight=0.5, tags=["t"]), current_tau=float(idx))
+        ids.append(memory.id)
+        if idx % 4 == 3:
+            engine.touch_memory(ids[idx - 3], current_tau=float(idx))
+        engine.entropy_sweep(current_tau=float(idx), mode="count")
+    return ids
+
+
+def _state(memories):
+    return {memory.id: (memory.strength, memory.last_accessed_tau, memory.access_count) for memory in memories}
+
+
+@pytest.mark.parametrize("snapshot_every", [1, 3, 1000])
+def test_state_at_matches_live_store_at_every_tau(tmp_path, snapshot_every):
+    journal_dir = tmp_path / "journal"
+    engine = DecayEngine(half_life=5.0, prune_threshold=0.2, journal_path=journal_dir, journal_snapshot_every=snapshot_every)
+    reference = DecayEngine(half_life=5.0, prune_threshold=0.2)
+    expected = {}
+    for idx in range(12):
+        memory = EntropicMemory(f"event {idx}", initial_weight=0.5)
+        twin = EntropicMemory(memory.content, initial_weight=0.5)
+        twin.id = memory.id
+        engine.add_memory(memory, current_tau=float(idx))
+        reference.add_memory(twin, current_tau=float(idx))
+        if idx % 4 == 3:
+            first_id = list(reference.vault.ids)[0]
+            engine.touch_memory(first_id, current_tau=float(idx))
+            reference.touch_memory(first_id, current_tau=float(idx))
+        engine.entropy_sweep(current_tau=float(idx), mode="count")
+        reference.entropy_sweep(current_tau=float(idx), mode="count")
+        expected[float(idx)] = _state(reference.vault)
+
+    for tau, state in expected.items():
+        assert _state(engine.state_at(tau).values()) == state
+    assert engine.state_at(-1.0) == {}
+    engine.journal.close()
+
+
+def test_journal_can_be_read_offline_and_snapshots_bound_replay(tmp_path):
+    engine = DecayEngine(half_life=5.0, prune_threshold=0.2, journal_path=tmp_path, journal_snapshot_every=4)
+    _run(engine)
+    engine.journal.close()
+
+    assert engine.journal.snapshot_count == engine.journal.event_count // 4
+    state = journal_state_at(tmp_path, 11.0)
+    assert list(state) == list(engine.vault.ids)
+    assert all(memory.content.startswith("event") for memory in state.values())
+
+
+def test_journal_rejects_tau_regression_and_validates(tmp_path):
+    with MemoryJournal(tmp_path) as journal:
+        journal.record_add(EntropicMemory("a"), 2.0)
+        with pytest.raises(ValueError):
+            journal.record_add(EntropicMemory("b"), 1.0)
+        with pytest.raises(ValueError):
+            journal.snapshot(2.0)
+    with pytest.raises(ValueError):
+        MemoryJournal(tmp_path, snapshot_every=0)
+    with pytest.raises(ValueError):
+        DecayEngine().state_at(0.0)
+
+
+def test_memory_dict_round_trip_preserves_bytes_content():
+    memory = EntropicMemory(b"\x00raw", initial_weight=0.7, tags=["x"])
+    memory.last_accessed_tau = 3.0
+    restored = memory_from_dict(memory_to_dict(memory))
+
+    assert restored.id == memory.id
+    assert restored.content == b"\x00raw"
+    assert restored.tags == ["x"]
+    assert restored.last_accessed_tau == 3.0
+
+
+def test_reopening_a_journal_appends_to_its_history(tmp_path):
+    engine = DecayEngine(half_life=5.0, prune_threshold=0.2, journal_path=tmp_path, journal_snapshot_every=4)
+    _run(engine)
+    engine.journal.close()
+    before = _state(journal_state_at(tmp_path, 11.0).values())
+
+    # Different spacing after the restart: it must only change where snapshots fall, not the answers.
+    restarted = DecayEngine(half_life=5.0, prune_threshold=0.2, journal_path=tmp_path, journal_snapshot_every=3)
+    assert restarted.journal.event_count == engine.journal.event_count
+    assert restarted.journal.snapshot_count == engine.journal.snapshot_count
+    with pytest.raises(ValueError):
+        restarted.journal.record_add(EntropicMemory("late"), 10.0)
+    later = [
+        restarted.add_memory(EntropicMemory(f"after restart {idx}"), current_tau=12.0 + idx) for idx in range(5)
+    ]
+    restarted.journal.close()
+
+    assert before
+    assert restarted.journal.snapshot_count > engine.journal.snapshot_count
+    assert _state(journal_state_at(tmp_path, 11.0).values()) == before
+    # Memories the restarted engine does not hold are pruned at its first event, on both sides of its snapshots.
+    for tau in (12.0, 13.0, 16.0):
+        state = journal_state_at(tmp_path, tau)
+        assert list(state) == [memory.id for memory in later if memory.last_accessed_tau <= tau]
+    assert journal_state_at(tmp_path, 12.0)[later[0].id].content == "after restart 0"
+
+    with MemoryJournal(tmp_path, overwrite=True) as journal:
+        assert journal.event_count == 0
+    assert journal_state_at(tmp_path, 12.0) == {}
+    assert not list(tmp_path.glob("snapshot-*.jsonl"))
+
+
+def test_snapshots_of_a_tiered_store_keep_cold_content(tmp_path):
+    engine = DecayEngine(
+        half_life=5.0,
+        prune_threshold=0.1,
+        cold_tier_path=tmp_path / "cold",
+        hot_strength_band=0.45,
+        journal_path=tmp_path / "journal",
+        journal_snapshot_every=3,
+    )
+    for idx in range(9):
+        engine.add_memory(EntropicMemory(f"event {idx}", initial_weight=0.5), current_tau=float(idx))
+        engine.entropy_sweep(current_tau=float(idx), mode="count")
+    engine.journal.close()
+
+    assert engine.store.cold_ids
+    state = journal_state_at(tmp_path / "journal", 8.0)
+    assert state
+    assert all(memory.content is not None and memory.content.startswith("event") for memory in state.values())
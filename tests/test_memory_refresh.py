@@ -0,0 +1,65 @@
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+
+
+def _engine(**kwargs):
+    return DecayEngine(half_life=10.0, prune_threshold=0.2, **kwargs)
+
+
+def test_pinned_memory_survives_sweeps_that_prune_its_peers():
+    engine = _engine()
+    pinned = engine.add_memory(EntropicMemory("identity", initial_weight=0.5), current_tau=0.0)
+    peer = engine.add_memory(EntropicMemory("chatter", initial_weight=0.5), current_tau=0.0)
+    deadline = engine.pin_memory(pinned.id)
+
+    assert deadline == pytest.approx(engine.store.expiry_tau(pinned))
+    for tau in (5.0, 15.0, 40.0, 120.0):
+        engine.entropy_sweep(current_tau=tau, mode="count")
+
+    assert engine.get_memory(peer.id) is None
+    assert engine.get_memory(pinned.id) is pinned
+    assert engine.refresh_scheduler.refresh_count >= 1
+
+
+def test_refresh_runs_only_when_due_and_respects_external_touches():
+    engine = _engine()
+    memory = engine.add_memory(EntropicMemory("rule", initial_weight=1.0), current_tau=0.0)
+    scheduler = engine.refresh_scheduler
+    deadline = engine.pin_memory(memory.id)
+
+    assert scheduler.run_due(deadline - 1.0) == []
+    engine.touch_memory(memory.id, current_tau=deadline - 1.0)
+    assert scheduler.run_due(deadline) == []
+    assert scheduler.next_deadline() == pytest.approx(engine.store.expiry_tau(memory))
+
+    later = scheduler.next_deadline()
+    assert scheduler.run_due(later) == [memory.id]
+    assert memory.last_accessed_tau == later
+
+
+def test_lead_time_and_unpin():
+    engine = _engine(refresh_lead_tau=2.0)
+    memory = engine.add_memory(EntropicMemory("rule", initial_weight=1.0), current_tau=0.0)
+    deadline = engine.pin_memory(memory.id)
+
+    assert deadline == pytest.approx(engine.store.expiry_tau(memory) - 2.0)
+    assert engine.unpin_memory(memory.id)
+    assert not engine.unpin_memory(memory.id)
+    assert engine.refresh_scheduler.next_deadline() is None
+    engine.entropy_sweep(current_tau=100.0)
+    assert engine.get_memory(memory.id) is None
+
+
+def test_forgotten_pin_is_dropped_and_pinning_validates():
+    engine = _engine()
+    memory = engine.add_memory(EntropicMemory("rule", initial_weight=1.0), current_tau=0.0)
+    engine.pin_memory(memory.id)
+    engine.store._forget(memory.id)
+
+    assert engine.refresh_scheduler.run_due(1000.0) == []
+    assert memory.id not in engine.refresh_scheduler
+    with pytest.raises(ValueError):
+        engine.pin_memory("missing")
+    with pytest.raises(ValueError):
+        DecayEngine(half_life=10.0, decay_lambda=0.0).pin_memory(memory.id)
@@ -0,0 +1,72 @@
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.sketches import BloomFilter, CountMinSketch
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    for idx in range(1000):
+        bloom.add(f"event-{idx}")
+
+    assert all(f"event-{idx}" in bloom for idx in range(1000))
+    false_positives = sum(1 for idx in range(10000) if f"other-{idx}" in bloom)
+    assert false_positives / 10000 < 0.03
+    assert bloom.estimated_false_positive_rate() == pytest.approx(0.01, abs=0.005)
+    assert bloom.size_bytes < 1300
+
+
+def test_count_min_sketch_never_undercounts():
+    sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    for idx in range(200):
+        sketch.add(f"topic-{idx % 20}")
+
+    assert all(sketch.estimate(f"topic-{idx}") >= 10 for idx in range(20))
+    assert sketch.estimate("topic-3") <= 10 + 0.01 * sketch.total
+    assert sketch.total == 200
+
+
+def test_engine_records_encoded_and_forgotten_content():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, content_sketch_capacity=100)
+    engine.add_memory(EntropicMemory("door badge unknown", initial_weight=0.25), current_tau=0.0)
+
+    assert engine.was_encoded("door badge unknown")
+    assert not engine.was_forgotten("door badge unknown")
+
+    engine.entropy_sweep(current_tau=10.0)
+    engine.add_memory(EntropicMemory("door badge unknown", initial_weight=0.25), current_tau=11.0)
+    engine.entropy_sweep(current_tau=21.0)
+
+    assert engine.was_forgotten("door badge unknown")
+    assert engine.forgotten_count("door badge unknown") >= 2
+    assert not engine.was_encoded("never seen")
+
+
+def test_engine_sketch_queries_require_opt_in():
+    with pytest.raises(ValueError):
+        DecayEngine().was_encoded("x")
+
+
+def test_engine_sketch_budget_does_not_scale_count_min_with_capacity():
+    engine = DecayEngine(content_sketch_capacity=100_000)
+    sketch = engine.forgotten_counts
+
+    assert sketch.width * sketch.depth * 8 < 200_000
+    assert DecayEngine(content_sketch_capacity=100_000, content_sketch_epsilon=0.01).forgotten_counts.width < sketch.width
+
+
+def test_engine_records_forgotten_cold_tier_content(tmp_path):
+    engine = DecayEngine(
+        half_life=5.0,
+        prune_threshold=0.1,
+        cold_tier_path=tmp_path,
+        hot_strength_band=0.45,
+        content_sketch_capacity=100,
+    )
+    memory = engine.add_memory(EntropicMemory("cold then forgotten", initial_weight=0.5), current_tau=0.0)
+    engine.entropy_sweep(current_tau=1.0, mode="count")
+    assert engine.store.is_cold(memory.id)
+
+    assert engine.entropy_sweep(current_tau=50.0, mode="ids") == [memory.id]
+    assert engine.was_forgotten("cold then forgotten")
+    assert engine.forgotten_count("cold then forgotten") >= 1
@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+
+
+def _engine(count=4):
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, snapshot_shards=4)
+    memories = [EntropicMemory(f"m{idx}", initial_weight=1.0) for idx in range(count)]
+    for idx, memory in enumerate(memories):
+        engine.add_memory(memory, current_tau=float(idx))
+    return engine, memories
+
+
+def test_pinned_snapshot_is_isolated_from_later_writes():
+    engine, memories = _engine()
+    pinned = engine.pin_snapshot()
+    before = pinned.get(memories[0].id)
+
+    engine.touch_memory(memories[0].id, current_tau=5.0)
+    engine.add_memory(EntropicMemory("late"), current_tau=6.0)
+    engine.entropy_sweep(current_tau=40.0)
+
+    assert len(pinned) == 4
+    assert pinned.get(memories[0].id) == before
+    assert pinned.get(memories[0].id).last_accessed_tau == 0.0
+    assert pinned.strength_at(memories[1].id, 1.0) == pytest.approx(1.0)
+
+    latest = engine.pin_snapshot()
+    assert latest.version > pinned.version
+    assert len(latest) == len(engine.vault)
+    assert memories[1].id not in latest
+
+
+def test_pin_reuses_snapshot_until_store_changes():
+    engine, memories = _engine()
+    first = engine.pin_snapshot()
+
+    assert engine.pin_snapshot() is first
+    engine.touch_memory(memories[2].id, current_tau=3.0)
+    assert engine.pin_snapshot() is not first
+
+
+def test_snapshot_ranked_orders_by_decayed_strength():
+    engine, memories = _engine()
+    ranked = engine.pin_snapshot().ranked(current_tau=3.0, limit=2)
+
+    assert [entry.id for entry, _strength in ranked] == [memories[3].id, memories[2].id]
+
+
+def test_readers_see_consistent_snapshots_during_writes():
+    engine, _memories = _engine(count=0)
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        while not done.is_set():
+            snapshot = engine.pin_snapshot()
+            if len(list(snapshot)) != len(snapshot):
+                errors.append(snapshot.version)
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for idx in range(500):
+        engine.add_memory(EntropicMemory(f"w{idx}", initial_weight=0.5), current_tau=float(idx) / 10.0)
+        if idx % 50 == 0:
+            engine.entropy_sweep(current_tau=float(idx) / 10.0)
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(engine.pin_snapshot()) == len(engine.vault)
+
+
+def test_pin_snapshot_requires_opt_in():
+    with pytest.raises(ValueError):
+        DecayEngine().pin_snapshot()
@@ -103,3 +103,88 @@ def test_decay_engine_add_memory_rejects_collision_without_merge_override():
 
     with pytest.raises(ValueError):
         engine.add_memory(second, current_tau=1.0)
+
+
+def _store_with_keep_and_drop():
+    store = _store()
+    keep = EntropicMemory("keep", initial_weight=1.0)
+    drop = EntropicMemory("drop", initial_weight=0.1)
+    store.add(keep)
+    store.add(drop)
+    return store, keep, drop
+
+
+def test_sweep_count_mode_returns_counts_only():
+    store, keep, drop = _store_with_keep_and_drop()
+
+    assert store.sweep(current_tau=0.0, mode="count") == (1, 1)
+    assert store.active_ids == (keep.id,)
+    assert store.get(drop.id) is None
+
+
+def test_sweep_ids_mode_returns_forgotten_ids():
+    store, _keep, drop = _store_with_keep_and_drop()
+
+    assert store.sweep(current_tau=0.0, mode="ids") == [drop.id]
+
+
+def test_sweep_stream_mode_delivers_evictions_to_listeners():
+    store, keep, drop = _store_with_keep_and_drop()
+    evicted = []
+    store.add_eviction_listener(lambda record, tau: evicted.append((record.id, tau, store.get(record.id))))
+
+    assert store.sweep(current_tau=3.0, mode="stream") == 1
+    assert evicted == [(drop.id, 3.0, None)]
+    assert store.get(keep.id) is keep
+
+
+def test_sweep_rejects_unknown_mode():
+    store, _keep, _drop = _store_with_keep_and_drop()
+
+    with pytest.raises(ValueError):
+        store.sweep(current_tau=0.0, mode="survivors")
+
+
+def test_capacity_evicts_weakest_record_via_index():
+    from temporal_gradient.memory.decay import DecayEngine
+
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, capacity=2)
+    capacity_evicted = []
+    pruned = []
+    engine.store.add_capacity_listener(lambda record, tau: capacity_evicted.append((record.id, tau)))
+    engine.store.add_eviction_listener(lambda record, tau: pruned.append(record.id))
+
+    old_strong = EntropicMemory("old-strong", initial_weight=1.2)
+    weak = EntropicMemory("weak", initial_weight=0.6)
+    engine.add_memory(old_strong, current_tau=0.0)
+    engine.add_memory(weak, current_tau=5.0)
+
+    # At tau=20, old_strong has decayed to 0.3 while weak sits at ~0.21.
+    incoming = EntropicMemory("incoming", initial_weight=0.9)
+    engine.add_memory(incoming, current_tau=20.0)
+
+    assert capacity_evicted == [(weak.id, 20.0)]
+    assert pruned == []
+    assert engine.store.capacity_evictions == 1
+    assert set(engine.store.active_ids) == {old_strong.id, incoming.id}
+    assert engine.store.weakest() == old_strong.id
+
+
+def test_capacity_rejects_incoming_record_when_it_is_weakest():
+    from temporal_gradient.memory.decay import DecayEngine
+
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, capacity=1)
+    resident = EntropicMemory("resident", initial_weight=1.0)
+    engine.add_memory(resident, current_tau=0.0)
+
+    faint = EntropicMemory("faint", initial_weight=0.3)
+    engine.add_memory(faint, current_tau=0.0)
+
+    assert engine.store.active_ids == (resident.id,)
+    assert engine.get_memory(faint.id) is None
+    assert engine.store.capacity_evictions == 1
+
+
+def test_capacity_requires_decay_rate():
+    with pytest.raises(ValueError):
+        DecayMemoryStore(calculate_strength=lambda r, _tau: r.strength, prune_threshold=0.2, capacity=3)
@@ -0,0 +1,58 @@
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.views import StoreView
+
+
+def _engine():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2)
+    memories = [EntropicMemory(f"m{idx}", initial_weight=1.0) for idx in range(3)]
+    for idx, memory in enumerate(memories):
+        engine.add_memory(memory, current_tau=float(idx))
+    return engine, memories
+
+
+def test_vault_is_a_shared_read_only_view():
+    engine, memories = _engine()
+
+    assert isinstance(engine.vault, StoreView)
+    assert engine.vault is engine.store.records
+    assert len(engine.vault) == 3
+    assert [memory.id for memory in engine.vault] == [memory.id for memory in memories]
+    assert memories[0] in engine.vault
+    assert memories[0].id in engine.vault
+    assert EntropicMemory("stranger") not in engine.vault
+    assert list(engine.vault.ids) == [memory.id for memory in memories]
+
+
+def test_view_iteration_fails_fast_on_mutation():
+    engine, _memories = _engine()
+
+    with pytest.raises(RuntimeError):
+        for _memory in engine.vault:
+            engine.add_memory(EntropicMemory("late"), current_tau=5.0)
+
+    with pytest.raises(RuntimeError):
+        for _memory in engine.vault:
+            engine.entropy_sweep(current_tau=100.0)
+
+
+def test_view_iteration_allows_touch():
+    engine, memories = _engine()
+
+    for memory in engine.vault:
+        engine.touch_memory(memory.id, current_tau=10.0)
+
+    assert all(memory.last_accessed_tau == 10.0 for memory in memories)
+
+
+def test_columns_snapshot_is_columnar():
+    engine, memories = _engine()
+
+    columns = engine.vault.columns(current_tau=12.0)
+
+    assert columns.ids == tuple(memory.id for memory in memories)
+    assert list(columns.created_at_tau) == [0.0, 1.0, 2.0]
+    assert list(columns.last_accessed_tau) == [0.0, 1.0, 2.0]
+    assert columns.current_strength[2] == pytest.approx(engine.calculate_current_strength(memories[2], 12.0))
+    assert engine.vault.columns().current_strength is None
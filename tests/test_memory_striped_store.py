@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.striped import StripedMemoryStore
+
+
+def _engine(**kwargs):
+    return DecayEngine(half_life=10.0, prune_threshold=0.2, lock_stripes=8, **kwargs)
+
+
+def test_engine_uses_striped_store():
+    engine = _engine()
+    memory = engine.add_memory(EntropicMemory("alpha"), current_tau=0.0)
+
+    assert isinstance(engine.store, StripedMemoryStore)
+    assert engine.get_memory(memory.id) is memory
+    assert engine.touch_memory(memory.id, current_tau=1.0) > 1.0
+    assert engine.store.weakest() == memory.id
+
+
+def test_concurrent_ingestion_touch_and_sweep_keep_indexes_consistent():
+    engine = _engine(capacity=300)
+    errors = []
+
+    def ingest(worker):
+        try:
+            ids = []
+            for idx in range(200):
+                tau = idx / 10.0
+                memory = engine.add_memory(EntropicMemory(f"{worker}-{idx}", initial_weight=0.6), current_tau=tau)
+                ids.append(memory.id)
+                if idx % 3 == 0:
+                    engine.touch_memory(ids[idx // 2], current_tau=tau)
+        except Exception as error:  # pragma: no cover - surfaced by the assertion below
+            errors.append(error)
+
+    def sweep():
+        for idx in range(40):
+            engine.entropy_sweep(current_tau=idx / 2.0, mode="count")
+
+    threads = [threading.Thread(target=ingest, args=(worker,)) for worker in range(4)]
+    threads.append(threading.Thread(target=sweep))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store = engine.store
+    assert errors == []
+    assert len(store.records) <= 300
+    assert sum(len(partition._expiry_index) for partition in store._partitions) == len(store.records)
+    for partition in store._partitions:
+        assert set(partition._anchor_by_id) == set(partition.records.ids)
+        assert all(store._partition(record_id) is partition for record_id in partition.records.ids)
+    assert engine.total_strength(30.0) == pytest.approx(
+        sum(engine.calculate_current_strength(memory, 30.0) for memory in engine.vault)
+    )
+
+
+def test_eviction_listeners_run_after_sweep_releases_locks():
+    engine = _engine()
+    memory = engine.add_memory(EntropicMemory("weak", initial_weight=0.25), current_tau=0.0)
+    acquired = []
+
+    def listener(record, _tau):
+        # Another thread must be able to take every partition lock here.
+        worker = threading.Thread(target=lambda: acquired.append(engine.store.weakest()))
+        worker.start()
+        worker.join(timeout=1.0)
+
+    engine.store.add_eviction_listener(listener)
+    assert engine.entropy_sweep(current_tau=10.0, mode="ids") == [memory.id]
+    assert acquired == [None]
+
+
+def test_stripes_validation():
+    with pytest.raises(ValueError):
+        StripedMemoryStore(lambda record, tau: record.strength, 0.2, stripes=0)
+    with pytest.raises(ValueError):
+        DecayEngine(cold_tier_path="unused", hot_strength_band=0.5, lock_stripes=4)
+
+
+def test_inserts_into_different_partitions_do_not_share_a_lock():
+    store = StripedMemoryStore(lambda record, tau: record.strength, 0.2, stripes=4, decay_rate=0.1)
+    first = EntropicMemory("first")
+    second = next(EntropicMemory(f"m{idx}") for idx in range(100) if store._position(f"m{idx}") != store._position(first.id))
+    second.id = second.content
+    inserted = []
+
+    with store._stripe(first.id):
+        worker = threading.Thread(target=lambda: inserted.append(store.add(second)))
+        worker.start()
+        worker.join(timeout=1.0)
+
+    assert inserted == [None]
+    assert store.get(second.id) is second
+
+
+def test_partitioned_aggregates_match_a_plain_store():
+    from temporal_gradient.memory.store import DecayMemoryStore
+
+    plain_engine = DecayEngine(half_life=10.0, prune_threshold=0.2, capacity=40)
+    striped_engine = _engine(capacity=40)
+    for engine in (plain_engine, striped_engine):
+        for idx in range(60):
+            memory = EntropicMemory(f"m{idx}", initial_weight=0.3 + (idx % 9) * 0.1, tags=["even" if idx % 2 else "odd"])
+            memory.id = f"m{idx}"
+            engine.add_memory(memory, current_tau=float(idx % 13))
+    assert isinstance(plain_engine.store, DecayMemoryStore)
+
+    plain, striped = plain_engine.store, striped_engine.store
+    assert sorted(plain.records.ids) == sorted(striped.records.ids)
+    assert striped.capacity_evictions == plain.capacity_evictions == 20
+    assert striped.weakest() == plain.weakest()
+    assert striped.total_strength(20.0) == pytest.approx(plain.total_strength(20.0))
+    assert striped.count_survivors_at(25.0) == plain.count_survivors_at(25.0)
+    assert striped.threshold_for_count(10, 20.0) == pytest.approx(plain.threshold_for_count(10, 20.0))
+    assert [m.id for m in striped.accessed_between(2.0, 6.0)] == [m.id for m in plain.accessed_between(2.0, 6.0)]
+    assert striped.tag_counts() == plain.tag_counts()
+    assert len(striped.records.columns(20.0)) == len(striped.records)
+    assert sorted(striped.sweep(25.0, mode="ids")) == sorted(plain.sweep(25.0, mode="ids"))
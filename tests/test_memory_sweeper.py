@@ -0,0 +1,131 @@
+import queue
+import threading
+
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.sweeper import BackgroundSweeper
+
+
+class _FakeClock:
+    def __init__(self, tau=0.0):
+        self.tau = tau
+
+
+def _engine_with_memories():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2)
+    keep = EntropicMemory("keep", initial_weight=1.2)
+    drop = EntropicMemory("drop", initial_weight=0.25)
+    engine.add_memory(keep, current_tau=0.0)
+    engine.add_memory(drop, current_tau=0.0)
+    return engine, keep, drop
+
+
+def test_maybe_sweep_waits_for_tau_interval():
+    engine, keep, drop = _engine_with_memories()
+    clock = _FakeClock()
+    events = []
+    sweeper = BackgroundSweeper(engine, clock, sweep_interval_tau=20.0, on_evict=events.append)
+
+    clock.tau = 19.0
+    assert sweeper.maybe_sweep() is None
+    assert engine.get_memory(drop.id) is drop
+
+    clock.tau = 20.0
+    event = sweeper.maybe_sweep()
+    assert event is not None
+    assert [memory.id for memory in event.forgotten] == [drop.id]
+    assert event.survivor_count == 1
+    assert events == [event]
+    assert engine.get_memory(drop.id) is None
+    assert sweeper.last_sweep_tau == 20.0
+
+
+def test_background_thread_publishes_to_queue():
+    engine, _keep, drop = _engine_with_memories()
+    clock = _FakeClock()
+    evictions = queue.Queue()
+    sweeper = BackgroundSweeper(
+        engine,
+        clock,
+        sweep_interval_tau=5.0,
+        eviction_queue=evictions,
+        poll_interval=0.001,
+    )
+
+    with sweeper:
+        with sweeper.lock:
+            clock.tau = 15.0
+        event = evictions.get(timeout=2.0)
+
+    assert not sweeper.running
+    assert event.tau == 15.0
+    assert [memory.id for memory in event.forgotten] == [drop.id]
+
+
+def test_consumer_errors_are_reported_without_stopping_the_sweeper():
+    engine, _keep, drop = _engine_with_memories()
+    clock = _FakeClock()
+    evictions = queue.Queue()
+    errors = []
+
+    def _fail(_event):
+        raise RuntimeError("consumer failed")
+
+    sweeper = BackgroundSweeper(
+        engine,
+        clock,
+        sweep_interval_tau=1.0,
+        on_evict=_fail,
+        eviction_queue=evictions,
+        poll_interval=0.001,
+        on_error=errors.append,
+    )
+    with sweeper:
+        with sweeper.lock:
+            clock.tau = 5.0
+        first = evictions.get(timeout=2.0)
+        with sweeper.lock:
+            clock.tau = 10.0
+        second = evictions.get(timeout=2.0)
+        assert sweeper.running and not sweeper.failed
+
+    assert [memory.id for memory in first.forgotten] == [drop.id]
+    assert second.tau == 10.0
+    assert sweeper.consumer_errors == 2
+    assert str(sweeper.last_consumer_error) == "consumer failed"
+    assert [str(error) for error in errors] == ["consumer failed"] * 2
+
+
+def test_sweep_errors_are_reported_before_stop():
+    engine, _keep, _drop = _engine_with_memories()
+    clock = _FakeClock()
+    reported = threading.Event()
+    errors = []
+
+    def _on_error(error):
+        errors.append(error)
+        reported.set()
+
+    def _broken_sweep(*_args, **_kwargs):
+        raise ValueError("sweep failed")
+
+    engine.entropy_sweep = _broken_sweep
+    sweeper = BackgroundSweeper(engine, clock, sweep_interval_tau=1.0, poll_interval=0.001, on_error=_on_error)
+    sweeper.start()
+    clock.tau = 5.0
+    assert reported.wait(timeout=2.0)
+    sweeper._thread.join(timeout=2.0)
+
+    assert not sweeper.running
+    assert sweeper.failed
+    assert [str(error) for error in errors] == ["sweep failed"]
+    with pytest.raises(RuntimeError, match="background sweep failed"):
+        sweeper.stop()
+    assert not sweeper.failed
+
+
+def test_rejects_non_positive_interval():
+    engine, _keep, _drop = _engine_with_memories()
+    with pytest.raises(ValueError):
+        BackgroundSweeper(engine, _FakeClock(), sweep_interval_tau=0.0)
@@ -0,0 +1,46 @@
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+
+
+def _engine():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2)
+    alarm = EntropicMemory("freezer alarm", initial_weight=1.2, tags=["sensor", "critical"])
+    badge = EntropicMemory("badge unknown", initial_weight=0.25, tags=["security", "critical"])
+    scan = EntropicMemory("scan ok", initial_weight=0.8, tags=["sensor"])
+    for memory in (alarm, badge, scan):
+        engine.add_memory(memory, current_tau=0.0)
+    return engine, alarm, badge, scan
+
+
+def _ids(pairs):
+    return [record.id for record, _strength in pairs]
+
+
+def test_by_tag_filters_on_decayed_strength():
+    engine, alarm, _badge, scan = _engine()
+
+    assert _ids(engine.by_tag("sensor", current_tau=10.0)) == [alarm.id, scan.id]
+    pairs = engine.by_tag("sensor", current_tau=10.0, min_strength=0.5)
+    assert _ids(pairs) == [alarm.id]
+    assert pairs[0][1] == pytest.approx(0.6)
+    assert engine.by_tag("missing", current_tau=0.0) == []
+
+
+def test_by_tags_intersects_and_unions():
+    engine, alarm, badge, scan = _engine()
+
+    assert _ids(engine.by_tags(["critical", "sensor"], current_tau=0.0)) == [alarm.id]
+    assert _ids(engine.by_tags(["security", "sensor"], current_tau=0.0, match="any")) == [badge.id, alarm.id, scan.id]
+    assert engine.by_tags(["security", "missing"], current_tau=0.0) == []
+
+
+def test_tag_index_shrinks_when_sweeps_prune():
+    engine, alarm, badge, _scan = _engine()
+
+    engine.entropy_sweep(current_tau=5.0)
+
+    assert engine.get_memory(badge.id) is None
+    assert "security" not in engine.store.tag_counts()
+    assert engine.store.tag_counts()["critical"] == 1
+    assert _ids(engine.by_tag("critical", current_tau=5.0)) == [alarm.id]
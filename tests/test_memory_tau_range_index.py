@@ -0,0 +1,43 @@
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+
+
+def _ids(records):
+    return [record.id for record in records]
+
+
+def test_tau_range_queries_follow_add_and_touch():
+    engine = DecayEngine(half_life=50.0, prune_threshold=0.2)
+    memories = [EntropicMemory(f"m{idx}", initial_weight=1.0) for idx in range(5)]
+    for idx, memory in enumerate(memories):
+        engine.add_memory(memory, current_tau=float(idx * 10))
+
+    assert _ids(engine.memories_created_between(10.0, 30.0)) == _ids(memories[1:4])
+    assert _ids(engine.memories_accessed_between(35.0)) == [memories[4].id]
+
+    engine.touch_memory(memories[0].id, current_tau=45.0)
+
+    assert _ids(engine.memories_accessed_between(40.0, 50.0)) == [memories[4].id, memories[0].id]
+    assert _ids(engine.memories_accessed_between(None, 5.0)) == []
+    assert _ids(engine.memories_created_between(None, 5.0)) == [memories[0].id]
+
+
+def test_tau_range_indexes_follow_merge_upsert_and_sweep():
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2)
+    fragile = EntropicMemory("fragile", initial_weight=0.25)
+    durable = EntropicMemory("durable", initial_weight=1.2)
+    engine.add_memory(fragile, current_tau=0.0)
+    engine.add_memory(durable, current_tau=1.0)
+
+    replacement = EntropicMemory("durable v2", initial_weight=1.2)
+    replacement.id = durable.id
+    replacement.created_at_tau = 1.0
+    replacement.last_accessed_tau = 8.0
+    engine.store.add(replacement, on_collision="merge")
+
+    assert _ids(engine.memories_accessed_between(0.0, 5.0)) == [fragile.id]
+    assert engine.memories_accessed_between(8.0, 8.0) == [replacement]
+
+    engine.entropy_sweep(current_tau=10.0)
+
+    assert _ids(engine.memories_created_between()) == [durable.id]
+    assert _ids(engine.memories_accessed_between()) == [durable.id]
@@ -0,0 +1,100 @@
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.tiered import ColdMemoryRef
+
+
+def _engine(tmp_path):
+    return DecayEngine(half_life=10.0, prune_threshold=0.2, cold_tier_path=tmp_path, hot_strength_band=0.5)
+
+
+def test_sweep_demotes_weak_survivors_to_cold_tier(tmp_path):
+    engine = _engine(tmp_path)
+    strong = EntropicMemory("strong", initial_weight=1.4)
+    weak = EntropicMemory("weak", initial_weight=0.8)
+    engine.add_memory(strong, current_tau=0.0)
+    engine.add_memory(weak, current_tau=0.0)
+
+    # tau=10: strong=0.7 stays hot, weak=0.4 is between the prune threshold and the band.
+    survivor_count, forgotten_count = engine.entropy_sweep(current_tau=10.0, mode="count")
+
+    assert (survivor_count, forgotten_count) == (2, 0)
+    assert engine.store.cold_ids == (weak.id,)
+    assert (tmp_path / f"{weak.id}.pkl").exists()
+    assert isinstance(engine.store._records_by_id[weak.id], ColdMemoryRef)
+    assert engine.store._records_by_id[strong.id] is strong
+
+
+def test_get_and_touch_promote_cold_records(tmp_path):
+    engine = _engine(tmp_path)
+    weak = EntropicMemory("weak", initial_weight=0.8, tags=["sensor"])
+    engine.add_memory(weak, current_tau=0.0)
+    engine.entropy_sweep(current_tau=10.0)
+
+    recalled = engine.get_memory(weak.id)
+    assert recalled.content == "weak"
+    assert recalled.tags == ["sensor"]
+    assert not engine.store.is_cold(weak.id)
+    assert not (tmp_path / f"{weak.id}.pkl").exists()
+
+    engine.entropy_sweep(current_tau=10.0)
+    assert engine.store.is_cold(weak.id)
+    assert engine.touch_memory(weak.id, current_tau=11.0) is not None
+    assert not engine.store.is_cold(weak.id)
+
+
+def test_cold_records_are_pruned_without_loading_payloads(tmp_path, monkeypatch):
+    engine = _engine(tmp_path)
+    weak = EntropicMemory("weak", initial_weight=0.8)
+    engine.add_memory(weak, current_tau=0.0)
+    engine.entropy_sweep(current_tau=10.0)
+
+    def _no_load(*_args, **_kwargs):
+        raise AssertionError("cold payload must not be loaded during sweep")
+
+    monkeypatch.setattr("temporal_gradient.memory.tiered.pickle.load", _no_load)
+    survivors, forgotten = engine.entropy_sweep(current_tau=30.0)
+
+    assert survivors == []
+    assert [type(record) for record in forgotten] == [ColdMemoryRef]
+    assert forgotten[0].id == weak.id
+    assert not (tmp_path / f"{weak.id}.pkl").exists()
+    assert engine.store.cold_ids == ()
+
+
+def test_cold_tier_requires_band_above_prune_threshold(tmp_path):
+    with pytest.raises(ValueError):
+        DecayEngine(prune_threshold=0.2, cold_tier_path=tmp_path, hot_strength_band=0.2)
+    with pytest.raises(ValueError):
+        DecayEngine(prune_threshold=0.2, cold_tier_path=tmp_path)
+
+
+def test_count_sweeps_only_evaluate_records_due_for_demotion(tmp_path):
+    engine = _engine(tmp_path)
+    strong = [EntropicMemory(f"strong {idx}", initial_weight=1.4) for idx in range(200)]
+    weak = [EntropicMemory(f"weak {idx}", initial_weight=0.8) for idx in range(3)]
+    engine.store.bulk_load(strong[:100])
+    for memory in strong[100:] + weak:
+        engine.add_memory(memory, current_tau=0.0)
+
+    store = engine.store
+    evaluated = []
+    calculate_strength = store._calculate_strength
+
+    def _counting(record, tau):
+        evaluated.append(record.id)
+        return calculate_strength(record, tau)
+
+    store._calculate_strength = _counting
+    engine.entropy_sweep(current_tau=10.0, mode="count")
+
+    assert sorted(evaluated) == sorted(memory.id for memory in weak)
+    assert sorted(store.cold_ids) == sorted(memory.id for memory in weak)
+
+    # A promoted record is indexed again and demoted by the next count sweep.
+    evaluated.clear()
+    assert engine.get_memory(weak[0].id) is not None
+    engine.entropy_sweep(current_tau=10.0, mode="count")
+    assert evaluated == [weak[0].id]
+    assert store.is_cold(weak[0].id)
+    assert not store._demotion_by_id.keys() & set(store.cold_ids)
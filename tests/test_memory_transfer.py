@@ -0,0 +1,139 @@
+import gc
+import io
+import math
+
+import pytest
+
+from temporal_gradient.memory.decay import DecayEngine, EntropicMemory
+from temporal_gradient.memory.transfer import export_memories, iter_memories
+
+
+def _populated_engine(**kwargs):
+    engine = DecayEngine(half_life=10.0, prune_threshold=0.2, **kwargs)
+    for idx in range(40):
+        memory = EntropicMemory(
+            f"memory {idx} é" if idx % 7 else b"\x00raw",
+            initial_weight=0.4 + 0.02 * idx,
+            tags=["even"] if idx % 2 == 0 else [],
+            decay_lambda=0.03 if idx % 5 == 0 else None,
+        )
+        engine.add_memory(memory, current_tau=float(idx % 6))
+        if idx % 4 == 0:
+            engine.touch_memory(memory.id, current_tau=6.0)
+    return engine
+
+
+def _fields(memory):
+    return (
+        memory.id,
+        memory.content,
+        list(memory.tags),
+        memory.strength,
+        memory.created_at_tau,
+        memory.last_accessed_tau,
+        memory.access_count,
+        memory.decay_lambda,
+    )
+
+
+@pytest.mark.parametrize("format", ["jsonl", "binary"])
+def test_round_trip_preserves_memories_and_store_queries(tmp_path, format):
+    source = _populated_engine()
+    path = tmp_path / f"memories.{format}"
+    assert source.export_memories(path, format=format, chunk_size=7) == 40
+
+    target = DecayEngine(half_life=10.0, prune_threshold=0.2)
+    loaded = target.import_memories(path, current_tau=6.0)
+
+    assert [_fields(memory) for memory in loaded] == [_fields(memory) for memory in source.vault]
+    assert math.isclose(target.total_strength(9.0), source.total_strength(9.0), rel_tol=1e-12)
+    assert target.store.weakest() == source.store.weakest()
+    assert [memory.id for memory, _ in target.by_tag("even", 9.0)] == [memory.id for memory, _ in source.by_tag("even", 9.0)]
+    assert [memory.id for memory in target.memories_created_between(2.0, 3.0)] == [
+        memory.id for memory in source.memories_created_between(2.0, 3.0)
+    ]
+    assert target.entropy_sweep(40.0, mode="ids") == source.entropy_sweep(40.0, mode="ids")
+
+
+def test_binary_format_is_smaller_and_streams_from_file_objects():
+    engine = _populated_engine()
+    jsonl, binary = io.BytesIO(), io.BytesIO()
+    engine.export_memories(jsonl)
+    engine.export_memories(binary, format="binary")
+
+    assert len(binary.getvalue()) < len(jsonl.getvalue())
+    binary.seek(0)
+    assert [memory.id for memory in iter_memories(binary)] == list(engine.vault.ids)
+
+
+def test_bulk_load_rejects_collisions_atomically_and_enforces_capacity():
+    engine = _populated_engine()
+    existing = next(iter(engine.vault))
+    fresh = EntropicMemory("fresh")
+    with pytest.raises(ValueError):
+        engine.store.bulk_load([fresh, existing])
+    assert fresh.id not in engine.vault
+    assert len(engine.store._expiry_index) == 40
+
+    bounded = DecayEngine(half_life=10.0, prune_threshold=0.2, capacity=10)
+    evicted = []
+    bounded.store.add_capacity_listener(lambda record, _tau: evicted.append(record))
+    loaded = bounded.store.bulk_load(list(engine.vault))
+
+    assert len(loaded) == 40
+    assert len(bounded.vault) == 10
+    assert len(evicted) == 30
+    expiry = bounded.store.expiry_tau
+    assert min(expiry(memory) for memory in bounded.vault) >= max(expiry(memory) for memory in evicted)
+
+
+@pytest.mark.parametrize("store_options", [{}, {"lock_stripes": 4}])
+def test_import_over_capacity_journals_evictions_at_the_import_tau(tmp_path, store_options):
+    source = io.BytesIO()
+    _populated_engine().export_memories(source)
+    source.seek(0)
+    engine = DecayEngine(
+        half_life=10.0,
+        prune_threshold=0.2,
+        capacity=3,
+        journal_path=tmp_path / "journal",
+        **store_options,
+    )
+    evicted_at = []
+    engine.store.add_capacity_listener(lambda _record, tau: evicted_at.append(tau))
+    engine.add_memory(EntropicMemory("resident", initial_weight=0.3), current_tau=50.0)
+
+    loaded = engine.import_memories(source, current_tau=100.0)
+
+    assert len(loaded) == 40
+    assert evicted_at == [100.0] * 38
+    assert len(engine.vault) == 3
+    assert sorted(engine.state_at(100.0)) == sorted(engine.vault.ids)
+
+
+@pytest.mark.parametrize("format", ["jsonl", "binary"])
+def test_iter_memories_leaves_caller_streams_open(format):
+    engine = _populated_engine()
+    stream = io.BytesIO()
+    engine.export_memories(stream, format=format)
+    payload = stream.getvalue()
+    if format == "jsonl":
+        # Blank lines shorter than the format probe before the first record.
+        payload = b"\n\n" + payload
+    stream = io.BytesIO(payload)
+
+    memories = list(iter_memories(stream))
+    gc.collect()
+
+    assert [memory.id for memory in memories] == list(engine.vault.ids)
+    assert not stream.closed
+    assert stream.tell() == len(payload)
+
+
+def test_export_validates_arguments_and_truncated_input():
+    with pytest.raises(ValueError):
+        export_memories([], io.BytesIO(), format="xml")
+    buffer = io.BytesIO()
+    export_memories([EntropicMemory("x")], buffer, format="binary")
+    with pytest.raises(ValueError):
+        list(iter_memories(io.BytesIO(buffer.getvalue()[:-3])))
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from temporal_gradient.salience import MinHashNovelty, RollingJaccardNovelty, SaliencePipeline, KeywordImperativeValue
+
+
+def _texts(count=300, seed=3):
+    rng = random.Random(seed)
+    vocabulary = [f"w{idx}" for idx in range(200)]
+    base = [rng.sample(vocabulary, 20) for _ in range(10)]
+    texts = []
+    for _ in range(count):
+        tokens = list(rng.choice(base))
+        tokens[rng.randrange(len(tokens))] = rng.choice(vocabulary)
+        texts.append(" ".join(tokens))
+    return texts
+
+
+def test_minhash_novelty_tracks_exact_jaccard_maximum():
+    texts = _texts()
+    exact = RollingJaccardNovelty(window_size=50)
+    approximate = MinHashNovelty(window_size=50, num_perm=128, bands=32)
+
+    errors = []
+    for text in texts:
+        _, exact_diag, _ = exact.score(text)
+        novelty, diagnostics, _ = approximate.score(text)
+        assert set(exact_diag) <= set(diagnostics)
+        assert diagnostics["H_history"] == exact_diag["H_history"]
+        assert diagnostics["H_tokens"] == exact_diag["H_tokens"]
+        assert novelty == pytest.approx(1.0 - diagnostics["H_jaccard_max"])
+        errors.append(abs(diagnostics["H_jaccard_max"] - exact_diag["H_jaccard_max"]))
+
+    assert sum(errors) / len(errors) < 0.05
+
+
+def test_minhash_novelty_window_is_bounded_and_replay_is_deterministic():
+    texts = _texts(120)
+    scorer = MinHashNovelty(window_size=25, num_perm=32, bands=8)
+    pipeline = SaliencePipeline(scorer, KeywordImperativeValue())
+
+    first = [pipeline.evaluate(text).telemetry_dict() for text in texts]
+    assert len(scorer._window) == 25
+    assert len(scorer._index) <= 25
+
+    pipeline.reset()
+    assert [pipeline.evaluate(text).telemetry_dict() for text in texts] == first
+
+
+def test_minhash_novelty_handles_empty_text_and_rejects_bad_config():
+    scorer = MinHashNovelty(window_size=3)
+    novelty, diagnostics, _ = scorer.score("...")
+    assert novelty == 0.0
+    assert diagnostics["H_tokens"] == 0.0
+    assert diagnostics["H_history"] == 1.0
+
+    with pytest.raises(ValueError):
+        MinHashNovelty(window_size=0)
+    with pytest.raises(ValueError):
+        MinHashNovelty(num_perm=64, bands=10)
+
+
+def test_repetitive_streams_compare_once_per_distinct_signature(monkeypatch):
+    from temporal_gradient.memory import minhash
+
+    templates = ["heartbeat ok service alpha", "heartbeat ok service beta", "disk usage nominal on node"]
+    scorer = MinHashNovelty(window_size=2000, num_perm=32, bands=8)
+    for idx in range(2000):
+        scorer.score(templates[idx % 3])
+
+    comparisons = []
+    similarity = minhash.MinHasher.similarity
+    monkeypatch.setattr(
+        minhash.MinHasher,
+        "similarity",
+        staticmethod(lambda left, right: comparisons.append(1) or similarity(left, right)),
+    )
+    novelty, diagnostics, _ = scorer.score(templates[0])
+
+    assert novelty == 0.0
+    assert diagnostics["H_jaccard_max"] == 1.0
+    assert len(comparisons) <= len(templates)
+    assert len(scorer._index) == 2000
+    assert len(scorer._index._keys_by_signature) == len(templates)
@@ -1,6 +1,15 @@
 import math
+import random
+import re
+import tracemalloc
 
-from temporal_gradient.salience.pipeline import KeywordImperativeValue, RollingJaccardNovelty, SaliencePipeline
+from temporal_gradient.salience.pipeline import (
+    KeywordImperativeValue,
+    PreparedText,
+    RollingJaccardNovelty,
+    SaliencePipeline,
+)
+from temporal_gradient.salience.keywords import KeywordMatcher
 
 
 def test_salience_pipeline_bounds_and_product():
@@ -24,3 +33,140 @@ def test_salience_pipeline_bounds_and_product():
     provenance_copy = first.provenance_dict()
     provenance_copy["mutated"] = "yes"
     assert "mutated" not in first.provenance
+
+
+def _reference_novelty(texts, window_size):
+    history = []
+    results = []
+    for text in texts:
+        tokens = set(re.findall(r"[a-z0-9']+", text.lower()))
+        max_similarity = 0.0
+        if tokens:
+            for past in history:
+                max_similarity = max(max_similarity, len(tokens & past) / len(tokens | past))
+        history = (history + [tokens])[-window_size:]
+        novelty = max(0.0, min(1.0, 1.0 - max_similarity)) if tokens else 0.0
+        results.append((novelty, max_similarity, len(history)))
+    return results
+
+
+def test_rolling_jaccard_inverted_index_matches_pairwise_scan():
+    rng = random.Random(7)
+    vocabulary = [f"w{idx}" for idx in range(30)]
+    texts = [" ".join(rng.sample(vocabulary, rng.randint(0, 8))) for _ in range(400)]
+
+    for window_size in (1, 3, 50):
+        novelty = RollingJaccardNovelty(window_size=window_size)
+        for text, (expected, expected_max, expected_history) in zip(texts, _reference_novelty(texts, window_size)):
+            score, diagnostics, _ = novelty.score(text)
+            assert score == expected
+            assert diagnostics["H_jaccard_max"] == expected_max
+            assert diagnostics["H_history"] == float(expected_history)
+        assert sum(len(postings) for postings in novelty._postings.values()) == sum(
+            len(tokens) for _, tokens in novelty._history
+        )
+
+
+def test_rolling_jaccard_compact_history_scores_identically_with_bounded_vocabulary():
+    rng = random.Random(11)
+    vocabulary = [f"token{idx}" for idx in range(500)]
+    texts = [" ".join(rng.sample(vocabulary, rng.randint(0, 40))) for _ in range(300)]
+    plain = RollingJaccardNovelty(window_size=20)
+    compact = RollingJaccardNovelty(window_size=20, compact_history=True)
+    # Start near the 32-bit sequence wrap stored in the compact slot arrays.
+    plain._sequence = compact._sequence = 2**32 - 150
+
+    for text in texts:
+        assert compact.score(text) == plain.score(text)
+
+    window_tokens = set().union(*(tokens for _, tokens in plain._history))
+    assert len(compact._vocabulary) == len(window_tokens)
+    assert len(compact._slot_ids) == sum(len(tokens) for _, tokens in plain._history)
+
+    compact.reset()
+    assert not compact._vocabulary and not len(compact._slot_ids) and not len(compact._entry_sizes)
+
+
+def test_rolling_jaccard_compact_history_shrinks_window_memory():
+    rng = random.Random(3)
+    vocabulary = [f"token{idx}" for idx in range(500)]
+    texts = [" ".join(rng.sample(vocabulary, 30)) for _ in range(2500)]
+
+    def window_bytes(novelty):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            # Fill the window without scoring; tracing makes the similarity pass slow.
+            for text in texts:
+                novelty._remember(PreparedText.from_text(text).token_set)
+            return tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+    plain_bytes = window_bytes(RollingJaccardNovelty(window_size=2000))
+    compact_bytes = window_bytes(RollingJaccardNovelty(window_size=2000, compact_history=True))
+    assert compact_bytes * 8 < plain_bytes
+
+
+def test_keyword_matcher_counts_match_per_keyword_regex_search():
+    rng = random.Random(5)
+    alphabet = "ab_ '-1.é"
+    keywords = ["", "a", "ab", "b a", "'", "_b", "-", "ab-", "é", "A", "a", "ba ab", "é1"] + [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(200)
+    ]
+    matcher = KeywordMatcher(keywords)
+    patterns = [re.compile(rf"\b{re.escape(keyword)}\b") for keyword in keywords]
+
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert matcher.count(text) == sum(1 for pattern in patterns if pattern.search(text))
+
+
+def test_keyword_value_hits_are_unchanged_for_phrases_and_case():
+    value = KeywordImperativeValue(keywords=["Must", "must", "stop now", "don't", "critical"])
+    _, diagnostics, provenance = value.score("You MUST stop now; don't-panic, it's not critical_path.")
+    assert diagnostics["V_keyword_hits"] == 4.0
+    assert provenance["keyword_hits"] == "4"
+
+
+def test_pipeline_shares_prepared_text_and_falls_back_to_plain_score():
+    class PlainValue:
+        def __init__(self):
+            self.seen = []
+
+        def score(self, text):
+            self.seen.append(text)
+            return 0.5, {"V_plain": 1.0}, {}
+
+    class PreparedNovelty:
+        def __init__(self):
+            self.seen = []
+
+        def score(self, text):
+            raise AssertionError("pipeline should call score_prepared")
+
+        def score_prepared(self, prepared):
+            self.seen.append(prepared)
+            return 1.0, {}, {}
+
+    novelty, value = PreparedNovelty(), PlainValue()
+    components = SaliencePipeline(novelty, value).evaluate("Don't STOP, don't")
+
+    assert components.psi == 0.5
+    assert value.seen == ["Don't STOP, don't"]
+    prepared = novelty.seen[0]
+    assert prepared.lowered == "don't stop, don't"
+    assert prepared.tokens == ("don't", "stop", "don't")
+    assert prepared.token_set == frozenset({"don't", "stop"})
+
+
+def test_prepared_scorers_match_plain_score_calls():
+    texts = ["Stop now", "", "stop NOW always", "urgent: never stop"]
+    pipeline = SaliencePipeline(RollingJaccardNovelty(window_size=2), KeywordImperativeValue())
+    novelty, value = RollingJaccardNovelty(window_size=2), KeywordImperativeValue()
+
+    for text in texts:
+        components = pipeline.evaluate(text)
+        expected_novelty, _, _ = novelty.score(text)
+        expected_value, _, _ = value.score(text)
+        assert (components.novelty, components.value) == (expected_novelty, expected_value)